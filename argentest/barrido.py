@@ -0,0 +1,195 @@
+"""
+Barrido de parámetros de las reglas del juego.
+
+Simula partidas (ver modules/simulador.py) para cada combinación de una grilla de valores de las reglas
+y escribe un CSV con la distribución de puntajes de cada combinación (celda). Las celdas se reparten
+entre procesos (uno por núcleo, ProcessPoolExecutor) y el resultado de cada una se guarda en una caché
+direccionada por contenido: al repetir un barrido solo se simulan las celdas que cambiaron.
+La columna 'truncadas' cuenta las partidas de cada celda que se cortaron por llegar a
+simulador.MAX_PREGUNTAS (reglas con las que una partida puede no terminar).
+
+Ejemplo:
+    python barrido.py --tiempo 120,180,240 --acierto 100 --fallo 0,25,50 --vidas 2,3 --racha 3,5 --precision 0.6,0.8 --salida barrido.csv
+
+Requiere NumPy (pip install numpy).
+"""
+
+import os       # Para la cantidad de núcleos y los archivos de la caché.
+import sys      # Para los mensajes de progreso (stderr) y la salida del CSV (stdout).
+import csv      # Formato de la salida.
+import json     # Formato de los resultados guardados en la caché.
+import hashlib  # Para la clave de cada celda en la caché.
+import argparse # Para leer las opciones de la línea de comandos.
+import itertools # Para recorrer todas las combinaciones de la grilla.
+from concurrent.futures import ProcessPoolExecutor, as_completed # Para simular en todos los núcleos.
+
+from modules.constantes import *
+from modules import simulador
+
+# Parámetros de la grilla: (opción de la línea de comandos, parámetro de simular_partidas, tipo, valor por defecto).
+PARAMETROS_GRILLA = [
+    ("tiempo", "tiempo", int, TIEMPO_PARTIDA),             # datos_juego["tiempo"]
+    ("acierto", "acierto", int, PUNTUACION_ACIERTO),       # datos_juego["acierto"]
+    ("fallo", "fallo", int, PUNTUACION_ERROR),             # datos_juego["fallo"]
+    ("vidas", "vidas", int, CANTIDAD_VIDAS),
+    ("racha", "racha_vida_extra", int, RACHA_VIDA_EXTRA),
+    ("precision", "precision", float, 0.7),
+]
+
+# Versión del simulador y de las reglas que no están en la grilla (MAX_VIDAS, BONUS_TIEMPO_RACHA...):
+# si simulador.py o constantes.py cambian, los resultados guardados dejan de valer.
+_hash_version = hashlib.sha256()
+for _ruta in (simulador.__file__, os.path.join(os.path.dirname(simulador.__file__), "constantes.py")):
+    with open(_ruta, "rb") as _archivo:
+        _hash_version.update(_archivo.read())
+VERSION_SIMULADOR = _hash_version.hexdigest()
+
+
+def clave_celda(celda: dict) -> str:
+    """
+    Calcula la clave de una celda en la caché: un hash de todos sus parámetros y de la versión del simulador.
+
+    Args:
+        celda (dict): Parámetros de simular_partidas de la celda (incluye 'cantidad' y 'semilla').
+
+    Returns:
+        str: La clave (hexadecimal).
+    """
+    contenido = json.dumps({"celda": celda, "simulador": VERSION_SIMULADOR}, sort_keys=True)
+    return hashlib.sha256(contenido.encode("utf-8")).hexdigest()
+
+
+def ruta_en_cache(directorio: str, clave: str) -> str:
+    """
+    Devuelve la ruta del resultado de una celda en la caché (repartido en subdirectorios por los dos primeros caracteres).
+    """
+    return os.path.join(directorio, clave[:2], clave + ".json")
+
+
+def leer_de_cache(directorio: str, clave: str) -> dict | None:
+    """
+    Lee el resultado de una celda de la caché.
+
+    Returns:
+        dict | None: El resumen de puntajes guardado, o None si no está (o está dañado).
+    """
+    try:
+        with open(ruta_en_cache(directorio, clave), "r", encoding="utf-8") as archivo:
+            return json.load(archivo)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def guardar_en_cache(directorio: str, clave: str, resumen: dict) -> None:
+    """
+    Guarda el resultado de una celda en la caché. Se escribe en un archivo temporal y se reemplaza con os.replace,
+    así que un barrido cortado nunca deja un resultado a medio escribir.
+    """
+    ruta = ruta_en_cache(directorio, clave)
+    os.makedirs(os.path.dirname(ruta), exist_ok=True)
+    ruta_temporal = f"{ruta}.{os.getpid()}.tmp"
+    with open(ruta_temporal, "w", encoding="utf-8") as archivo:
+        json.dump(resumen, archivo)
+    os.replace(ruta_temporal, ruta)
+
+
+def simular_celda(celda: dict, clave: str) -> dict:
+    """
+    Simula las partidas de una celda y resume sus puntajes. Se ejecuta en los procesos del barrido.
+
+    La semilla de cada celda sale de la semilla del barrido y de la clave de la celda, así que el resultado
+    de una celda no depende de qué otras celdas tenga la grilla.
+
+    Returns:
+        dict: El resumen de puntajes, con la cantidad de partidas truncadas (ver resumir_puntajes).
+    """
+    parametros = dict(celda)
+    parametros["semilla"] = [celda["semilla"], int(clave[:16], 16)]
+    puntajes, truncadas = simulador.simular_partidas(**parametros, devolver_truncadas=True)
+    return simulador.resumir_puntajes(puntajes, truncadas)
+
+
+def leer_lista(texto: str, tipo) -> list:
+    """
+    Convierte una lista separada por comas ("120,180,240") en una lista de valores.
+    """
+    return [tipo(valor) for valor in texto.split(",") if valor.strip() != ""]
+
+
+def armar_celdas(argumentos: argparse.Namespace) -> list:
+    """
+    Arma todas las combinaciones de la grilla.
+
+    Returns:
+        list: Lista de diccionarios con los parámetros de simular_partidas de cada celda.
+    """
+    nombres = [parametro for _, parametro, _, _ in PARAMETROS_GRILLA]
+    valores = [getattr(argumentos, opcion) for opcion, _, _, _ in PARAMETROS_GRILLA]
+    celdas = []
+    for combinacion in itertools.product(*valores):
+        celda = dict(zip(nombres, combinacion))
+        celda["cantidad"] = argumentos.partidas
+        celda["semilla"] = argumentos.semilla
+        celdas.append(celda)
+    return celdas
+
+
+def main() -> None:
+    analizador = argparse.ArgumentParser(description="Barrido de parámetros de las reglas de Argentest")
+    for opcion, _, tipo, por_defecto in PARAMETROS_GRILLA:
+        analizador.add_argument(f"--{opcion}", type=lambda texto, tipo=tipo: leer_lista(texto, tipo), default=[por_defecto],
+                                help=f"valores separados por comas (por defecto {por_defecto})")
+    analizador.add_argument("--partidas", type=int, default=100000, help="partidas simuladas por celda")
+    analizador.add_argument("--semilla", type=int, default=0, help="semilla del barrido")
+    analizador.add_argument("--procesos", type=int, default=os.cpu_count(), help="procesos en paralelo (por defecto, uno por núcleo)")
+    analizador.add_argument("--cache", default=DIRECTORIO_CACHE_BARRIDO, help="directorio de la caché de resultados")
+    analizador.add_argument("--salida", default=None, help="archivo CSV de salida (por defecto, la salida estándar)")
+    argumentos = analizador.parse_args()
+
+    celdas = armar_celdas(argumentos)
+    claves = [clave_celda(celda) for celda in celdas]
+    resultados = {}
+
+    # Primero se buscan en la caché; solo las celdas que faltan se simulan.
+    pendientes = []
+    for celda, clave in zip(celdas, claves):
+        resumen = leer_de_cache(argumentos.cache, clave)
+        if resumen is None:
+            pendientes.append((celda, clave))
+        else:
+            resultados[clave] = resumen
+    print(f"{len(celdas)} celdas: {len(celdas) - len(pendientes)} en caché, {len(pendientes)} a simular", file=sys.stderr)
+
+    if pendientes:
+        with ProcessPoolExecutor(max_workers=argumentos.procesos) as ejecutor:
+            futuros = {ejecutor.submit(simular_celda, celda, clave): clave for celda, clave in pendientes}
+            for terminadas, futuro in enumerate(as_completed(futuros), start=1):
+                clave = futuros[futuro]
+                resultados[clave] = futuro.result()
+                guardar_en_cache(argumentos.cache, clave, resultados[clave]) # Se guarda apenas termina: un corte no pierde lo hecho.
+                print(f"\r{terminadas}/{len(pendientes)} celdas simuladas", end="", file=sys.stderr)
+        print(file=sys.stderr)
+
+    celdas_truncadas = sum(1 for clave in claves if resultados[clave]["truncadas"])
+    if celdas_truncadas:
+        print(f"Aviso: en {celdas_truncadas} celdas hay partidas cortadas a las {simulador.MAX_PREGUNTAS} preguntas "
+              f"(columna 'truncadas')", file=sys.stderr)
+
+    # El CSV sigue el orden de la grilla, sin importar en qué orden terminaron las celdas.
+    archivo = open(argumentos.salida, "w", newline="", encoding="utf-8") if argumentos.salida else sys.stdout
+    try:
+        escritor = None
+        for celda, clave in zip(celdas, claves):
+            fila = {opcion: celda[parametro] for opcion, parametro, _, _ in PARAMETROS_GRILLA}
+            fila.update(resultados[clave])
+            if escritor is None:
+                escritor = csv.DictWriter(archivo, fieldnames=list(fila))
+                escritor.writeheader()
+            escritor.writerow(fila)
+    finally:
+        if archivo is not sys.stdout:
+            archivo.close()
+
+
+if __name__ == "__main__": # Necesario: los procesos del barrido vuelven a importar este archivo.
+    main()
@@ -0,0 +1,356 @@
+"""
+Benchmarks de las partes del juego que más se ejecutan.
+
+Mide, con los controladores "dummy" de SDL (sin ventana ni sonido):
+    - mostrar_texto con textos cortos y largos, ya en la caché y sin caché.
+    - parse_csv y el banco de preguntas compilado (compilar_banco, BancoPreguntas.desde_archivo y el acceso
+      a una pregunta al azar) con bancos de preguntas sintéticos de 1.000 a 1.000.000 filas.
+    - guardar_ranking y ordenar_rankings con 10 a 100.000 rankings.
+    - El dibujado de un fotograma completo de cada pantalla.
+
+Los resultados se guardan en JSON, junto con los datos del entorno (Python, Pygame, SDL, sistema, commit),
+y se pueden comparar con los de una ejecución anterior:
+    python benchmarks.py --salida base.json
+    python benchmarks.py --comparar base.json
+
+Cada medición se repite varias veces; cada muestra ejecuta la operación las veces necesarias para durar
+al menos MINIMO_POR_MUESTRA segundos, y se informa el tiempo por operación (la mediana es la que se compara).
+"""
+
+import os         # Para los archivos temporales y la cantidad de núcleos.
+import sys        # Para la versión de Python y el código de salida.
+import json       # Formato de los resultados.
+import time       # Reloj de alta resolución.
+import random     # Para generar datos sintéticos reproducibles.
+import shutil     # Para borrar los archivos temporales.
+import argparse   # Para leer las opciones de la línea de comandos.
+import itertools  # Para recorrer una y otra vez los índices de las preguntas pedidas al azar.
+import platform   # Datos del sistema para el entorno.
+import tempfile   # Directorio de los bancos de preguntas y rankings sintéticos.
+import statistics # Mediana y desvío de las muestras.
+import subprocess # Para anotar el commit en el que se midió.
+from datetime import datetime # Fecha de la medición.
+
+from modules.sin_ventana import preparar_entorno_sin_ventana, redirigir_rankings
+
+preparar_entorno_sin_ventana() # Controladores "dummy" de SDL: debe hacerse antes de pygame.init().
+
+import pygame
+
+pygame.init()
+pygame.mixer.init()
+
+from modules.constantes import *
+
+VERSION_FORMATO = 1 # Se incrementa si cambia el formato del JSON de resultados.
+MINIMO_POR_MUESTRA = 0.05 # Duración mínima (en segundos) de cada muestra.
+
+TAMAÑOS_CSV = (1000, 10000, 100000, 1000000)
+TAMAÑOS_RANKINGS = (10, 1000, 100000)
+TEXTO_CORTO = "PUNTUACION: 1200"
+TEXTO_LARGO = ("¿Cuál de los siguientes próceres argentinos participó del cruce de los Andes junto al "
+               "general San Martín y luego fue gobernador de la provincia de Cuyo durante varios años?")
+
+
+def medir(funcion, repeticiones: int, preparar=None) -> dict:
+    """
+    Mide cuánto tarda una operación.
+
+    Args:
+        funcion (function): La operación a medir, sin argumentos.
+        repeticiones (int): Cantidad de muestras.
+        preparar (function | None): Si se indica, se llama antes de cada ejecución de la operación,
+                                    fuera de la medición (por ejemplo, para partir siempre del mismo estado).
+
+    Returns:
+        dict: Bucles por muestra, repeticiones y tiempos por operación (mediana, mínimo, media y desvío, en segundos).
+    """
+    def muestra(bucles: int) -> float:
+        if preparar is None:
+            inicio = time.perf_counter()
+            for _ in range(bucles):
+                funcion()
+            return time.perf_counter() - inicio
+        total = 0.0
+        for _ in range(bucles):
+            preparar()
+            inicio = time.perf_counter()
+            funcion()
+            total += time.perf_counter() - inicio
+        return total
+
+    # Una ejecución sin medir antes de calibrar: la primera suele ser mucho más lenta (cachés vacías, imágenes y
+    # fuentes sin cargar), y si la calibración partiera de ella elegiría muy pocas ejecuciones por muestra.
+    if preparar is not None:
+        preparar()
+    funcion()
+
+    # Calibración: cuántas veces ejecutarla por muestra.
+    bucles = 1
+    while muestra(bucles) < MINIMO_POR_MUESTRA and bucles < 1000000:
+        bucles *= 10
+
+    muestras = [muestra(bucles) / bucles for _ in range(repeticiones)]
+
+    return {
+        "bucles": bucles,
+        "repeticiones": repeticiones,
+        "mediana_s": statistics.median(muestras),
+        "minimo_s": min(muestras),
+        "media_s": statistics.fmean(muestras),
+        "desvio_s": statistics.stdev(muestras) if len(muestras) > 1 else 0.0
+    }
+
+
+def obtener_entorno() -> dict:
+    """
+    Reúne los datos del entorno en que se mide, para poder interpretar y comparar resultados.
+    """
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, timeout=5).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = ""
+    return {
+        "python": sys.version.split()[0],
+        "implementacion": platform.python_implementation(),
+        "pygame": pygame.version.ver,
+        "sdl": ".".join(str(parte) for parte in pygame.get_sdl_version()),
+        "controlador_video": pygame.display.get_driver(),
+        "sistema": platform.platform(),
+        "procesador": platform.processor() or platform.machine(),
+        "nucleos": os.cpu_count(),
+        "commit": commit
+    }
+
+
+def escribir_csv_sintetico(ruta: str, filas: int) -> None:
+    """
+    Escribe un banco de preguntas sintético con el mismo formato que data/preguntas.csv.
+    """
+    aleatorio = random.Random(filas)
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        archivo.write("\ufeffPregunta,OpcionA,OpcionB,OpcionC,OpcionD,RespuestaCorrecta\n")
+        for i in range(filas):
+            archivo.write(f"¿Pregunta número {i} del banco sintético?,Opción A {i},Opción B {i},"
+                          f"Opción C {i},Opción D {i},{aleatorio.randint(1, 4)}\n")
+
+
+def borrar_registros_de_cambios(ruta: str) -> None:
+    """
+    Borra los registros de cambios (.jsonl) que están junto a la instantánea de rankings.
+    """
+    directorio = os.path.dirname(ruta)
+    for nombre in os.listdir(directorio):
+        if nombre.endswith(".jsonl"):
+            os.remove(os.path.join(directorio, nombre))
+
+
+def escribir_rankings_sinteticos(ruta: str, cantidad: int) -> None:
+    """
+    Escribe una instantánea de rankings sintética (ver registro_rankings.py) y borra sus registros de cambios.
+    """
+    borrar_registros_de_cambios(ruta)
+    aleatorio = random.Random(cantidad)
+    rankings = [{"nombre": f"jugador{i}", "puntaje": aleatorio.randrange(0, 10000, 25),
+                 "fecha": f"{aleatorio.randint(1, 28):02d}-{aleatorio.randint(1, 12):02d}-2025 12:00:00"}
+                for i in range(cantidad)]
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        json.dump({"generacion": 0, "rankings": rankings}, archivo)
+
+
+def benchmarks_texto(pantalla: pygame.Surface, repeticiones: int) -> dict:
+    """
+    Mide mostrar_texto con textos cortos y largos, con la caché de texto llena y vacía.
+    """
+    from modules.funciones import mostrar_texto, vaciar_cache_texto
+    fuente = pygame.font.SysFont("Arial Narrow", 30)
+    resultados = {}
+    for nombre, texto in (("corto", TEXTO_CORTO), ("largo", TEXTO_LARGO)):
+        resultados[f"mostrar_texto/{nombre}/en_cache"] = medir(
+            lambda: mostrar_texto(pantalla, texto, (10, 10), fuente, COLOR_BLANCO), repeticiones)
+
+        def sin_cache():
+            vaciar_cache_texto()
+            mostrar_texto(pantalla, texto, (10, 10), fuente, COLOR_BLANCO)
+        resultados[f"mostrar_texto/{nombre}/sin_cache"] = medir(sin_cache, repeticiones)
+    return resultados
+
+
+def benchmarks_csv(directorio: str, tamaños: tuple, repeticiones: int) -> dict:
+    """
+    Mide la carga de bancos de preguntas sintéticos de distintos tamaños: parse_csv y lo que usa el juego
+    (ver cargar_banco_preguntas): compilar_banco, BancoPreguntas.desde_archivo y el acceso a una pregunta al azar.
+    """
+    from modules.funciones import parse_csv
+    from modules.banco_preguntas import BancoPreguntas, compilar_banco
+    resultados = {}
+    for filas in tamaños:
+        ruta = os.path.join(directorio, f"preguntas_{filas}.csv")
+        ruta_binario = os.path.join(directorio, f"preguntas_{filas}.bin")
+        escribir_csv_sintetico(ruta, filas)
+        resultados[f"parse_csv/{filas}"] = medir(lambda: parse_csv([], ruta), repeticiones)
+        resultados[f"compilar_banco/{filas}"] = medir(lambda: compilar_banco(ruta, ruta_binario), repeticiones)
+        resultados[f"banco_desde_archivo/{filas}"] = medir(lambda: BancoPreguntas.desde_archivo(ruta_binario).cerrar(),
+                                                           repeticiones)
+
+        # Como en el juego, las preguntas se piden en orden aleatorio (ver siguiente_de_permutacion en funciones.py).
+        banco = BancoPreguntas.desde_archivo(ruta_binario)
+        aleatorio = random.Random(filas)
+        siguiente_indice = itertools.cycle([aleatorio.randrange(filas) for _ in range(1000)]).__next__
+        resultados[f"banco_pregunta_al_azar/{filas}"] = medir(lambda: banco[siguiente_indice()], repeticiones)
+        banco.cerrar()
+
+        os.remove(ruta)
+        os.remove(ruta_binario)
+    return resultados
+
+
+def benchmarks_rankings(ruta_rankings: str, ruta_sqlite: str, tamaños: tuple, repeticiones: int) -> dict:
+    """
+    Mide ordenar_rankings (sin consultas anteriores guardadas) y guardar_ranking (con la escritura en disco),
+    con distintas cantidades de rankings guardados, en las rutas de los rankings temporales (ver redirigir_rankings).
+    """
+    from modules import rankings
+    from modules.almacen_rankings import AlmacenRankings
+    from modules.registro_rankings import RegistroRankings
+    resultados = {}
+    for cantidad in tamaños:
+        escribir_rankings_sinteticos(ruta_rankings, cantidad)
+        almacen = rankings.crear_almacen_rankings(BACKEND_RANKINGS, ruta_rankings, ruta_sqlite)
+
+        # Cada vez se parte de un almacén recién cargado, como al abrir los rankings después de una partida.
+        registros = almacen.top(len(almacen))
+        def almacen_nuevo():
+            rankings.almacen_rankings = AlmacenRankings(registros)
+        resultados[f"ordenar_rankings/{cantidad}"] = medir(rankings.ordenar_rankings, repeticiones, almacen_nuevo)
+
+        # guardar_ranking también parte siempre del mismo estado: el almacén recién cargado y un registro de cambios
+        # vacío, así no se acumulan rankings entre ejecuciones ni se mide una compactación. Con el backend "sqlite"
+        # no hay registro de cambios y cada ranking queda en la base (insertar no depende de unas filas más o menos).
+        def almacen_y_registro_nuevos():
+            if not hasattr(almacen, "registro_disco"): # Backend "sqlite".
+                rankings.almacen_rankings = almacen
+                return
+            registro_anterior = getattr(rankings.almacen_rankings, "registro_disco", None)
+            if registro_anterior is not None:
+                registro_anterior.esperar_compactacion()
+            borrar_registros_de_cambios(ruta_rankings)
+            rankings.almacen_rankings = almacen.copiar()
+            rankings.almacen_rankings.registro_disco = RegistroRankings(ruta_rankings, COMPACTAR_RANKINGS_CADA)
+        resultados[f"guardar_ranking/{cantidad}"] = medir(lambda: rankings.guardar_ranking("benchmark", 500),
+                                                          repeticiones, almacen_y_registro_nuevos)
+
+        almacen_y_registro_nuevos() # Espera una compactación que haya quedado en curso.
+    return resultados
+
+
+def benchmarks_pantallas(pantalla: pygame.Surface, repeticiones: int) -> dict:
+    """
+    Mide el dibujado y la presentación de un fotograma completo de cada pantalla, sin eventos.
+    """
+    from modules.pantallas import REGISTRO_PANTALLAS, cargar_pantalla, mostrar_pantalla
+    from modules.regiones import solicitar_redibujado_completo, tomar_regiones
+    datos_juego = {"puntuacion": 0, "vidas": CANTIDAD_VIDAS, "nombre": "", "volumen_musica": 50,
+                   "tiempo": TIEMPO_PARTIDA, "acierto": PUNTUACION_ACIERTO, "fallo": PUNTUACION_ERROR}
+    resultados = {}
+    for nombre in REGISTRO_PANTALLAS:
+        cargar_pantalla(nombre) # La carga de la pantalla no se mide.
+        def fotograma():
+            solicitar_redibujado_completo()
+            mostrar_pantalla(nombre, pantalla, [], datos_juego)
+            tomar_regiones()
+            pygame.display.flip()
+        resultados[f"pantalla/{nombre}"] = medir(fotograma, repeticiones)
+    return resultados
+
+
+def comparar(resultados: dict, base: dict, umbral: float) -> bool:
+    """
+    Imprime la comparación de cada benchmark con el de la base (por la mediana).
+
+    Args:
+        resultados (dict): Resultados actuales (el JSON completo).
+        base (dict): Resultados de la base (el JSON completo).
+        umbral (float): Diferencia relativa a partir de la cual un benchmark se considera más lento o más rápido.
+
+    Returns:
+        bool: True si algún benchmark es más lento que en la base por más del umbral.
+    """
+    hay_regresiones = False
+    print(f"{'benchmark':<36}{'base':>12}{'actual':>12}{'relación':>10}")
+    for nombre, actual in resultados["resultados"].items():
+        anterior = base["resultados"].get(nombre)
+        if anterior is None:
+            print(f"{nombre:<36}{'-':>12}{actual['mediana_s'] * 1000:>10.4f}ms{'nuevo':>10}")
+            continue
+        relacion = actual["mediana_s"] / anterior["mediana_s"] if anterior["mediana_s"] > 0 else float("inf")
+        marca = ""
+        if relacion > 1 + umbral:
+            marca = "  MÁS LENTO"
+            hay_regresiones = True
+        elif relacion < 1 - umbral:
+            marca = "  más rápido"
+        print(f"{nombre:<36}{anterior['mediana_s'] * 1000:>10.4f}ms{actual['mediana_s'] * 1000:>10.4f}ms"
+              f"{relacion:>9.2f}x{marca}")
+    if base.get("entorno") != resultados["entorno"]:
+        print("Aviso: el entorno de la base es distinto (ver 'entorno' en los JSON).")
+    return hay_regresiones
+
+
+def main() -> None:
+    analizador = argparse.ArgumentParser(description="Benchmarks de Argentest")
+    analizador.add_argument("--salida", default=None, help="archivo JSON donde guardar los resultados")
+    analizador.add_argument("--comparar", default=None, help="archivo JSON de una ejecución anterior con el que comparar")
+    analizador.add_argument("--umbral", type=float, default=0.10, help="diferencia relativa tolerada al comparar (0.10 = 10%%)")
+    analizador.add_argument("--repeticiones", type=int, default=7, help="muestras por benchmark")
+    analizador.add_argument("--rapido", action="store_true", help="omite los tamaños más grandes (1.000.000 de preguntas, 100.000 rankings)")
+    analizador.add_argument("--solo", default=None, help="solo los grupos indicados, separados por comas: texto, csv, rankings, pantallas")
+    argumentos = analizador.parse_args()
+
+    grupos = {"texto", "csv", "rankings", "pantallas"}
+    if argumentos.solo:
+        grupos = set(argumentos.solo.split(","))
+    tamaños_csv = TAMAÑOS_CSV[:-1] if argumentos.rapido else TAMAÑOS_CSV
+    tamaños_rankings = TAMAÑOS_RANKINGS[:-1] if argumentos.rapido else TAMAÑOS_RANKINGS
+
+    random.seed(0) # Las pantallas usan random (orden de las preguntas).
+    # Los rankings reales no se modifican: se trabaja sobre una copia temporal.
+    directorio_rankings, ruta_rankings, ruta_sqlite = redirigir_rankings(RUTA_RANKINGS, RUTA_RANKINGS_SQLITE)
+    directorio_datos = tempfile.mkdtemp(prefix="argentest-benchmarks-")
+    pantalla = pygame.display.set_mode(VENTANA)
+    from modules import rankings
+    rankings.abrir_almacen_rankings(ruta_rankings, ruta_sqlite) # La pantalla de rankings usa la copia.
+
+    resultados = {"version": VERSION_FORMATO, "fecha": datetime.now().isoformat(timespec="seconds"),
+                  "entorno": obtener_entorno(), "resultados": {}}
+    try:
+        if "texto" in grupos:
+            resultados["resultados"].update(benchmarks_texto(pantalla, argumentos.repeticiones))
+        if "csv" in grupos:
+            resultados["resultados"].update(benchmarks_csv(directorio_datos, tamaños_csv, argumentos.repeticiones))
+        if "rankings" in grupos:
+            resultados["resultados"].update(benchmarks_rankings(ruta_rankings, ruta_sqlite, tamaños_rankings, argumentos.repeticiones))
+        if "pantallas" in grupos:
+            resultados["resultados"].update(benchmarks_pantallas(pantalla, argumentos.repeticiones))
+    finally:
+        shutil.rmtree(directorio_datos, ignore_errors=True)
+        shutil.rmtree(directorio_rankings, ignore_errors=True)
+
+    if argumentos.salida:
+        with open(argumentos.salida, "w", encoding="utf-8") as archivo:
+            json.dump(resultados, archivo, indent=2, ensure_ascii=False)
+
+    hay_regresiones = False
+    if argumentos.comparar:
+        with open(argumentos.comparar, "r", encoding="utf-8") as archivo:
+            hay_regresiones = comparar(resultados, json.load(archivo), argumentos.umbral)
+    else:
+        for nombre, resultado in resultados["resultados"].items():
+            print(f"{nombre:<36}{resultado['mediana_s'] * 1000:>10.4f} ms  (x{resultado['bucles']}, {resultado['repeticiones']} muestras)")
+
+    pygame.quit()
+    sys.exit(1 if hay_regresiones else 0)
+
+
+if __name__ == "__main__":
+    main()
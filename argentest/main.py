@@ -3,38 +3,115 @@ Módulo principal del juego.
 
 Este módulo se encarga de la inicialización de Pygame, la gestión del bucle principal
 del juego, el manejo de estados de la ventana (menú, juego, configuración, rankings, terminado) y la gestión general de la música y eventos.
+
+Con F3 se muestra u oculta una superposición con los tiempos de cada sección del fotograma
+(ver modules/perfilador.py); al salir, los tiempos se exportan a RUTA_PERFIL_CSV.
+
+Con --headless el juego corre sin ventana ni sonido, sin límite de FPS y con eventos simulados,
+y al terminar informa los fotogramas por segundo y los percentiles de duración de fotograma por pantalla:
+    python main.py --headless --fotogramas 5000 --semilla 1
+El tiempo del juego sigue a un reloj virtual que avanza 1000/FPS ms por fotograma (ver sin_ventana.RelojVirtual),
+y cada fotograma se dibuja completo; con --regiones-sucias se dibuja solo lo que cambia, como con ventana.
 """
 
 import pygame # Importa la librería Pygame para el desarrollo del juego
 import sys    # Importa sys para manejar la salida del programa (sys.exit)
+import time   # Para medir la duración de los fotogramas en el modo sin ventana.
+import shutil # Para borrar los rankings temporales del modo sin ventana.
+import argparse # Para leer las opciones de la línea de comandos.
+
+from modules.constantes import * # No necesita Pygame: se importa antes, para los valores por defecto de las opciones.
+
+# --- Opciones de la Línea de Comandos ---
+analizador = argparse.ArgumentParser(description="Argentest")
+analizador.add_argument("--headless", action="store_true",
+                        help="corre sin ventana ni sonido, sin límite de FPS y con eventos simulados, e informa el rendimiento")
+analizador.add_argument("--fotogramas", type=int, default=3000, help="cantidad de fotogramas a simular con --headless")
+analizador.add_argument("--semilla", type=int, default=None, help="semilla de los eventos aleatorios de --headless")
+analizador.add_argument("--guion", default=None, help="archivo JSON Lines con los eventos a simular en lugar de eventos aleatorios")
+analizador.add_argument("--regiones-sucias", action="store_true",
+                        help="con --headless, dibuja solo las regiones que cambian en lugar de la pantalla completa en cada fotograma")
+analizador.add_argument("--buffer-audio", type=int, default=TAMAÑO_BUFFER_AUDIO,
+                        help=f"muestras por bloque del mezclador de audio (por defecto {TAMAÑO_BUFFER_AUDIO})")
+analizador.add_argument("--medir-audio", action="store_true",
+                        help="mide la demora entre reproducir un sonido y que empiece a salir, y termina")
+argumentos = analizador.parse_args()
+
+if argumentos.headless:
+    from modules.sin_ventana import (preparar_entorno_sin_ventana, redirigir_rankings, RelojVirtual, EventosSimulados,
+                                     informe_fotogramas)
+    preparar_entorno_sin_ventana() # Controladores "dummy" de SDL: debe hacerse antes de pygame.init().
 
 # --- Inicialización Global de Pygame ---
 # Se inicializan todos los módulos de Pygame necesarios para el juego.
 
+# El mezclador se configura antes de pygame.init(), con un buffer chico para que los efectos suenen enseguida.
+pygame.mixer.pre_init(FRECUENCIA_AUDIO, -16, 2, argumentos.buffer_audio)
 pygame.init()
 pygame.mixer.init()
 
-from modules.constantes import *
-from modules.menu import *
-from modules.juego import *
-from modules.configuracion import *
-from modules.rankings import *
-from modules.terminado import *
-
+if argumentos.medir_audio:
+    from modules.sonidos import medir_latencia
+    latencia = medir_latencia(argumentos.buffer_audio)
+    print(f"Mezclador: {latencia['frecuencia']} Hz, buffer de {latencia['buffer']} muestras")
+    if latencia["mediana_ms"] is None:
+        print("Demora de play() hasta la salida: el mezclador no respondió (¿hay un dispositivo de audio?)")
+    else:
+        print(f"Demora de play() hasta la salida: mediana {latencia['mediana_ms']:.2f} ms, máximo {latencia['maximo_ms']:.2f} ms")
+    if latencia["perdidas"]:
+        print(f"Mediciones perdidas (sin respuesta del mezclador): {latencia['perdidas']} de {latencia['repeticiones']}")
+    pygame.quit()
+    sys.exit()
+
+# Dibujar solo las regiones que cambian: con --headless, solo si se pide (si no, la mayoría de los fotogramas
+# no dibujarían nada y se mediría un bucle vacío).
+regiones_sucias = MODO_REGIONES_SUCIAS and (not argumentos.headless or argumentos.regiones_sucias)
+
+if argumentos.headless:
+    # Las partidas simuladas guardan sus rankings en un directorio temporal, no en data/.
+    directorio_rankings_temporal, ruta_rankings_temporal, ruta_sqlite_temporal = redirigir_rankings(RUTA_RANKINGS,
+                                                                                                     RUTA_RANKINGS_SQLITE)
+    reloj_virtual = RelojVirtual(FPS)
+    eventos_simulados = EventosSimulados(argumentos.semilla, argumentos.guion)
+    tiempos_por_pantalla = {} # Duración de cada fotograma, por pantalla.
+    fotograma = 0
+    inicio_ejecucion = time.perf_counter()
 
 # --- Configuración de la Ventana Principal ---
+# La ventana se crea antes de importar las pantallas, para que sus imágenes puedan convertirse
+# al formato de píxeles de la ventana apenas se cargan.
 pygame.display.set_caption("Argentest") # Establece el título de la ventana del juego
 
 # Crea la superficie principal de la pantalla donde se dibujará todo el juego.
 # El tamaño de la ventana (VENTANA) se importa de 'constantes.py'.
 pantalla = pygame.display.set_mode(VENTANA) 
 
+from modules.recursos import cargar_imagen
+
 # Carga la imagen del icono para la ventana y la barra de tareas.
-icono = pygame.image.load("assets/images/icono.png") 
+icono = cargar_imagen("assets/images/icono.png") 
 pygame.display.set_icon(icono) # Establece el icono de la ventana.
 
+from modules.regiones import solicitar_redibujado_completo, tomar_regiones
+from modules.pantallas import cargar_pantalla, mostrar_pantalla, cambiar_pantalla
+from modules import perfilador
+from modules import planificador
+from modules import musica
+from modules import precarga
+
+if argumentos.headless:
+    planificador.usar_reloj(reloj_virtual.ticks) # Los segundos de la partida avanzan con los fotogramas simulados.
+    from modules import rankings
+    rankings.abrir_almacen_rankings(ruta_rankings_temporal, ruta_sqlite_temporal)
+
+# --- Carga de Pantallas ---
+# Solo el menú se prepara antes del primer fotograma; el resto de las pantallas (con sus imágenes,
+# fuentes y la lista de preguntas) se cargan la primera vez que se entra a ellas.
+cargar_pantalla("menu")
+
 # --- Variables de Estado del Juego ---
 corriendo = True # Controla el bucle principal del juego. Si es False, el juego termina.
+en_reposo = False # True si en el fotograma anterior no cambió nada en la ventana (ver MODO_REPOSO).
 reloj = pygame.time.Clock() # Objeto Clock para controlar la velocidad de fotogramas (FPS).
 
 # Diccionario que almacena todos los datos y el estado actual de la partida.
@@ -50,48 +127,29 @@ datos_juego = {
 }
 
 ventana_actual = "menu" # Controla qué pantalla se está mostrando actualmente (menu, juego, configuraciones, etc.).
-bandera_musica_juego = False # Bandera para controlar si la música del juego ya está sonando.
-bandera_musica_menu = False  # Bandera para controlar si la música del menú ya está sonando.
+ventana_anterior = None # Pantalla mostrada en el fotograma anterior, para detectar cambios de pantalla.
+# Las pistas de música se decodifican en segundo plano (en el modo sin ventana no, y se leen del archivo).
+musica.iniciar(decodificar=not argumentos.headless)
 
 # --- Función para manejar la reproducción de música según la ventana ---
 def manejar_musica_segun_ventana(current_window: str, game_data: dict):
     """
-    Gestiona la carga y reproducción de la música de fondo dependiendo de la ventana activa del juego.
-    Asegura que la música correcta se reproduzca con el volumen adecuado y evita que se recargue innecesariamente.
+    Gestiona la reproducción de la música de fondo dependiendo de la ventana activa del juego.
+    El cambio de pista y de volumen lo resuelve el módulo de música, que solo actúa si algo cambió.
 
     Args:
         current_window (str): El nombre de la ventana actual ('menu', 'juego', 'terminado', etc.).
         game_data (dict): Diccionario con los datos del juego, incluyendo el volumen de la música.
     """
-    global bandera_musica_juego, bandera_musica_menu # Acceder a las banderas globales
-
     # Calcular el volumen de Pygame (escala 0.0 a 1.0) usando la constante MAX_VOLUMEN_REAL
-    porcentaje_volumen_pygame = (game_data["volumen_musica"] / 100) * MAX_VOLUMEN_REAL
-
-    if current_window == "menu":
-        if not bandera_musica_menu:
-            pygame.mixer.music.load("assets/sounds/musica_menu.mp3")
-            pygame.mixer.music.play(-1) # Reproducir en bucle infinito
-            bandera_musica_menu = True
-        # Asegurarse de que la música del menú siempre tenga el volumen correcto
-        pygame.mixer.music.set_volume(porcentaje_volumen_pygame)
-        bandera_musica_juego = False # Desactivar bandera de música del juego
-
-    elif current_window == "juego":
-        if not bandera_musica_juego:
-            pygame.mixer.music.load("assets/sounds/musica_juego.mp3")
-            pygame.mixer.music.play(-1) # Reproducir en bucle infinito
-            bandera_musica_juego = True
-        # Asegurarse de que la música del juego siempre tenga el volumen correcto
-        pygame.mixer.music.set_volume(porcentaje_volumen_pygame)
-        bandera_musica_menu = False # Desactivar bandera de música del menú
+    musica.ajustar_volumen((game_data["volumen_musica"] / 100) * MAX_VOLUMEN_REAL)
+
+    if current_window == "menu" or current_window == "juego":
+        musica.reproducir(current_window) # Fundido cruzado desde la pista anterior, si era otra.
 
     elif current_window == "terminado" or current_window == "salir":
-        # Detener la música cuando se llega a la pantalla de terminado o se sale del juego
-        if bandera_musica_juego or bandera_musica_menu:
-            pygame.mixer.music.stop()
-            bandera_musica_juego = False
-            bandera_musica_menu = False
+        # Desvanecer la música cuando se llega a la pantalla de terminado o se sale del juego
+        musica.reproducir(None)
 
 # --- Bucle Principal del Juego ---
 while corriendo:
@@ -99,45 +157,98 @@ while corriendo:
     Bucle principal del juego que se ejecuta continuamente mientras 'corriendo' sea True.
     Gestiona la lógica de fotogramas, eventos y el cambio entre pantallas del juego.
     """
-    reloj.tick(FPS) # Limita la velocidad del bucle a los fotogramas por segundo (FPS) definidos.
+    eventos_despertador = [] # El evento que terminó la espera en reposo, si lo hubo.
+    if argumentos.headless:
+        reloj_virtual.avanzar()
+        inicio_fotograma = time.perf_counter()
+        pantalla_medida = ventana_actual
+    elif en_reposo:
+        # No cambió nada: en lugar de dibujar a FPS, se espera hasta que llegue un evento o venza la próxima tarea.
+        espera = planificador.tiempo_hasta_proxima()
+        espera = ESPERA_MAXIMA_REPOSO_MS if espera is None else min(espera, ESPERA_MAXIMA_REPOSO_MS)
+        if espera > 0:
+            evento_despertador = pygame.event.wait(espera)
+            if evento_despertador.type != pygame.NOEVENT:
+                eventos_despertador.append(evento_despertador) # Va primero: llegó antes que los que siguen en la cola.
+    else:
+        reloj.tick(FPS) # Limita la velocidad del bucle a los fotogramas por segundo (FPS) definidos.
+    perfilador.iniciar_fotograma(ventana_actual) # La espera del reloj no se mide.
     
     # Manejo de Eventos: Obtiene todos los eventos de Pygame (teclado, mouse, cerrar ventana, etc.).
-    cola_eventos = pygame.event.get()
+    cola_eventos = eventos_despertador + pygame.event.get()
+    if argumentos.headless:
+        cola_eventos += eventos_simulados.eventos(fotograma, ventana_actual) # Agrega los clics y teclas simulados.
+    for evento in cola_eventos:
+        if evento.type == pygame.KEYDOWN and evento.key == pygame.K_F3:
+            perfilador.alternar_superposicion() # Muestra u oculta los tiempos de cada sección.
+    perfilador.marcar("eventos")
     
     # --- Gestión del Flujo de Pantallas y Música ---
     manejar_musica_segun_ventana(ventana_actual, datos_juego) # Llama a la función para gestionar la música
+    perfilador.marcar("musica")
+
+    # Al entrar a una pantalla nueva (o con el modo de regiones desactivado) se dibuja y presenta la pantalla completa.
+    # Con la superposición visible también, porque las pantallas no la borran al redibujar solo lo que cambió.
+    if ventana_actual != ventana_anterior or not regiones_sucias or perfilador.superposicion_visible():
+        solicitar_redibujado_completo()
+    if ventana_actual != ventana_anterior:
+        cambiar_pantalla(ventana_anterior, ventana_actual) # Cancela las tareas de la pantalla anterior y prepara la nueva.
+    ventana_anterior = ventana_actual
+
+    planificador.ejecutar_vencidas() # Tareas programadas por las pantallas (ej. el paso de los segundos del juego).
+    precarga.entregar_precargadas() # Imágenes que el hilo de precarga ya dejó listas.
     
-    if ventana_actual == "menu":
-        # Llama a la función que dibuja y gestiona la pantalla del menú.
-        # Devuelve la siguiente ventana a la que debe ir el juego.
-        ventana_actual = mostrar_menu(pantalla, cola_eventos)
-        
-    elif ventana_actual == "juego":
+    if ventana_actual == "juego" and datos_juego["vidas"] <= 0:
         # Verifica si el jugador se ha quedado sin vidas para pasar a la pantalla de terminado.
-        if datos_juego["vidas"] <= 0:
-            ventana_actual = "terminado"
-        else:
-            # Llama a la función que dibuja y gestiona la pantalla de juego.
-            ventana_actual = mostrar_juego(pantalla, cola_eventos, datos_juego)
-        
-    elif ventana_actual == "configuraciones":
-        # Llama a la función que dibuja y gestiona la pantalla de configuraciones.
-        ventana_actual = mostrar_configuracion(pantalla, cola_eventos, datos_juego)
-        
-    elif ventana_actual == "rankings":
-        # Llama a la función que dibuja y gestiona la pantalla de rankings.
-        ventana_actual = mostrar_rankings(pantalla, cola_eventos)
-        
-    elif ventana_actual == "terminado":
-        # Llama a la función que dibuja y gestiona la pantalla de fin de juego.
-        ventana_actual = mostrar_fin_juego(pantalla, cola_eventos, datos_juego)
+        ventana_actual = "terminado"
+
+    elif ventana_actual == "salir" and argumentos.headless:
+        # En el modo sin ventana se sigue simulando: "Salir" vuelve al menú.
+        ventana_actual = "menu"
 
     elif ventana_actual == "salir":
         # Si la ventana actual es "salir", se sale del bucle principal y cierra el juego.
         corriendo = False
+
+    else:
+        # Llama a la función que dibuja y gestiona la pantalla actual (menu, juego, configuraciones,
+        # rankings o terminado), importándola si es la primera vez que se muestra.
+        # Devuelve la siguiente ventana a la que debe ir el juego.
+        ventana_actual = mostrar_pantalla(ventana_actual, pantalla, cola_eventos, datos_juego)
+    perfilador.marcar("pantalla")
+
+    if perfilador.superposicion_visible():
+        perfilador.dibujar_superposicion(pantalla)
+        perfilador.marcar("superposicion")
     
     # --- Actualización de Pantalla ---
-    pygame.display.flip() # Actualiza toda la pantalla para mostrar lo dibujado en este fotograma.
+    regiones = tomar_regiones() # Regiones que las pantallas modificaron en este fotograma.
+    if regiones is None:
+        pygame.display.flip() # Actualiza toda la pantalla para mostrar lo dibujado en este fotograma.
+    elif len(regiones) > 0:
+        pygame.display.update(regiones) # Actualiza solo las regiones que cambiaron.
+
+    # Si no se dibujó nada y se sigue en la misma pantalla, el próximo fotograma puede esperar en reposo.
+    en_reposo = (MODO_REPOSO and not argumentos.headless and regiones is not None and len(regiones) == 0
+                 and ventana_actual == ventana_anterior)
+    if en_reposo and ventana_actual == "menu" and PRECARGA_EN_REPOSO:
+        precarga.iniciar_precarga() # Mientras el jugador mira el menú, se preparan las imágenes de las próximas pantallas.
+    perfilador.marcar("presentacion")
+    perfilador.terminar_fotograma()
+
+    if argumentos.headless:
+        tiempos_por_pantalla.setdefault(pantalla_medida, []).append(time.perf_counter() - inicio_fotograma)
+        fotograma += 1
+        if fotograma >= argumentos.fotogramas:
+            corriendo = False
+
+if argumentos.headless:
+    print(informe_fotogramas(tiempos_por_pantalla, time.perf_counter() - inicio_ejecucion, not regiones_sucias))
+    shutil.rmtree(directorio_rankings_temporal, ignore_errors=True)
+
+perfilador.exportar_csv() # Guarda los tiempos de cada pantalla y sección.
+musica.detener() # Espera a que termine la decodificación de la música, si sigue en curso.
+precarga.detener_precarga() # Y a que termine la precarga de imágenes.
 
 # --- Cierre de Pygame ---
 pygame.quit() # Desinicializa todos los módulos de Pygame antes de que el programa finalice.
@@ -0,0 +1,180 @@
+"""
+Módulo del almacén de rankings en memoria.
+
+Los rankings se cargan una única vez y se mantienen en un montículo (heap) ordenado por puntaje,
+que se actualiza de a un registro con cada partida guardada. Así, pedir los mejores puntajes
+no requiere volver a leer el archivo ni ordenar todos los registros.
+
+Es el almacén del backend "archivo" (ver BACKEND_RANKINGS): AlmacenRankingsArchivo además guarda
+cada ranking nuevo en el registro en disco. El backend "sqlite" está en almacen_rankings_sqlite.py
+y ofrece las mismas consultas.
+"""
+
+import copy # Para copiar el almacén sin volver a armar el montículo.
+import heapq # Montículo binario para mantener los registros ordenados por puntaje.
+import bisect # Para insertar en la lista ordenada que usan las consultas por página.
+from datetime import datetime # Para interpretar las fechas de los rankings en las consultas por rango.
+from .constantes import FORMATO_FECHA_RANKING # Formato de la fecha guardada en cada ranking.
+
+
+class AlmacenRankings:
+    """
+    Almacén de rankings con consulta de los k mejores puntajes.
+
+    Cada registro es un diccionario con 'nombre', 'puntaje' y 'fecha' (el mismo formato del archivo JSON).
+    Internamente se guarda en un montículo de tuplas (-puntaje, orden, registro): el mayor puntaje queda
+    en la raíz y, a igual puntaje, va primero el registro que se agregó antes.
+    """
+
+    def __init__(self, registros: list | None = None):
+        """
+        Args:
+            registros (list | None): Registros iniciales (por ejemplo, los leídos del archivo de rankings).
+        """
+        self._monticulo = []
+        self._siguiente_orden = 0 # Orden de llegada, para desempatar y para no comparar diccionarios.
+        self._mejores = [] # Los primeros registros ya ordenados, de la última consulta a 'top'.
+        self._ordenados = None # Todos los elementos ordenados; se arma recién en la primera consulta a 'pagina'.
+
+        for registro in registros or []:
+            self._monticulo.append((-registro["puntaje"], self._siguiente_orden, registro))
+            self._siguiente_orden += 1
+        heapq.heapify(self._monticulo) # O(n), una única vez al cargar.
+
+    def __len__(self) -> int:
+        return len(self._monticulo)
+
+    def copiar(self) -> "AlmacenRankings":
+        """
+        Devuelve una copia del almacén en O(n), sin volver a armar el montículo. Agregar registros a la copia
+        no cambia el original. Los registros (diccionarios) se comparten, y en AlmacenRankingsArchivo
+        también el registro en disco.
+
+        Returns:
+            AlmacenRankings: La copia, de la misma clase que el original.
+        """
+        copia = copy.copy(self)
+        copia._monticulo = list(self._monticulo)
+        copia._mejores = list(self._mejores)
+        copia._ordenados = None if self._ordenados is None else list(self._ordenados)
+        return copia
+
+    def agregar(self, registro: dict) -> None:
+        """
+        Agrega un registro al almacén en O(log n).
+
+        Args:
+            registro (dict): El registro con 'nombre', 'puntaje' y 'fecha'.
+        """
+        elemento = (-registro["puntaje"], self._siguiente_orden, registro)
+        heapq.heappush(self._monticulo, elemento)
+        self._siguiente_orden += 1
+        self._mejores = [] # La consulta guardada puede haber quedado desactualizada.
+        if self._ordenados is not None:
+            bisect.insort(self._ordenados, elemento)
+
+    def top(self, k: int) -> list:
+        """
+        Devuelve los k registros de mayor puntaje, de mayor a menor.
+
+        Recorre el montículo desde la raíz con un segundo montículo de candidatos (los hijos de los nodos
+        ya elegidos), por lo que cuesta O(k log k) sin modificar el almacén. El resultado se guarda
+        hasta que se agregue un registro nuevo.
+
+        Args:
+            k (int): Cantidad de registros a devolver.
+
+        Returns:
+            list: Lista de hasta k registros (diccionarios), ordenada de mayor a menor puntaje.
+        """
+        k = min(k, len(self._monticulo))
+        if len(self._mejores) >= k:
+            return self._mejores[:k]
+
+        monticulo = self._monticulo
+        mejores = []
+        candidatos = [(monticulo[0], 0)] if monticulo else [] # (elemento, posición en el montículo).
+        while candidatos and len(mejores) < k:
+            elemento, posicion = heapq.heappop(candidatos)
+            mejores.append(elemento[2])
+            for hijo in (2 * posicion + 1, 2 * posicion + 2): # Los hijos de un nodo nunca son mejores que él.
+                if hijo < len(monticulo):
+                    heapq.heappush(candidatos, (monticulo[hijo], hijo))
+
+        self._mejores = mejores
+        return list(mejores)
+
+    def pagina(self, inicio: int, cantidad: int) -> list:
+        """
+        Devuelve una página del ranking completo: los registros en las posiciones [inicio, inicio + cantidad).
+
+        La primera consulta ordena todos los registros una vez (O(n log n)); a partir de ahí cada página
+        cuesta O(cantidad), sin importar en qué parte del ranking esté.
+
+        Args:
+            inicio (int): Posición (desde 0) del primer registro de la página.
+            cantidad (int): Cantidad de registros de la página.
+
+        Returns:
+            list: Lista de tuplas (id, registro), donde id identifica al registro dentro del almacén.
+        """
+        if self._ordenados is None:
+            self._ordenados = sorted(self._monticulo)
+        return [(elemento[1], elemento[2]) for elemento in self._ordenados[inicio:inicio + cantidad]]
+
+    def mejor_de_jugador(self, nombre: str) -> dict | None:
+        """
+        Devuelve el mejor ranking de un jugador. Recorre todos los registros (O(n)).
+
+        Args:
+            nombre (str): El nombre del jugador.
+
+        Returns:
+            dict | None: El ranking de mayor puntaje del jugador, o None si no tiene ninguno.
+        """
+        mejor = None
+        for elemento in self._monticulo:
+            if elemento[2]["nombre"] == nombre and (mejor is None or elemento < mejor):
+                mejor = elemento
+        return None if mejor is None else mejor[2]
+
+    def top_entre_fechas(self, desde: datetime, hasta: datetime, k: int) -> list:
+        """
+        Devuelve los k mejores rankings con fecha en [desde, hasta). Recorre todos los registros (O(n log k)).
+
+        Args:
+            desde (datetime): Fecha inicial (incluida).
+            hasta (datetime): Fecha final (excluida).
+            k (int): Cantidad de rankings a devolver.
+
+        Returns:
+            list: Lista de hasta k rankings, ordenada de mayor a menor puntaje.
+        """
+        elegidos = []
+        for elemento in self._monticulo:
+            try:
+                fecha = datetime.strptime(elemento[2]["fecha"], FORMATO_FECHA_RANKING)
+            except (KeyError, ValueError): # Ranking sin fecha válida.
+                continue
+            if desde <= fecha < hasta:
+                elegidos.append(elemento)
+        return [elemento[2] for elemento in heapq.nsmallest(k, elegidos)]
+
+
+class AlmacenRankingsArchivo(AlmacenRankings):
+    """
+    Almacén de rankings en memoria que además guarda cada ranking nuevo en un RegistroRankings
+    (instantánea JSON más registro de cambios, ver registro_rankings.py).
+    """
+
+    def __init__(self, registro_disco):
+        """
+        Args:
+            registro_disco (RegistroRankings): El registro en disco del que se cargan los rankings y donde se guardan los nuevos.
+        """
+        super().__init__(registro_disco.cargar())
+        self.registro_disco = registro_disco
+
+    def agregar(self, registro: dict) -> None:
+        super().agregar(registro)
+        self.registro_disco.agregar(registro) # Lo agrega al final del registro de cambios (con fsync).
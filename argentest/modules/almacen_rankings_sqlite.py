@@ -0,0 +1,323 @@
+"""
+Módulo del almacén de rankings en SQLite (backend "sqlite", ver BACKEND_RANKINGS).
+
+Pensado para bases con millones de rankings (por ejemplo, los de varias máquinas fusionados en una):
+las consultas usan índices sobre el puntaje, la fecha y el nombre, en lugar de leer y ordenar todo.
+
+Todas las sentencias SQL son constantes del módulo: el módulo sqlite3 guarda en su caché las sentencias
+ya preparadas de cada conexión, así que cada consulta se compila una sola vez y después solo se le pasan
+los parámetros. La base usa el modo WAL, para que agregar un ranking no bloquee a quien está leyendo.
+
+Las páginas se piden con paginación por clave (keyset): en lugar de LIMIT/OFFSET, que recorre todas las filas
+salteadas, cada página sigue desde la clave (puntaje, id) de una fila de la página anterior, así que mostrar la
+página del millón cuesta lo mismo que mostrar la primera.
+
+La paginación se verifica contra un ordenamiento estable de los mismos rankings con:
+python -m modules.almacen_rankings_sqlite
+"""
+
+import random  # Solo para verificar_paginas: rankings y páginas al azar.
+import sqlite3 # Base de datos SQLite de la biblioteca estándar.
+from datetime import datetime # Para convertir las fechas de los rankings a un formato ordenable.
+from .constantes import FORMATO_FECHA_RANKING # Formato de la fecha guardada en cada ranking.
+
+# 'fecha' es la fecha tal como se muestra; 'fecha_iso' es la misma fecha en formato ISO, que se puede
+# comparar como texto y se usa en las consultas por rango. El índice único evita duplicados al fusionar bases.
+_SQL_CREAR_TABLA = """
+CREATE TABLE IF NOT EXISTS rankings (
+    id INTEGER PRIMARY KEY,
+    nombre TEXT NOT NULL,
+    puntaje INTEGER NOT NULL,
+    fecha TEXT NOT NULL,
+    fecha_iso TEXT NOT NULL
+)
+"""
+_SQL_CREAR_INDICES = (
+    "CREATE INDEX IF NOT EXISTS rankings_por_puntaje ON rankings (puntaje DESC, id)",
+    "CREATE INDEX IF NOT EXISTS rankings_por_fecha ON rankings (fecha_iso)",
+    "CREATE INDEX IF NOT EXISTS rankings_por_nombre ON rankings (nombre, puntaje DESC, id)",
+    "CREATE UNIQUE INDEX IF NOT EXISTS rankings_unicos ON rankings (nombre, puntaje, fecha_iso)",
+)
+
+_SQL_INSERTAR = "INSERT OR IGNORE INTO rankings (nombre, puntaje, fecha, fecha_iso) VALUES (?, ?, ?, ?)"
+_SQL_CONTAR = "SELECT COUNT(*) FROM rankings"
+_SQL_TOP = "SELECT nombre, puntaje, fecha FROM rankings ORDER BY puntaje DESC, id LIMIT ?"
+# Páginas (ver pagina): las primeras y las últimas filas del ranking, y las filas inmediatamente después o antes
+# de una fila conocida (puntaje, id). Cada una es un recorrido del índice rankings_por_puntaje desde una posición.
+_SQL_PRIMERAS = "SELECT id, nombre, puntaje, fecha FROM rankings ORDER BY puntaje DESC, id LIMIT ?"
+_SQL_ULTIMAS = "SELECT id, nombre, puntaje, fecha FROM rankings ORDER BY puntaje ASC, id DESC LIMIT ?"
+_SQL_EMPATADAS_DESPUES = "SELECT id, nombre, puntaje, fecha FROM rankings WHERE puntaje = ? AND id > ? ORDER BY id LIMIT ?"
+_SQL_MENORES = "SELECT id, nombre, puntaje, fecha FROM rankings WHERE puntaje < ? ORDER BY puntaje DESC, id LIMIT ?"
+_SQL_EMPATADAS_ANTES = "SELECT id, nombre, puntaje, fecha FROM rankings WHERE puntaje = ? AND id < ? ORDER BY id DESC LIMIT ?"
+_SQL_MAYORES = "SELECT id, nombre, puntaje, fecha FROM rankings WHERE puntaje > ? ORDER BY puntaje ASC, id DESC LIMIT ?"
+# Solo cuando no hay una página anterior de referencia (al entrar, o después de agregar rankings).
+_SQL_PAGINA_DESPLAZADA = "SELECT id, nombre, puntaje, fecha FROM rankings ORDER BY puntaje DESC, id LIMIT ? OFFSET ?"
+_SQL_PAGINA_DESPLAZADA_DESDE_EL_FINAL = ("SELECT id, nombre, puntaje, fecha FROM rankings "
+                                         "ORDER BY puntaje ASC, id DESC LIMIT ? OFFSET ?")
+_SQL_MEJOR_DE_JUGADOR = "SELECT nombre, puntaje, fecha FROM rankings WHERE nombre = ? ORDER BY puntaje DESC, id LIMIT 1"
+_SQL_TOP_ENTRE_FECHAS = ("SELECT nombre, puntaje, fecha FROM rankings WHERE fecha_iso >= ? AND fecha_iso < ? "
+                         "ORDER BY puntaje DESC, id LIMIT ?")
+_SQL_ADJUNTAR = "ATTACH DATABASE ? AS otra"
+_SQL_FUSIONAR = ("INSERT OR IGNORE INTO rankings (nombre, puntaje, fecha, fecha_iso) "
+                 "SELECT nombre, puntaje, fecha, fecha_iso FROM otra.rankings ORDER BY id")
+_SQL_SEPARAR = "DETACH DATABASE otra"
+
+
+def _fecha_iso(fecha: str) -> str:
+    """
+    Convierte una fecha con el formato de los rankings ("dd-mm-aaaa hh:mm:ss") a ISO ("aaaa-mm-dd hh:mm:ss").
+    Si la fecha no tiene ese formato, se devuelve tal cual.
+    """
+    try:
+        return datetime.strptime(fecha, FORMATO_FECHA_RANKING).isoformat(sep=" ")
+    except ValueError:
+        return fecha
+
+
+def _a_diccionario(fila: tuple) -> dict:
+    """
+    Convierte una fila (nombre, puntaje, fecha) al diccionario de ranking que usa el resto del juego.
+    """
+    return {"nombre": fila[0], "puntaje": fila[1], "fecha": fila[2]}
+
+
+class AlmacenRankingsSQLite:
+    """
+    Almacén de rankings en una base SQLite, con las mismas consultas que AlmacenRankings.
+
+    A igual puntaje, va primero el ranking que se agregó antes (menor id).
+    """
+
+    def __init__(self, ruta: str):
+        """
+        Args:
+            ruta (str): Ruta del archivo de la base de datos (ej. "data/rankings.db").
+        """
+        self.ruta = ruta
+        self._conexion = sqlite3.connect(ruta)
+        self._conexion.execute("PRAGMA journal_mode=WAL")
+        self._conexion.execute("PRAGMA synchronous=NORMAL") # Con WAL, sigue siendo seguro ante un corte del juego.
+        with self._conexion:
+            self._conexion.execute(_SQL_CREAR_TABLA)
+            for sql in _SQL_CREAR_INDICES:
+                self._conexion.execute(sql)
+        self._cantidad = self._conexion.execute(_SQL_CONTAR).fetchone()[0] # COUNT(*) recorre la tabla: se cuenta una vez.
+        # Última página devuelta: (posición de su primera fila, filas (id, nombre, puntaje, fecha)). Sus claves
+        # son el punto de partida de la página siguiente. Agregar rankings corre las posiciones (ver agregar).
+        self._pagina_anterior = None
+
+    def __len__(self) -> int:
+        return self._cantidad
+
+    def agregar(self, registro: dict) -> None:
+        """
+        Agrega un ranking a la base.
+
+        Args:
+            registro (dict): El ranking con 'nombre', 'puntaje' y 'fecha'.
+        """
+        with self._conexion: # Una transacción por ranking: queda guardado al salir del bloque.
+            cursor = self._conexion.execute(_SQL_INSERTAR, (registro["nombre"], registro["puntaje"],
+                                                            registro["fecha"], _fecha_iso(registro["fecha"])))
+        self._cantidad += cursor.rowcount # 0 si era un duplicado.
+        if cursor.rowcount > 0 and self._pagina_anterior is not None:
+            # El ranking nuevo tiene el mayor id: a igual puntaje va después. Si cae antes de la página anterior,
+            # la página se corre una posición; si cae dentro, se descarta.
+            inicio_anterior, filas_anteriores = self._pagina_anterior
+            if registro["puntaje"] > filas_anteriores[0][2]:
+                self._pagina_anterior = (inicio_anterior + 1, filas_anteriores)
+            elif registro["puntaje"] > filas_anteriores[-1][2]:
+                self._pagina_anterior = None
+
+    def importar(self, registros: list) -> None:
+        """
+        Agrega muchos rankings en una sola transacción (por ejemplo, los del backend "archivo").
+
+        Args:
+            registros (list): Lista de rankings con 'nombre', 'puntaje' y 'fecha'.
+        """
+        filas = ((registro["nombre"], registro["puntaje"], registro["fecha"], _fecha_iso(registro["fecha"]))
+                 for registro in registros)
+        with self._conexion:
+            self._conexion.executemany(_SQL_INSERTAR, filas)
+        self._cantidad = self._conexion.execute(_SQL_CONTAR).fetchone()[0]
+        self._pagina_anterior = None
+
+    def top(self, k: int) -> list:
+        """
+        Devuelve los k rankings de mayor puntaje, de mayor a menor (recorre el índice por puntaje).
+
+        Args:
+            k (int): Cantidad de rankings a devolver.
+
+        Returns:
+            list: Lista de hasta k rankings (diccionarios).
+        """
+        return [_a_diccionario(fila) for fila in self._conexion.execute(_SQL_TOP, (k,))]
+
+    def pagina(self, inicio: int, cantidad: int) -> list:
+        """
+        Devuelve una página del ranking completo: los rankings en las posiciones [inicio, inicio + cantidad).
+
+        La primera y la última página se leen desde un extremo del índice por puntaje; las demás, desde la
+        clave de una fila de la página anterior. Así cada página cuesta O(cantidad + desplazamiento desde la
+        anterior), sin importar en qué parte del ranking esté.
+
+        Args:
+            inicio (int): Posición (desde 0) del primer ranking de la página.
+            cantidad (int): Cantidad de rankings de la página.
+
+        Returns:
+            list: Lista de tuplas (id, ranking), donde id es el id de la fila en la base.
+        """
+        cantidad = max(0, min(cantidad, self._cantidad - inicio))
+        if inicio < 0 or cantidad == 0:
+            return []
+        filas = self._filas_de_pagina(inicio, cantidad)
+        self._pagina_anterior = (inicio, filas)
+        return [(fila[0], _a_diccionario(fila[1:])) for fila in filas]
+
+    def _filas_de_pagina(self, inicio: int, cantidad: int) -> list:
+        """
+        Lee las filas (id, nombre, puntaje, fecha) en las posiciones [inicio, inicio + cantidad), que existen todas.
+        """
+        if inicio == 0:
+            return self._conexion.execute(_SQL_PRIMERAS, (cantidad,)).fetchall()
+        if inicio + cantidad == self._cantidad: # Última página: se lee desde el final del índice.
+            return self._conexion.execute(_SQL_ULTIMAS, (cantidad,)).fetchall()[::-1]
+
+        if self._pagina_anterior is None:
+            # Sin página de referencia: se saltean filas desde el extremo más cercano.
+            if inicio <= self._cantidad // 2:
+                return self._conexion.execute(_SQL_PAGINA_DESPLAZADA, (cantidad, inicio)).fetchall()
+            desde_el_final = self._cantidad - inicio - cantidad
+            return self._conexion.execute(_SQL_PAGINA_DESPLAZADA_DESDE_EL_FINAL, (cantidad, desde_el_final)).fetchall()[::-1]
+
+        inicio_anterior, filas_anteriores = self._pagina_anterior
+        if inicio >= inicio_anterior:
+            # Hacia abajo: se reutilizan las filas ya leídas y se sigue desde la última de la página anterior.
+            fin_anterior = inicio_anterior + len(filas_anteriores)
+            conocidas = filas_anteriores[inicio - inicio_anterior:inicio - inicio_anterior + cantidad]
+            if len(conocidas) == cantidad:
+                return conocidas
+            salteadas = max(0, inicio - fin_anterior)
+            nuevas = self._filas_despues(filas_anteriores[-1], salteadas + cantidad - len(conocidas))
+            return conocidas + nuevas[salteadas:]
+
+        # Hacia arriba: se leen las filas anteriores a la primera de la página anterior. Si la página nueva
+        # termina después que la anterior, el resto se lee desde la última fila de la anterior.
+        nuevas = self._filas_antes(filas_anteriores[0], inicio_anterior - inicio)
+        filas = (nuevas + filas_anteriores)[:cantidad]
+        if len(filas) < cantidad:
+            filas += self._filas_despues(filas_anteriores[-1], cantidad - len(filas))
+        return filas
+
+    def _filas_despues(self, fila: tuple, cantidad: int) -> list:
+        """
+        Lee, en el orden del ranking, las 'cantidad' filas que siguen a una fila (id, nombre, puntaje, fecha):
+        primero las de igual puntaje y mayor id, después las de menor puntaje.
+        """
+        filas = self._conexion.execute(_SQL_EMPATADAS_DESPUES, (fila[2], fila[0], cantidad)).fetchall()
+        if len(filas) < cantidad:
+            filas += self._conexion.execute(_SQL_MENORES, (fila[2], cantidad - len(filas))).fetchall()
+        return filas
+
+    def _filas_antes(self, fila: tuple, cantidad: int) -> list:
+        """
+        Lee, en el orden del ranking, las 'cantidad' filas que preceden a una fila (id, nombre, puntaje, fecha):
+        las de igual puntaje y menor id, y antes las de mayor puntaje.
+        """
+        filas = self._conexion.execute(_SQL_EMPATADAS_ANTES, (fila[2], fila[0], cantidad)).fetchall()
+        if len(filas) < cantidad:
+            filas += self._conexion.execute(_SQL_MAYORES, (fila[2], cantidad - len(filas))).fetchall()
+        return filas[::-1] # Se leyeron de atrás hacia adelante.
+
+    def mejor_de_jugador(self, nombre: str) -> dict | None:
+        """
+        Devuelve el mejor ranking de un jugador (usa el índice por nombre).
+
+        Args:
+            nombre (str): El nombre del jugador.
+
+        Returns:
+            dict | None: El ranking de mayor puntaje del jugador, o None si no tiene ninguno.
+        """
+        fila = self._conexion.execute(_SQL_MEJOR_DE_JUGADOR, (nombre,)).fetchone()
+        return None if fila is None else _a_diccionario(fila)
+
+    def top_entre_fechas(self, desde: datetime, hasta: datetime, k: int) -> list:
+        """
+        Devuelve los k mejores rankings con fecha en [desde, hasta) (usa el índice por fecha).
+
+        Args:
+            desde (datetime): Fecha inicial (incluida).
+            hasta (datetime): Fecha final (excluida).
+            k (int): Cantidad de rankings a devolver.
+
+        Returns:
+            list: Lista de hasta k rankings, ordenada de mayor a menor puntaje.
+        """
+        parametros = (desde.isoformat(sep=" "), hasta.isoformat(sep=" "), k)
+        return [_a_diccionario(fila) for fila in self._conexion.execute(_SQL_TOP_ENTRE_FECHAS, parametros)]
+
+    def fusionar(self, ruta_otra_base: str) -> int:
+        """
+        Agrega a esta base los rankings de otra base SQLite (por ejemplo, la de otra máquina).
+        Los rankings que ya estaban (mismo nombre, puntaje y fecha) no se duplican.
+
+        Args:
+            ruta_otra_base (str): Ruta del archivo de la otra base.
+
+        Returns:
+            int: Cantidad de rankings nuevos agregados.
+        """
+        self._conexion.execute(_SQL_ADJUNTAR, (ruta_otra_base,))
+        try:
+            with self._conexion:
+                cursor = self._conexion.execute(_SQL_FUSIONAR)
+        finally:
+            self._conexion.execute(_SQL_SEPARAR)
+        self._cantidad += cursor.rowcount
+        self._pagina_anterior = None
+        return cursor.rowcount
+
+    def cerrar(self) -> None:
+        """
+        Cierra la conexión con la base.
+        """
+        self._conexion.close()
+
+
+def verificar_paginas(pasos: int = 3000, semilla: int = 0) -> None:
+    """
+    Verifica la paginación por clave contra un ordenamiento estable de los mismos rankings (mayor puntaje
+    primero y, a igual puntaje, el que se agregó antes), con una base en memoria. Se piden páginas al azar,
+    primero siempre del mismo tamaño y después de tamaños distintos, y entre una y otra se agregan rankings
+    (con muchos empates de puntaje). Lanza AssertionError si alguna página no coincide.
+
+    Args:
+        pasos (int): Cantidad de páginas pedidas en cada una de las dos pruebas.
+        semilla (int): Semilla del generador aleatorio.
+    """
+    aleatorio = random.Random(semilla)
+    for tamaño_variable in (False, True):
+        almacen = AlmacenRankingsSQLite(":memory:")
+        agregados = []
+        for paso in range(pasos):
+            if not agregados or aleatorio.random() < 0.2:
+                registro = {"nombre": f"jugador{len(agregados)}", "puntaje": aleatorio.randrange(0, 500, 25),
+                            "fecha": f"01-01-2025 00:00:{len(agregados) % 60:02d}"}
+                almacen.agregar(registro)
+                agregados.append(registro)
+            cantidad = aleatorio.randint(1, 12) if tamaño_variable else 4
+            inicio = aleatorio.randrange(-2, len(agregados) + 2)
+            esperadas = sorted(agregados, key=lambda registro: -registro["puntaje"]) # sorted es estable.
+            esperadas = esperadas[inicio:inicio + cantidad] if inicio >= 0 else []
+            obtenidas = [registro for _, registro in almacen.pagina(inicio, cantidad)]
+            assert obtenidas == esperadas, (paso, inicio, cantidad, len(agregados))
+        almacen.cerrar()
+
+
+if __name__ == "__main__":
+    verificar_paginas()
+    print("Paginación verificada.")
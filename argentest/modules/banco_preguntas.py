@@ -0,0 +1,282 @@
+"""
+Módulo del banco de preguntas.
+
+Las preguntas se guardan por columnas (ver BancoPreguntas): todos los textos en un único bloque UTF-8,
+un arreglo con los desplazamientos de cada texto y un array('b') con las respuestas correctas.
+
+El archivo CSV de preguntas se compila a un archivo binario con ese mismo formato. Ese archivo se abre
+con mmap y cada pregunta se decodifica recién cuando se la pide por índice, por lo que el tiempo de
+arranque y la memoria usada no dependen de la cantidad de preguntas.
+
+Formato del archivo (todos los enteros en little-endian):
+    - Encabezado: marca b"ARGP", versión (uint16), reservado (uint16), cantidad de preguntas N (uint64).
+    - Desplazamientos: 5*N + 1 enteros uint64. Los textos de la pregunta i (Pregunta, OpcionA..OpcionD)
+      ocupan los bytes [d[5*i + k], d[5*i + k + 1]) del bloque de textos, para k = 0..4.
+    - Respuestas: N enteros int8 con la respuesta correcta (1 a 4) de cada pregunta.
+    - Bloque de textos: todos los textos en UTF-8, uno a continuación del otro.
+"""
+
+import os       # Para comparar fechas de modificación y reemplazar archivos de forma atómica.
+import sys      # Para conocer el orden de bytes de la plataforma.
+import mmap     # Para mapear el archivo compilado en memoria sin leerlo completo.
+import struct   # Para leer y escribir los enteros del formato binario.
+import tempfile # Para escribir el bloque de textos mientras se recorre el CSV.
+import shutil   # Para copiar el bloque de textos al archivo final.
+from array import array # Arreglos compactos de enteros para desplazamientos y respuestas.
+from .funciones import obtener_claves, obtener_valores # Lectura de encabezados y filas del CSV.
+
+_ENCABEZADO = struct.Struct("<4sHHQ")
+_MARCA = b"ARGP"
+VERSION_BANCO = 1
+
+# Claves de los textos de cada pregunta, en el orden en que se guardan.
+CLAVES_TEXTOS = ("Pregunta", "OpcionA", "OpcionB", "OpcionC", "OpcionD")
+
+
+def _leer_filas_csv(ruta_csv: str):
+    """
+    Recorre el CSV de preguntas línea por línea.
+
+    Args:
+        ruta_csv (str): Ruta del archivo CSV de preguntas.
+
+    Yields:
+        tuple: (lista con los 5 textos de la pregunta codificados en UTF-8, respuesta correcta como int).
+    """
+    with open(ruta_csv, "r", encoding="utf-8") as archivo:
+        lista_claves = obtener_claves(archivo, ",")
+        columnas = [lista_claves.index(clave) for clave in CLAVES_TEXTOS]
+        columna_respuesta = lista_claves.index("RespuestaCorrecta")
+
+        for linea in archivo:
+            if linea.strip() == "": # Ignora líneas vacías (por ejemplo, al final del archivo).
+                continue
+            lista_valores = obtener_valores(linea, ",")
+            textos = [lista_valores[columna].encode("utf-8") for columna in columnas]
+            yield textos, int(lista_valores[columna_respuesta])
+
+
+def compilar_banco(ruta_csv: str, ruta_binario: str) -> int:
+    """
+    Compila el CSV de preguntas al formato binario del banco.
+
+    El CSV se recorre línea por línea y los textos se escriben a un archivo temporal, así que
+    la memoria usada solo crece con el índice (unos 41 bytes por pregunta), no con los textos.
+
+    Args:
+        ruta_csv (str): Ruta del archivo CSV de preguntas.
+        ruta_binario (str): Ruta del archivo binario a generar (se reemplaza de forma atómica).
+
+    Returns:
+        int: La cantidad de preguntas compiladas.
+    """
+    desplazamientos = array("Q", [0])
+    respuestas = array("b")
+    posicion = 0 # Posición actual dentro del bloque de textos.
+
+    with tempfile.TemporaryFile() as bloque_textos:
+        for textos, respuesta in _leer_filas_csv(ruta_csv):
+            for texto in textos:
+                bloque_textos.write(texto)
+                posicion += len(texto)
+                desplazamientos.append(posicion)
+            respuestas.append(respuesta)
+
+        cantidad = len(respuestas)
+        if sys.byteorder != "little": # El formato es little-endian.
+            desplazamientos.byteswap()
+
+        os.makedirs(os.path.dirname(ruta_binario) or ".", exist_ok=True)
+        ruta_temporal = ruta_binario + ".tmp"
+        with open(ruta_temporal, "wb") as salida:
+            salida.write(_ENCABEZADO.pack(_MARCA, VERSION_BANCO, 0, cantidad))
+            desplazamientos.tofile(salida)
+            respuestas.tofile(salida)
+            bloque_textos.seek(0)
+            shutil.copyfileobj(bloque_textos, salida)
+        os.replace(ruta_temporal, ruta_binario) # El archivo aparece completo o no aparece.
+
+    return cantidad
+
+
+class BancoPreguntas:
+    """
+    Banco de preguntas guardado por columnas.
+
+    En lugar de un diccionario por pregunta (que repite las claves y tiene su propio costo de memoria),
+    todos los textos están juntos en un único bloque UTF-8, los desplazamientos de cada texto en un
+    arreglo de enteros y las respuestas correctas en un array('b'). Los textos de la pregunta i ocupan
+    textos[d[5*i + k]:d[5*i + k + 1]], para k = 0..4 (Pregunta, OpcionA..OpcionD).
+
+    Se usa como una lista de solo lectura: len(banco), banco[i] e iteración. Cada pregunta se devuelve
+    como un diccionario nuevo con las mismas claves que genera parse_csv.
+    """
+
+    def __init__(self, textos, desplazamientos, respuestas):
+        """
+        Args:
+            textos: Bloque con todos los textos en UTF-8 (bytes, o una vista sobre el archivo mapeado).
+            desplazamientos: Arreglo de 5*N + 1 enteros (array('Q') o una vista con formato 'Q').
+            respuestas: Arreglo de N enteros con la respuesta correcta de cada pregunta (array('b') o vista).
+        """
+        self._textos = textos
+        self._desplazamientos = desplazamientos
+        self._respuestas = respuestas
+        self._cantidad = len(respuestas)
+        self._archivo = None # Archivo y mapeo abiertos, solo si el banco se leyó con desde_archivo.
+        self._mapa = None
+
+    @classmethod
+    def desde_csv(cls, ruta_csv: str) -> "BancoPreguntas":
+        """
+        Arma el banco en memoria a partir del CSV de preguntas.
+
+        Args:
+            ruta_csv (str): Ruta del archivo CSV de preguntas.
+
+        Returns:
+            BancoPreguntas: El banco con todas las preguntas del archivo.
+        """
+        bloque_textos = bytearray()
+        desplazamientos = array("Q", [0])
+        respuestas = array("b")
+        for textos, respuesta in _leer_filas_csv(ruta_csv):
+            for texto in textos:
+                bloque_textos += texto
+                desplazamientos.append(len(bloque_textos))
+            respuestas.append(respuesta)
+        return cls(bytes(bloque_textos), desplazamientos, respuestas)
+
+    @classmethod
+    def desde_archivo(cls, ruta_binario: str) -> "BancoPreguntas":
+        """
+        Abre un banco compilado con compilar_banco. El archivo se mapea en memoria y las columnas
+        son vistas sobre ese mapeo, así que no se lee nada hasta que se pide una pregunta.
+
+        Args:
+            ruta_binario (str): Ruta del archivo compilado.
+
+        Returns:
+            BancoPreguntas: El banco, que debe cerrarse con cerrar() cuando ya no se use.
+        """
+        archivo = open(ruta_binario, "rb")
+        try:
+            mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError: # Un archivo vacío no se puede mapear.
+            archivo.close()
+            raise ValueError(f"El banco de preguntas '{ruta_binario}' está vacío.")
+
+        if len(mapa) < _ENCABEZADO.size: # Archivo cortado antes de terminar el encabezado.
+            mapa.close()
+            archivo.close()
+            raise ValueError(f"El banco de preguntas '{ruta_binario}' está incompleto.")
+
+        marca, version, _, cantidad = _ENCABEZADO.unpack_from(mapa, 0)
+        if marca != _MARCA or version != VERSION_BANCO:
+            mapa.close()
+            archivo.close()
+            raise ValueError(f"'{ruta_binario}' no es un banco de preguntas compilado compatible.")
+
+        inicio_respuestas = _ENCABEZADO.size + (5 * cantidad + 1) * 8
+        inicio_textos = inicio_respuestas + cantidad
+        if len(mapa) < inicio_textos: # Archivo cortado dentro del índice o de las respuestas.
+            mapa.close()
+            archivo.close()
+            raise ValueError(f"El banco de preguntas '{ruta_binario}' está incompleto.")
+
+        vista = memoryview(mapa)
+        if sys.byteorder == "little":
+            desplazamientos = vista[_ENCABEZADO.size:inicio_respuestas].cast("Q")
+        else: # En plataformas big-endian se copia el índice y se invierte el orden de bytes.
+            desplazamientos = array("Q", vista[_ENCABEZADO.size:inicio_respuestas].tobytes())
+            desplazamientos.byteswap()
+        respuestas = vista[inicio_respuestas:inicio_textos].cast("b")
+        textos = vista[inicio_textos:]
+        vista.release()
+
+        banco = cls(textos, desplazamientos, respuestas)
+        banco._archivo = archivo
+        banco._mapa = mapa
+        if desplazamientos[-1] != len(textos): # Archivo cortado dentro de los textos (o con basura al final).
+            banco.cerrar()
+            raise ValueError(f"El banco de preguntas '{ruta_binario}' está incompleto.")
+        return banco
+
+    def __len__(self) -> int:
+        return self._cantidad
+
+    def __getitem__(self, indice: int) -> dict:
+        if indice < 0:
+            indice += self._cantidad
+        if not 0 <= indice < self._cantidad:
+            raise IndexError("índice de pregunta fuera de rango")
+
+        d = self._desplazamientos
+        textos = self._textos
+        base = 5 * indice
+        return {
+            "Pregunta": str(textos[d[base]:d[base + 1]], "utf-8"),
+            "OpcionA": str(textos[d[base + 1]:d[base + 2]], "utf-8"),
+            "OpcionB": str(textos[d[base + 2]:d[base + 3]], "utf-8"),
+            "OpcionC": str(textos[d[base + 3]:d[base + 4]], "utf-8"),
+            "OpcionD": str(textos[d[base + 4]:d[base + 5]], "utf-8"),
+            "RespuestaCorrecta": self._respuestas[indice]
+        }
+
+    def __iter__(self):
+        for indice in range(self._cantidad):
+            yield self[indice]
+
+    def cerrar(self) -> None:
+        """
+        Libera el mapeo en memoria y cierra el archivo, si el banco se abrió con desde_archivo.
+        """
+        if self._mapa is None:
+            return
+        # Las vistas deben liberarse antes de cerrar el mapeo.
+        for columna in (self._textos, self._desplazamientos, self._respuestas):
+            if isinstance(columna, memoryview):
+                columna.release()
+        self._mapa.close()
+        self._archivo.close()
+        self._mapa = None
+        self._archivo = None
+
+
+def cargar_banco_preguntas(ruta_csv: str, ruta_binario: str) -> BancoPreguntas:
+    """
+    Abre el banco de preguntas compilado, compilándolo antes si no existe o si el CSV es más nuevo.
+    Si el archivo compilado está dañado (vacío, incompleto o de otra VERSION_BANCO), se vuelve a compilar una vez.
+
+    Si no se puede escribir el archivo compilado, el banco se arma en memoria directamente desde el CSV.
+
+    Args:
+        ruta_csv (str): Ruta del archivo CSV de preguntas (la fuente editable).
+        ruta_binario (str): Ruta del archivo compilado.
+
+    Returns:
+        BancoPreguntas: El banco de preguntas (vacío si no existe ninguno de los dos archivos).
+    """
+    existe_csv = os.path.exists(ruta_csv)
+    existe_binario = os.path.exists(ruta_binario)
+
+    if existe_csv and (not existe_binario or os.path.getmtime(ruta_csv) > os.path.getmtime(ruta_binario)):
+        try:
+            compilar_banco(ruta_csv, ruta_binario)
+        except OSError:
+            return BancoPreguntas.desde_csv(ruta_csv)
+    elif not existe_binario:
+        return BancoPreguntas(b"", array("Q", [0]), array("b"))
+
+    try:
+        return BancoPreguntas.desde_archivo(ruta_binario)
+    except (ValueError, OSError):
+        if not existe_csv: # No hay de dónde recompilarlo.
+            raise
+
+    # El archivo compilado está dañado: se recompila una vez y, si tampoco se puede abrir, se usa el CSV.
+    try:
+        compilar_banco(ruta_csv, ruta_binario)
+        return BancoPreguntas.desde_archivo(ruta_binario)
+    except (ValueError, OSError):
+        return BancoPreguntas.desde_csv(ruta_csv)
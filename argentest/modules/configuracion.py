@@ -6,34 +6,45 @@ y los efectos de sonido, así como la opción de regresar al menú principal.
 """
 
 import pygame
-# Importa todas las constantes, incluyendo colores, tamaños y sonidos desde 'constantes.py'.
+# Importa todas las constantes, incluyendo colores y tamaños desde 'constantes.py'.
 from .constantes import *
+# Importa los efectos de sonido (click, error y acierto), cuyo volumen se ajusta en esta pantalla.
+from .sonidos import *
 # Importa la función mostrar_texto para renderizar texto en la pantalla.
 from .funciones import mostrar_texto
+# Importa las funciones para informar qué regiones de la ventana cambiaron.
+from .regiones import redibujado_completo, marcar_region
+# Importa la carga de imágenes compartidas y ya convertidas.
+from .recursos import cargar_imagen
 
 # --- Carga de Imágenes Globales para la Pantalla de Configuración ---
-# Las imágenes se cargan una única vez al importar el módulo para optimizar el rendimiento.
+# Las imágenes se piden al módulo de recursos, que las decodifica una única vez y las comparte entre pantallas.
 
-fondo_config = pygame.image.load("assets/images/fondo_config.png") 
-fondo_config = pygame.transform.scale(fondo_config, VENTANA) # Escala el fondo al tamaño de la ventana.
+fondo_config = cargar_imagen("assets/images/fondo_config.png", VENTANA) # Escala el fondo al tamaño de la ventana.
 
-boton_subir_vol = pygame.image.load("assets/images/subir_volumen.png") 
-boton_subir_vol = pygame.transform.scale(boton_subir_vol, TAMAÑO_BOTON_VOLUMEN) # Escala el botón al tamaño definido en constantes.
+boton_subir_vol = cargar_imagen("assets/images/subir_volumen.png", TAMAÑO_BOTON_VOLUMEN, alpha=True) # Escala el botón al tamaño definido en constantes.
 
-boton_bajar_vol = pygame.image.load("assets/images/bajar_volumen.png") 
-boton_bajar_vol = pygame.transform.scale(boton_bajar_vol, TAMAÑO_BOTON_VOLUMEN)
+boton_bajar_vol = cargar_imagen("assets/images/bajar_volumen.png", TAMAÑO_BOTON_VOLUMEN, alpha=True)
 
-boton_silenciar = pygame.image.load("assets/images/silenciar_musica.png") 
-boton_silenciar = pygame.transform.scale(boton_silenciar, TAMAÑO_BOTON_VOLUMEN)
+boton_silenciar = cargar_imagen("assets/images/silenciar_musica.png", TAMAÑO_BOTON_VOLUMEN, alpha=True)
 
-boton_volver = pygame.image.load("assets/images/boton_volver.png") 
-boton_volver = pygame.transform.scale(boton_volver, TAMAÑO_BOTON_VOLUMEN)
+boton_volver = cargar_imagen("assets/images/boton_volver.png", TAMAÑO_BOTON_VOLUMEN, alpha=True)
 
 # --- Definición de Fuentes ---
 # Las fuentes se cargan una vez para ser reutilizadas al dibujar texto.
 fuente_boton = pygame.font.SysFont("Arial Narrow", 23)   # Fuente para los textos generales de botones.
 fuente_volumen = pygame.font.SysFont("Arial Narrow", 50) # Fuente para el porcentaje de volumen.
 
+# --- Rectángulos de los Botones ---
+# Las posiciones son fijas, así que los rectángulos para la detección de clics se calculan una sola vez.
+boton_subir_vol_rect = boton_subir_vol.get_rect(topleft=(720, 200)) # Posición del botón de subir volumen.
+boton_bajar_vol_rect = boton_bajar_vol.get_rect(topleft=(20, 200))   # Posición del botón de bajar volumen.
+boton_silenciar_rect = boton_silenciar.get_rect(topleft=(720, 20))   # Posición del botón de silenciar.
+boton_volver_rect = boton_volver.get_rect(topleft=(10, 10))          # Posición del botón de volver al menú.
+
+# Rectángulo ocupado por el porcentaje de volumen dibujado, para poder borrarlo cuando cambia.
+rect_volumen_mostrado = pygame.Rect(0, 0, 0, 0)
+
 
 def mostrar_configuracion(pantalla: pygame.Surface, cola_eventos: list[pygame.event.Event], datos_juego: dict) -> str:
     """
@@ -50,16 +61,10 @@ def mostrar_configuracion(pantalla: pygame.Surface, cola_eventos: list[pygame.ev
     Returns:
         str: El nombre de la próxima ventana a mostrar ('menu', 'salir', 'configuraciones').
     """
+    global rect_volumen_mostrado
+
     retorno = "configuraciones" # Estado por defecto: permanecer en la pantalla de configuraciones.
-    
-    # Dibuja el fondo de la pantalla de configuración.
-    pantalla.blit(fondo_config, (0, 0))
-    
-    # Dibuja los botones y obtiene sus rectángulos para la detección de clics.
-    boton_subir_vol_rect = pantalla.blit(boton_subir_vol, (720, 200)) # Posición del botón de subir volumen.
-    boton_bajar_vol_rect = pantalla.blit(boton_bajar_vol, (20, 200))   # Posición del botón de bajar volumen.
-    boton_silenciar_rect = pantalla.blit(boton_silenciar, (720, 20)) # Posición del botón de silenciar.
-    boton_volver_rect = pantalla.blit(boton_volver, (10, 10))       # Posición del botón de volver al menú.
+    volumen_previo = datos_juego["volumen_musica"] # Para saber si el porcentaje mostrado debe actualizarse.
 
     # --- Procesamiento de Eventos ---
     for evento in cola_eventos:
@@ -73,23 +78,13 @@ def mostrar_configuracion(pantalla: pygame.Surface, cola_eventos: list[pygame.ev
             if boton_subir_vol_rect.collidepoint(evento.pos):
                 if datos_juego["volumen_musica"] < 100: # Limita el volumen máximo a 100.
                     datos_juego["volumen_musica"] += 5 # Aumenta el volumen en 5 unidades (para la interfaz).
-                CLICK_SONIDO.play() # Reproduce el sonido de clic al interactuar.
-                # Ajusta el volumen real de la música y los efectos de sonido en Pygame.
-                # Se escala el porcentaje de la interfaz (0-100) al rango de Pygame (0.0-1.0) y luego se multiplica por MAX_VOLUMEN_REAL para limitar el volumen percibido.
-                pygame.mixer.music.set_volume((datos_juego["volumen_musica"] / 100) * MAX_VOLUMEN_REAL)
-                CLICK_SONIDO.set_volume((datos_juego["volumen_musica"] / 100) * MAX_VOLUMEN_REAL)
-                ERROR_SONIDO.set_volume((datos_juego["volumen_musica"] / 100) * MAX_VOLUMEN_REAL)
-                ACIERTO_SONIDO.set_volume((datos_juego["volumen_musica"] / 100) * MAX_VOLUMEN_REAL)
+                reproducir_efecto(CLICK_SONIDO) # Reproduce el sonido de clic al interactuar.
 
             # Lógica para el botón de bajar volumen.
             elif boton_bajar_vol_rect.collidepoint(evento.pos):
                 if datos_juego["volumen_musica"] > 0: # Limita el volumen mínimo a 0.
                     datos_juego["volumen_musica"] -= 5 # Disminuye el volumen en 5 unidades.
-                CLICK_SONIDO.play()
-                pygame.mixer.music.set_volume((datos_juego["volumen_musica"] / 100) * MAX_VOLUMEN_REAL)
-                CLICK_SONIDO.set_volume((datos_juego["volumen_musica"] / 100) * MAX_VOLUMEN_REAL)
-                ERROR_SONIDO.set_volume((datos_juego["volumen_musica"] / 100) * MAX_VOLUMEN_REAL)
-                ACIERTO_SONIDO.set_volume((datos_juego["volumen_musica"] / 100) * MAX_VOLUMEN_REAL)
+                reproducir_efecto(CLICK_SONIDO)
 
             # Lógica para el botón de silenciar/des-silenciar.
             elif boton_silenciar_rect.collidepoint(evento.pos):
@@ -98,15 +93,11 @@ def mostrar_configuracion(pantalla: pygame.Surface, cola_eventos: list[pygame.ev
                     datos_juego["volumen_musica"] = 0 # Silencia el volumen.
                 else: # Si el volumen ya está en 0, lo restaura al valor anterior o a 50 si no hay anterior.
                     datos_juego["volumen_musica"] = datos_juego.get("volumen_musica_prev", 50) 
-                CLICK_SONIDO.play()
-                pygame.mixer.music.set_volume((datos_juego["volumen_musica"] / 100) * MAX_VOLUMEN_REAL)
-                CLICK_SONIDO.set_volume((datos_juego["volumen_musica"] / 100) * MAX_VOLUMEN_REAL)
-                ERROR_SONIDO.set_volume((datos_juego["volumen_musica"] / 100) * MAX_VOLUMEN_REAL)
-                ACIERTO_SONIDO.set_volume((datos_juego["volumen_musica"] / 100) * MAX_VOLUMEN_REAL)
+                reproducir_efecto(CLICK_SONIDO)
                 
             # Lógica para el botón de volver al menú.
             elif boton_volver_rect.collidepoint(evento.pos):
-                CLICK_SONIDO.play()
+                reproducir_efecto(CLICK_SONIDO)
                 retorno = "menu" # Cambia el estado a 'menu' para regresar.
         
         # Si se detecta una pulsación de tecla.
@@ -115,23 +106,35 @@ def mostrar_configuracion(pantalla: pygame.Surface, cola_eventos: list[pygame.ev
             if evento.key == pygame.K_UP:
                 if datos_juego["volumen_musica"] < 100:
                     datos_juego["volumen_musica"] += 5
-                CLICK_SONIDO.play()
-                pygame.mixer.music.set_volume((datos_juego["volumen_musica"] / 100) * MAX_VOLUMEN_REAL)
-                CLICK_SONIDO.set_volume((datos_juego["volumen_musica"] / 100) * MAX_VOLUMEN_REAL)
-                ERROR_SONIDO.set_volume((datos_juego["volumen_musica"] / 100) * MAX_VOLUMEN_REAL)
-                ACIERTO_SONIDO.set_volume((datos_juego["volumen_musica"] / 100) * MAX_VOLUMEN_REAL)
+                reproducir_efecto(CLICK_SONIDO)
                 
             # Lógica para la tecla flecha abajo (bajar volumen).
             elif evento.key == pygame.K_DOWN:
                 if datos_juego["volumen_musica"] > 0:
                     datos_juego["volumen_musica"] -= 5
-                CLICK_SONIDO.play()
-                pygame.mixer.music.set_volume((datos_juego["volumen_musica"] / 100) * MAX_VOLUMEN_REAL)
-                CLICK_SONIDO.set_volume((datos_juego["volumen_musica"] / 100) * MAX_VOLUMEN_REAL)
-                ERROR_SONIDO.set_volume((datos_juego["volumen_musica"] / 100) * MAX_VOLUMEN_REAL)
-                ACIERTO_SONIDO.set_volume((datos_juego["volumen_musica"] / 100) * MAX_VOLUMEN_REAL)
-
-    # Dibuja el porcentaje de volumen actual en el centro de la pantalla.
-    mostrar_texto(pantalla, f"{datos_juego['volumen_musica']} %", (350, 200), fuente_volumen, COLOR_BLANCO)
+                reproducir_efecto(CLICK_SONIDO)
+
+    if datos_juego["volumen_musica"] != volumen_previo:
+        # Ajusta el volumen real de los efectos de sonido en Pygame (el de la música lo ajusta main.py).
+        # Se escala el porcentaje de la interfaz (0-100) al rango de Pygame (0.0-1.0) y luego se multiplica por MAX_VOLUMEN_REAL para limitar el volumen percibido.
+        ajustar_volumen_efectos((datos_juego["volumen_musica"] / 100) * MAX_VOLUMEN_REAL)
+
+    # --- Dibujado ---
+    if redibujado_completo():
+        # Dibuja el fondo y los botones de la pantalla de configuración.
+        pantalla.blit(fondo_config, (0, 0))
+        pantalla.blit(boton_subir_vol, boton_subir_vol_rect)
+        pantalla.blit(boton_bajar_vol, boton_bajar_vol_rect)
+        pantalla.blit(boton_silenciar, boton_silenciar_rect)
+        pantalla.blit(boton_volver, boton_volver_rect)
+        # Dibuja el porcentaje de volumen actual en el centro de la pantalla.
+        rect_volumen_mostrado = mostrar_texto(pantalla, f"{datos_juego['volumen_musica']} %", (350, 200), fuente_volumen, COLOR_BLANCO)
+
+    elif datos_juego["volumen_musica"] != volumen_previo:
+        # Solo cambió el porcentaje: se borra el anterior restaurando el fondo y se dibuja el nuevo.
+        pantalla.blit(fondo_config, rect_volumen_mostrado, rect_volumen_mostrado)
+        rect_anterior = rect_volumen_mostrado
+        rect_volumen_mostrado = mostrar_texto(pantalla, f"{datos_juego['volumen_musica']} %", (350, 200), fuente_volumen, COLOR_BLANCO)
+        marcar_region(rect_anterior.union(rect_volumen_mostrado))
 
     return retorno
\ No newline at end of file
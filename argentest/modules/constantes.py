@@ -3,11 +3,10 @@ Módulo de constantes para el juego.
 
 Este módulo define todas las constantes utilizadas a lo largo del juego,
 incluyendo colores, dimensiones de pantalla, identificadores de botones,
-tamaños de elementos gráficos, y configuración inicial de sonido y juego.
+tamaños de elementos gráficos, y configuración inicial de juego.
+No importa Pygame: los sonidos se cargan en sonidos.py.
 """
 
-import pygame 
-
 # --- COLORES ---
 # Definición de colores en formato RGB (Rojo, Verde, Azul).
 COLOR_BLANCO = (255,255,255)
@@ -24,6 +23,16 @@ ANCHO = 800
 ALTO = 600
 VENTANA = (ANCHO,ALTO) # Tupla que define el tamaño total de la ventana (ancho, alto).
 FPS = 60 # Fotogramas por segundo: controla la velocidad de actualización del juego.
+# Si es True, cada pantalla informa las regiones que cambiaron y solo esas se actualizan (pygame.display.update).
+# Si es False, todas las pantallas se redibujan completas y se presentan con pygame.display.flip() en cada fotograma.
+MODO_REGIONES_SUCIAS = True
+# Si es True (y MODO_REGIONES_SUCIAS también), cuando en un fotograma no cambió nada en la ventana el bucle principal
+# deja de dibujar a FPS y espera (pygame.event.wait) hasta que llegue un evento o venza una tarea del planificador.
+MODO_REPOSO = True
+ESPERA_MAXIMA_REPOSO_MS = 1000 # Espera máxima en reposo, aunque no haya eventos ni tareas.
+# Si es True, la primera vez que el menú queda en reposo se empiezan a precargar en segundo plano
+# las imágenes del juego y de los rankings (ver precarga.py).
+PRECARGA_EN_REPOSO = True
 
 # --- BOTONES ---
 # Identificadores numéricos para los botones del menú y comodines.
@@ -53,20 +62,72 @@ TAMAÑO_IMAGEN_COMODIN = (45,45) # Tamaño de los iconos de los comodines.
 # Un valor más bajo reduce el volumen máximo del juego.
 MAX_VOLUMEN_REAL = 0.04
 
+# --- MÚSICA DE FONDO ---
+# Pistas de música, por nombre (el de la pantalla en la que suenan). Se decodifican una sola vez al arrancar, en este orden.
+PISTAS_MUSICA = {
+    "menu": "assets/sounds/musica_menu.mp3",
+    "juego": "assets/sounds/musica_juego.mp3"
+}
+DURACION_FUNDIDO_MS = 800 # Duración del fundido cruzado entre pistas al cambiar de pantalla.
+
+# --- MEZCLADOR DE AUDIO ---
+FRECUENCIA_AUDIO = 44100 # Muestras por segundo.
+# Muestras por bloque del mezclador. Con bloques más chicos hay menos demora entre play() y el sonido, pero el
+# mezclador trabaja más seguido (Pygame usa 512 por defecto). Se puede cambiar con --buffer-audio (ver main.py).
+TAMAÑO_BUFFER_AUDIO = 256
+CANALES_EFECTOS = 4 # Canales reservados para los efectos de sonido (ver sonidos.py).
+
+
+# --- CACHÉ DE IMÁGENES EN DISCO ---
+# Si es True, cada imagen ya escalada se guarda en DIRECTORIO_CACHE_SUPERFICIES como píxeles sin comprimir,
+# para que en los siguientes arranques no haya que decodificar el PNG ni volver a escalarlo.
+CACHE_SUPERFICIES_EN_DISCO = True
+VERSION_CACHE_SUPERFICIES = 1 # Se incrementa si cambia el formato de los archivos de la caché.
+DIRECTORIO_CACHE_SUPERFICIES = f"cache/superficies/v{VERSION_CACHE_SUPERFICIES}"
+
+
+# --- BANCO DE PREGUNTAS ---
+# Archivo compilado del banco de preguntas (ver banco_preguntas.py). Se regenera solo cuando data/preguntas.csv cambia.
+RUTA_BANCO_PREGUNTAS = "cache/preguntas.bin"
+
+
+# --- BARRIDO DE PARÁMETROS ---
+# Caché de los resultados de barrido.py: un archivo por combinación de parámetros ya simulada.
+DIRECTORIO_CACHE_BARRIDO = "cache/barrido"
+
+
+# --- RANKINGS ---
+# Instantánea de los rankings. Los rankings nuevos se agregan a registros de cambios en el mismo directorio
+# (data/rankings.<generación>.jsonl), que se compactan en la instantánea cada COMPACTAR_RANKINGS_CADA rankings.
+RUTA_RANKINGS = "data/rankings.json"
+COMPACTAR_RANKINGS_CADA = 100
+FORMATO_FECHA_RANKING = "%d-%m-%Y %H:%M:%S" # Formato de la fecha guardada en cada ranking.
+
+# Dónde se guardan los rankings: "archivo" (RUTA_RANKINGS, todo en memoria) o "sqlite" (RUTA_RANKINGS_SQLITE,
+# con consultas indexadas, para bases muy grandes). Al crear la base SQLite se importan los rankings del archivo.
+BACKEND_RANKINGS = "archivo"
+RUTA_RANKINGS_SQLITE = "data/rankings.db"
+
+
+# --- PERFILADOR DE FOTOGRAMAS ---
+# Cantidad de fotogramas recientes (por pantalla y sección) con los que se calculan los percentiles (ver perfilador.py).
+MUESTRAS_PERFILADOR = 600
+RUTA_PERFIL_CSV = "cache/perfil_fotogramas.csv" # Archivo donde se exportan los tiempos al salir del juego.
+
 
-# --- SONIDO ---
-# Carga los archivos de sonido para efectos del juego.
-# Los volúmenes iniciales se establecen aquí para tener un punto de partida, aunque serán ajustados dinámicamente desde la pantalla de configuración.
-CLICK_SONIDO = pygame.mixer.Sound("assets/sounds/click.mp3")
-CLICK_SONIDO.set_volume(0.2) # Volumen inicial del sonido de click (20% de su propio volumen).
-ERROR_SONIDO = pygame.mixer.Sound("assets/sounds/error.mp3")
-ERROR_SONIDO.set_volume(0.02) # Volumen inicial del sonido de error (2% de su propio volumen).
-ACIERTO_SONIDO = pygame.mixer.Sound("assets/sounds/acierto.mp3")
-ACIERTO_SONIDO.set_volume(0.02) # Volumen inicial del sonido de acierto (2% de su propio volumen).
+# --- CACHÉ DE TEXTO ---
+# Memoria máxima (en bytes) que pueden ocupar las superficies de texto ya renderizadas que guarda 'mostrar_texto'.
+# Al superarse, se descartan primero las superficies usadas hace más tiempo (LRU).
+MAX_MEMORIA_CACHE_TEXTO = 4 * 1024 * 1024
 
 
 # --- CONFIGURACIÓN DE JUEGO ---
 # Variables relacionadas con las reglas y puntuación del juego.
 CANTIDAD_VIDAS = 3           # Número de vidas con las que comienza el jugador.
 PUNTUACION_ACIERTO = 100     # Puntos que se suman por una respuesta correcta.
-PUNTUACION_ERROR = 25        # Puntos que se restan por una respuesta incorrecta.
\ No newline at end of file
+PUNTUACION_ERROR = 25        # Puntos que se restan por una respuesta incorrecta.
+MAX_VIDAS = 3                # Las vidas extra no pueden superar esta cantidad.
+TIEMPO_PARTIDA = 180         # Duración de una partida, en segundos.
+RACHA_VIDA_EXTRA = 5         # Cada cuántos aciertos se otorga una vida extra (y el bonus de tiempo).
+BONUS_TIEMPO_RACHA = 10      # Segundos que se suman al completar una racha de aciertos.
+DURACION_REVELACION_MS = 500 # Tiempo que se muestra la respuesta elegida (en verde o rojo) antes de pasar a la siguiente.
\ No newline at end of file
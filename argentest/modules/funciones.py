@@ -12,46 +12,192 @@ import pygame # Importa la librería Pygame, necesaria para funcionalidades de t
 import os     # Módulo para interactuar con el sistema operativo (ej. verificar existencia de archivos).
 import json   # Módulo para trabajar con archivos JSON (usado para rankings, aunque no directamente en este módulo).
 import io     # Necesario para la pista de tipo de archivo >>>
+from collections import OrderedDict # Diccionario ordenado, usado como caché LRU de texto renderizado.
 
 
-def mostrar_texto(surface: pygame.Surface, text: str, pos: tuple, font: pygame.font.Font, color: tuple = (0,0,0)):
+# --- CACHÉ DE RENDERIZADO DE TEXTO ---
+# Guarda las superficies ya renderizadas (palabras sueltas y bloques de texto completos) para no
+# rasterizar con la fuente el mismo texto en cada fotograma. Las entradas se mantienen en orden de uso:
+# la más reciente queda al final y, si se supera MAX_MEMORIA_CACHE_TEXTO, se descartan las del principio.
+_cache_texto = OrderedDict()
+
+# Contadores de la caché, útiles para medir su efectividad.
+estadisticas_cache_texto = {
+    "aciertos": 0,   # Veces que una superficie se encontró ya renderizada.
+    "fallos": 0,     # Veces que hubo que renderizarla con la fuente.
+    "desalojos": 0,  # Superficies descartadas por falta de memoria.
+    "memoria": 0     # Bytes ocupados actualmente por las superficies guardadas.
+}
+
+
+def _memoria_superficie(superficie: pygame.Surface) -> int:
     """
-    Renderiza texto en una superficie de Pygame, con soporte básico para salto de línea y ajuste de ancho.
+    Calcula la memoria (en bytes) que ocupan los píxeles de una superficie.
+    """
+    return superficie.get_pitch() * superficie.get_height()
+
+
+def _buscar_en_cache_texto(clave: tuple) -> pygame.Surface | None:
+    """
+    Busca una superficie en la caché de texto y, si está, la marca como la más recientemente usada.
+
+    Returns:
+        pygame.Surface | None: La superficie guardada, o None si no estaba en la caché.
+    """
+    superficie = _cache_texto.get(clave)
+    if superficie is None:
+        estadisticas_cache_texto["fallos"] += 1
+    else:
+        _cache_texto.move_to_end(clave) # Pasa a ser la entrada más reciente.
+        estadisticas_cache_texto["aciertos"] += 1
+    return superficie
+
+
+def _guardar_en_cache_texto(clave: tuple, superficie: pygame.Surface) -> None:
+    """
+    Guarda una superficie en la caché de texto, descartando las menos usadas si se supera el límite de memoria.
+    """
+    memoria = _memoria_superficie(superficie)
+    if memoria > MAX_MEMORIA_CACHE_TEXTO: # Una superficie más grande que toda la caché no se guarda.
+        return
+
+    _cache_texto[clave] = superficie
+    estadisticas_cache_texto["memoria"] += memoria
+
+    while estadisticas_cache_texto["memoria"] > MAX_MEMORIA_CACHE_TEXTO:
+        _, superficie_vieja = _cache_texto.popitem(last=False) # Descarta la entrada usada hace más tiempo.
+        estadisticas_cache_texto["memoria"] -= _memoria_superficie(superficie_vieja)
+        estadisticas_cache_texto["desalojos"] += 1
+
+
+def obtener_estadisticas_cache_texto() -> dict:
+    """
+    Devuelve una copia de los contadores de la caché de texto, junto con la cantidad de entradas guardadas.
+
+    Returns:
+        dict: Diccionario con 'aciertos', 'fallos', 'desalojos', 'memoria' (bytes) y 'entradas'.
+    """
+    estadisticas = dict(estadisticas_cache_texto)
+    estadisticas["entradas"] = len(_cache_texto)
+    return estadisticas
+
+
+def vaciar_cache_texto() -> None:
+    """
+    Descarta todas las superficies de la caché de texto (los contadores de aciertos y fallos se conservan).
+    """
+    _cache_texto.clear()
+    estadisticas_cache_texto["memoria"] = 0
+
 
-    El texto se dibuja línea por línea, y las palabras se ajustan a `max_width`.
+def renderizar_palabra(font: pygame.font.Font, palabra: str, color: tuple) -> pygame.Surface:
+    """
+    Renderiza una palabra con la fuente y el color indicados, reutilizando la superficie si ya estaba en la caché.
 
     Args:
-        surface (pygame.Surface): La superficie donde se dibujará el texto (ej. la pantalla, una superficie de botón).
-        text (str): El texto a renderizar.
-        pos (tuple): Una tupla (x, y) que indica la posición superior izquierda donde comenzar a dibujar el texto.
-        font (pygame.font.Font): El objeto de fuente de Pygame a usar para renderizar el texto.
-        color (tuple): El color del texto en formato RGB (por defecto, negro).
+        font (pygame.font.Font): La fuente con la que se renderiza la palabra.
+        palabra (str): La palabra a renderizar.
+        color (tuple): El color del texto en formato RGB.
+
+    Returns:
+        pygame.Surface: La superficie con la palabra renderizada. Es compartida: no debe modificarse.
+    """
+    clave = ("palabra", font, palabra, tuple(color))
+    superficie = _buscar_en_cache_texto(clave)
+    if superficie is None:
+        superficie = font.render(palabra, False, color) # Renderiza la palabra en una superficie nueva.
+        _guardar_en_cache_texto(clave, superficie)
+    return superficie
+
+
+def _componer_bloque_texto(text: str, font: pygame.font.Font, color: tuple, ancho_disponible: int) -> pygame.Surface | None:
+    """
+    Dibuja todo el texto (con sus saltos de línea y su ajuste de ancho) en una única superficie con fondo transparente.
+
+    Las palabras se acomodan exactamente igual que si se dibujaran una por una en la superficie de destino,
+    tomando como origen la esquina superior izquierda del bloque.
+
+    Args:
+        text (str): El texto a componer.
+        font (pygame.font.Font): La fuente a usar.
+        color (tuple): El color del texto en formato RGB.
+        ancho_disponible (int): Ancho desde la posición del texto hasta el borde derecho de la superficie de destino.
+
+    Returns:
+        pygame.Surface | None: El bloque de texto, o None si el texto no tiene ninguna línea.
     """
     # Divide el texto en líneas, y cada línea en palabras. Esto permite un control básico de salto de línea.
     words = [word.split(' ') for word in text.splitlines()]  # Lista 2D: cada sub-lista contiene palabras de una línea.
+    if len(words) == 0:
+        return None
+
     space = font.size(' ')[0] # Ancho de un espacio en la fuente actual.
-    
-    # Obtiene el ancho y alto máximo de la superficie para el ajuste de texto.
-    max_width, max_height = surface.get_size()
-    
-    x, y = pos # Coordenadas iniciales para dibujar el texto.
 
+    # Primera pasada: calcula la posición de cada palabra dentro del bloque.
+    ubicaciones = [] # Lista de tuplas (superficie de la palabra, (x, y)).
+    x, y = 0, 0
     for line in words: # Itera sobre cada línea de texto.
         for word in line: # Itera sobre cada palabra en la línea.
-            word_surface = font.render(word, False, color) # Renderiza la palabra en una superficie temporal.
-            word_width, word_height = word_surface.get_size() # Obtiene las dimensiones de la palabra renderizada.
-            
-            # Si la palabra actual excede el ancho máximo de la superficie, resetea la posición X y avanza a la siguiente línea.
-            if x + word_width >= max_width:
-                x = pos[0]    # Reinicia la posición X al inicio de la línea.
-                y += word_height # Mueve la posición Y hacia abajo para la nueva línea.
-            
-            surface.blit(word_surface, (x, y)) # Dibuja la palabra en la superficie principal.
+            word_surface = renderizar_palabra(font, word, color)
+            word_width, word_height = word_surface.get_size()
+
+            # Si la palabra actual excede el ancho disponible, resetea la posición X y avanza a la siguiente línea.
+            if x + word_width >= ancho_disponible:
+                x = 0
+                y += word_height
+
+            ubicaciones.append((word_surface, (x, y)))
             x += word_width + space # Avanza la posición X para la siguiente palabra, añadiendo un espacio.
-        
-        # Al final de cada línea (después de todas sus palabras), resetea X y avanza Y para la siguiente línea real.
-        x = pos[0]   # Reinicia X al inicio de la línea.
-        y += word_height # Mueve Y hacia abajo.
+
+        # Al final de cada línea real, resetea X y avanza Y.
+        x = 0
+        y += word_height
+
+    # Segunda pasada: dibuja las palabras en una superficie del tamaño justo.
+    # Como el texto se renderiza sin antialiasing, solo contiene píxeles del color del texto; el fondo se rellena
+    # con el color opuesto y se marca como transparente (colorkey), que es mucho más rápido de dibujar que un canal alfa.
+    ancho = max(1, max(pos[0] + sup.get_width() for sup, pos in ubicaciones))
+    alto = max(1, max(pos[1] + sup.get_height() for sup, pos in ubicaciones))
+    color_fondo = tuple(255 - componente for componente in color[:3])
+    bloque = pygame.Surface((ancho, alto))
+    bloque.fill(color_fondo)
+    bloque.blits(ubicaciones, doreturn=False)
+    bloque.set_colorkey(color_fondo, pygame.RLEACCEL)
+
+    if pygame.display.get_surface() is not None: # convert() solo es posible con la ventana ya creada.
+        bloque = bloque.convert()
+    return bloque
+
+
+def mostrar_texto(surface: pygame.Surface, text: str, pos: tuple, font: pygame.font.Font, color: tuple = (0,0,0)) -> pygame.Rect:
+    """
+    Renderiza texto en una superficie de Pygame, con soporte básico para salto de línea y ajuste de ancho.
+
+    El texto se dibuja línea por línea, y las palabras se ajustan al ancho de la superficie.
+    El resultado se guarda en una caché (ver MAX_MEMORIA_CACHE_TEXTO), por lo que volver a dibujar
+    el mismo texto con la misma fuente y color cuesta un único blit.
+
+    Args:
+        surface (pygame.Surface): La superficie donde se dibujará el texto (ej. la pantalla, una superficie de botón).
+        text (str): El texto a renderizar.
+        pos (tuple): Una tupla (x, y) que indica la posición superior izquierda donde comenzar a dibujar el texto.
+        font (pygame.font.Font): El objeto de fuente de Pygame a usar para renderizar el texto.
+        color (tuple): El color del texto en formato RGB (por defecto, negro).
+
+    Returns:
+        pygame.Rect: El área de la superficie que fue modificada.
+    """
+    ancho_disponible = surface.get_width() - pos[0] # Espacio hasta el borde derecho, usado para el ajuste de línea.
+
+    clave = ("bloque", font, text, tuple(color), ancho_disponible)
+    bloque = _buscar_en_cache_texto(clave)
+    if bloque is None:
+        bloque = _componer_bloque_texto(text, font, color, ancho_disponible)
+        if bloque is None: # Texto vacío: no hay nada que dibujar.
+            return pygame.Rect(pos, (0, 0))
+        _guardar_en_cache_texto(clave, bloque)
+
+    return surface.blit(bloque, pos) # Dibuja el bloque completo en la superficie de destino.
 
 
 def mezclar_lista(lista_preguntas:list) -> None:
@@ -65,6 +211,56 @@ def mezclar_lista(lista_preguntas:list) -> None:
     random.shuffle(lista_preguntas) # Utiliza la función shuffle de random para mezclar la lista.
 
 
+def crear_permutacion(cantidad: int) -> dict:
+    """
+    Crea una permutación aleatoria de los índices 0..cantidad-1 que se genera de a un elemento.
+
+    Es un Fisher-Yates incremental: en lugar de mezclar una lista completa, cada llamada a
+    siguiente_de_permutacion elige el siguiente índice en O(1). Solo se guardan en 'intercambios'
+    las posiciones que ya fueron movidas, así que no se crea ni se copia ninguna lista de tamaño 'cantidad'.
+
+    Args:
+        cantidad (int): Cantidad de índices a permutar (por ejemplo, la cantidad de preguntas).
+
+    Returns:
+        dict: El estado de la permutación, con la 'cantidad', la cantidad de índices ya 'entregados'
+              y el diccionario de 'intercambios' {posición: índice que quedó en esa posición}.
+    """
+    return {"cantidad": cantidad, "entregados": 0, "intercambios": {}}
+
+
+def siguiente_de_permutacion(permutacion: dict) -> int:
+    """
+    Devuelve el siguiente índice de la permutación en O(1).
+
+    Cuando ya se entregaron todos los índices, empieza una permutación nueva (otra vuelta mezclada),
+    igual que cuando antes se volvía a mezclar la lista al llegar al final.
+
+    Args:
+        permutacion (dict): El estado creado con crear_permutacion.
+
+    Returns:
+        int: Un índice entre 0 y cantidad-1 que no se repite hasta completar la vuelta.
+    """
+    if permutacion["entregados"] == permutacion["cantidad"]: # Terminó la vuelta: empieza otra.
+        permutacion["entregados"] = 0
+        permutacion["intercambios"] = {}
+
+    intercambios = permutacion["intercambios"]
+    posicion = permutacion["entregados"]
+    elegida = random.randrange(posicion, permutacion["cantidad"]) # Posición elegida entre las que faltan.
+
+    # Intercambia (de forma virtual) la posición actual con la elegida: las posiciones sin entrada valen su propio índice.
+    indice = intercambios.pop(elegida, elegida)
+    if elegida != posicion:
+        intercambios[elegida] = intercambios.pop(posicion, posicion)
+    else:
+        intercambios.pop(posicion, None)
+
+    permutacion["entregados"] = posicion + 1
+    return indice
+
+
 def verificar_respuesta(datos_juego:dict, pregunta_actual:dict, respuesta_usuario:int) -> bool:
     """
     Verifica si la respuesta seleccionada por el jugador es correcta.
@@ -1,84 +1,145 @@
 import pygame
-import random 
+import random # Generador propio para los comodines (ver generador_comodines).
 from .constantes import * # Importa todas las constantes, como dimensiones de ventana, colores, etc.
-from .preguntas import * # Importa la lista de preguntas (asumo que es 'lista_preguntas').
+from .preguntas import * # Importa el banco de preguntas ('lista_preguntas').
 from .funciones import * # Importa las funciones utilitarias como mostrar_texto, verificar_respuesta, etc.
+from .regiones import redibujado_completo, marcar_region # Para informar qué regiones de la ventana cambiaron.
+from .recursos import cargar_imagen # Carga de imágenes compartidas y ya convertidas.
+from .sonidos import * # Efectos de sonido (click, error y acierto).
+from .motor_juego import EstadoJuego, aplicar_accion # Reglas del juego, sin Pygame (ver motor_juego.py).
+from . import planificador # Para el paso de los segundos y los mensajes con duración.
 
 # --- Inicialización de elementos visuales y de juego ---
 
 # Carga y escala la imagen de fondo principal del juego.
-fondo = pygame.image.load("assets/images/fondo_juego.png") 
-fondo = pygame.transform.scale(fondo, VENTANA) # VENTANA es una constante (ancho, alto)
+fondo = cargar_imagen("assets/images/fondo_juego.png", VENTANA) # VENTANA es una constante (ancho, alto)
 
 # Configuración del cuadro donde se muestra la pregunta.
+# Esta superficie es solo el fondo: el texto de cada pregunta se dibuja sobre una copia (ver componer_cuadro_pregunta).
 cuadro_pregunta = {}
-cuadro_pregunta["superficie"] = pygame.image.load("assets/images/fondo_pregunta.png")
-cuadro_pregunta["superficie"] = pygame.transform.scale(cuadro_pregunta["superficie"], TAMAÑO_IMAGEN_PREG)
+cuadro_pregunta["superficie"] = cargar_imagen("assets/images/fondo_pregunta.png", TAMAÑO_IMAGEN_PREG, alpha=True)
 cuadro_pregunta["rectangulo"] = cuadro_pregunta["superficie"].get_rect() # Obtiene el rectángulo para posicionamiento
 
-# Configuración de los comodines (imágenes y estado inicial).
-# Cada comodín tiene una bandera para saber si ya fue usado y si es visible.
-
-# Comodín "Pasar Pregunta"
-bandera_comodin_usado_pasar = False # True si ya se usó en la partida actual.
-bandera_comodin_visible_pasar = True # True si el icono del comodín debe mostrarse.
-imagen_comodin_pasar = pygame.image.load("assets/images/pasar.png") 
-imagen_comodin_pasar = pygame.transform.scale(imagen_comodin_pasar, TAMAÑO_IMAGEN_COMODIN)
+# Configuración de los comodines: imagen y posición de cada uno. Si están disponibles o no, lo indica el estado del juego.
 
 # Comodín "Doble Puntuación" (X2)
-bandera_comodin_x2_usado = False # True si ya se usó en la partida actual.
-bandera_comodin_x2_visible = True # True si el icono del comodín debe mostrarse.
-imagen_comodin_x2 = pygame.image.load("assets/images/x2.png") 
-imagen_comodin_x2 = pygame.transform.scale(imagen_comodin_x2, TAMAÑO_IMAGEN_COMODIN)
+imagen_comodin_x2 = cargar_imagen("assets/images/x2.png", TAMAÑO_IMAGEN_COMODIN, alpha=True)
+rect_comodin_x2 = imagen_comodin_x2.get_rect(topleft=(10, 25))
+
+# Comodín "Pasar Pregunta"
+imagen_comodin_pasar = cargar_imagen("assets/images/pasar.png", TAMAÑO_IMAGEN_COMODIN, alpha=True)
+rect_comodin_pasar = imagen_comodin_pasar.get_rect(topleft=(70, 25))
 
 # Comodín "Doble Chance" (permite un error sin perder vida)
-bandera_comodin_doble_chance_usado = False # True si ya se usó en la partida actual.
-bandera_comodin_doble_chance_visible = True # True si el icono del comodín debe mostrarse.
-# Esta bandera es crucial: True cuando el comodín está activo para la pregunta actual y el jugador tiene un intento extra.
-bandera_doble_chance_activa_pregunta = False 
-imagen_comodin_doble_chance = pygame.image.load("assets/images/doble_chance.png")
-imagen_comodin_doble_chance = pygame.transform.scale(imagen_comodin_doble_chance, TAMAÑO_IMAGEN_COMODIN)
+imagen_comodin_doble_chance = cargar_imagen("assets/images/doble_chance.png", TAMAÑO_IMAGEN_COMODIN, alpha=True)
+rect_comodin_doble_chance = imagen_comodin_doble_chance.get_rect(topleft=(130, 25))
 
 # Comodín "Bomba" (elimina dos opciones incorrectas)
-bandera_comodin_bomba_usado = False # True si ya se usó en la partida actual.
-bandera_comodin_bomba_visible = True # True si el icono del comodín debe mostrarse.
-imagen_comodin_bomba = pygame.image.load("assets/images/bomba.png") 
-imagen_comodin_bomba = pygame.transform.scale(imagen_comodin_bomba, TAMAÑO_IMAGEN_COMODIN)
+imagen_comodin_bomba = cargar_imagen("assets/images/bomba.png", TAMAÑO_IMAGEN_COMODIN, alpha=True)
+rect_comodin_bomba = imagen_comodin_bomba.get_rect(topleft=(190, 25))
+
+# Comodines en el orden en que se revisan los clics: (nombre en el motor, imagen, rectángulo).
+comodines = [("x2", imagen_comodin_x2, rect_comodin_x2),
+             ("pasar", imagen_comodin_pasar, rect_comodin_pasar),
+             ("doble_chance", imagen_comodin_doble_chance, rect_comodin_doble_chance),
+             ("bomba", imagen_comodin_bomba, rect_comodin_bomba)]
 
 
-# Lista para almacenar las superficies y rectángulos de las 4 cartas de respuesta.
+# Lista para almacenar los rectángulos de las 4 cartas de respuesta (sus superficies se componen por pregunta).
+opciones_coords = [(170, 325), (170, 450), (465, 325), (465, 450)] # Coordenadas para cada carta.
+opciones_nombres = ['OpcionA', 'OpcionB', 'OpcionC', 'OpcionD'] # Nombres de las claves en el diccionario de pregunta.
 cartas_respuestas = []
 for i in range(4):
     cuadro_respuesta = {}
-    cuadro_respuesta["superficie"] = pygame.Surface(TAMAÑO_RESPUESTA)
-    cuadro_respuesta["rectangulo"] = cuadro_respuesta["superficie"].get_rect()
+    cuadro_respuesta["rectangulo"] = pygame.Rect(opciones_coords[i], TAMAÑO_RESPUESTA) # Posición fija de la carta.
     cartas_respuestas.append(cuadro_respuesta)
 
+# Carta vacía que se dibuja en lugar de una opción oculta (por Bomba o Doble Chance).
+carta_oculta = pygame.Surface(TAMAÑO_RESPUESTA)
+carta_oculta.fill(COLOR_AZUL) # Rellena con el mismo color de las cartas.
+
 # Definición de fuentes para el texto del juego.
 fuente_prgunta = pygame.font.SysFont("Arial Narrow", 30)
 fuente_respuesta = pygame.font.SysFont("Arial Narrow", 30)
 fuente_texto = pygame.font.SysFont("Arial Narrow", 25)
+fuente_vida_extra = pygame.font.SysFont("Arial Narrow", 45, bold=True) # Fuente para el mensaje de vida extra.
 
 # --- Banderas y variables de estado del juego ---
 
 # Para el mensaje de "Vida Extra"
 bandera_vida_extra_visible = False # True si el mensaje de vida extra debe mostrarse.
-tiempo_fin_vida_extra_display = 0 # Momento en el que el mensaje de vida extra debe desaparecer.
+tarea_vida_extra = None # Tarea del planificador que oculta el mensaje de vida extra.
+
+# Cuadros de pregunta ya compuestos (cuadro de pregunta y cartas con su texto), por número de pregunta en el banco.
+# Se guardan como máximo el de la pregunta actual y el de la siguiente, que se prepara por adelantado.
+cuadros_preparados = {}
+
+# Carta de la respuesta elegida, pintada de verde o rojo: tupla (número de carta, superficie) o None.
+carta_resaltada = None
+
+# Tarea del planificador que termina de mostrar la respuesta elegida, o None si la pregunta actual todavía no se respondió.
+tarea_revelacion = None
+pasar_a_siguiente = False # True cuando terminó de mostrarse la respuesta y hay que pasar a la siguiente pregunta.
+
+# Acciones del motor que programó el planificador ("segundo" cada 1000 ms) y todavía no se aplicaron.
+acciones_programadas = []
+
+# Para el dibujado por regiones: lo que se mostró en el fotograma anterior.
+firma_escena_anterior = None # Resumen de la escena (pregunta, comodines, opciones visibles, mensajes).
+textos_hud_anteriores = [] # Textos de puntuación, vidas y tiempo dibujados.
+
+# Inicializa el orden de las preguntas: una permutación aleatoria de los números de pregunta
+# que se genera de a uno, sin mezclar ni copiar el banco (ver crear_permutacion).
+orden_preguntas = crear_permutacion(len(lista_preguntas))
+indice = siguiente_de_permutacion(orden_preguntas) # Número de la pregunta actual en el banco.
+indice_siguiente = siguiente_de_permutacion(orden_preguntas) # Número de la próxima pregunta, que se prepara por adelantado.
+
+# Estado de la partida (puntuación, vidas, tiempo, comodines, opciones visibles, racha de aciertos).
+# Solo aplicar_accion calcula estados nuevos; esta pantalla los guarda y los dibuja.
+estado_juego = EstadoJuego(int(lista_preguntas[indice]["RespuestaCorrecta"]))
+# Generador de los comodines Bomba y Doble Chance. Su semilla sale de random, así que el modo sin ventana
+# (que siembra random con --semilla) sigue siendo reproducible.
+generador_comodines = random.Random(random.getrandbits(64))
+
+
+def al_entrar() -> None:
+    """
+    Prepara la pantalla de juego cada vez que se entra a ella (ver pantallas.cambiar_pantalla):
+    programa el paso de los segundos, que corre solo mientras se está en esta pantalla.
+    Las tareas de la visita anterior ya fueron canceladas al salir.
+    """
+    global tarea_revelacion
+    global pasar_a_siguiente
+    global bandera_vida_extra_visible
+
+    acciones_programadas.clear()
+    planificador.programar(1000, descontar_segundo, repetir_cada_ms=1000, dueño="juego")
+    bandera_vida_extra_visible = False
+    tarea_revelacion = None
+    pasar_a_siguiente = estado_juego.respondida # Si la partida anterior terminó con una respuesta, se empieza con otra pregunta.
+
 
-# Inicializa la lista de preguntas y el índice de la pregunta actual.
-mezclar_lista(lista_preguntas) # Mezcla las preguntas al inicio del juego.
-indice = 0 # Índice de la pregunta actual en la lista mezclada.
+def descontar_segundo() -> None:
+    """
+    Tarea del planificador: pasó un segundo de partida.
+    """
+    acciones_programadas.append(("segundo",))
 
-respuestas_correctas_consecutivas = 0 # Contador para la vida extra (cada 5 aciertos).
-bandera_respuesta = False # True cuando el jugador ha respondido (correcta o incorrecta), para una pausa.
 
-# Controla qué opciones de respuesta están visibles (usado por el comodín Bomba).
-opciones_visibles = [True, True, True, True] 
+def ocultar_vida_extra() -> None:
+    """
+    Tarea del planificador: oculta el mensaje de "¡VIDA EXTRA!".
+    """
+    global bandera_vida_extra_visible
+    bandera_vida_extra_visible = False
+
 
-# --- Configuración del temporizador de Pygame ---
-clock = pygame.time.Clock() # Objeto Clock para controlar los FPS.
-evento_tiempo_1s = pygame.USEREVENT # Define un evento de usuario para el temporizador.
-pygame.time.set_timer(evento_tiempo_1s, 1000) # Dispara evento_tiempo_1s cada 1000 ms (1 segundo).
+def terminar_revelacion() -> None:
+    """
+    Tarea del planificador: terminó de mostrarse la respuesta elegida.
+    """
+    global pasar_a_siguiente
+    pasar_a_siguiente = True
 
 
 def mostrar_juego(pantalla: pygame.Surface, cola_eventos: list[pygame.event.Event], datos_juego: dict) -> str:
@@ -96,258 +157,318 @@ def mostrar_juego(pantalla: pygame.Surface, cola_eventos: list[pygame.event.Even
     '''
 
     global indice
-    global bandera_respuesta
-    global respuestas_correctas_consecutivas
-    global bandera_comodin_x2_usado
-    global bandera_comodin_x2_visible
-    global bandera_comodin_usado_pasar
-    global bandera_comodin_visible_pasar
-    global bandera_vida_extra_visible
-    global tiempo_fin_vida_extra_display
-    global bandera_comodin_doble_chance_usado
-    global bandera_comodin_doble_chance_visible
-    global bandera_doble_chance_activa_pregunta
-    global bandera_comodin_bomba_usado
-    global bandera_comodin_bomba_visible
-    global opciones_visibles 
+    global indice_siguiente
+    global carta_resaltada
+    global tarea_revelacion
+    global pasar_a_siguiente
+    global estado_juego
     
     retorno = "juego" # Estado por defecto: se mantiene en la pantalla de juego.
-
-    for carta in cartas_respuestas:
-        carta["superficie"].fill(COLOR_AZUL)
-        
-    # Lógica para avanzar a la siguiente pregunta o manejar el estado post-respuesta.
-    if bandera_respuesta:
-        # Recarga la imagen del cuadro de pregunta para "limpiarla" visualmente (aunque mostrar_texto ya la sobrescribe).
-        cuadro_pregunta["superficie"] = pygame.image.load("assets/images/fondo_pregunta.png")
-        cuadro_pregunta["superficie"] = pygame.transform.scale(cuadro_pregunta["superficie"], TAMAÑO_IMAGEN_PREG)
-        pygame.time.delay(500) # Pequeña pausa para que el jugador vea el resultado antes de avanzar.
-        
-        # Solo avanzar a la siguiente pregunta si no se está en un intento de Doble Chance fallido.
-        # Si `bandera_doble_chance_activa_pregunta` es True, significa que el jugador falló el primer intento con el comodín activo y ahora tiene una segunda oportunidad en la misma pregunta.
-        if not bandera_doble_chance_activa_pregunta: 
-            if indice == len(lista_preguntas) - 1: # Si es la última pregunta de la lista...
-                indice = 0 # Reinicia el índice para volver al principio de la lista.
-                mezclar_lista(lista_preguntas) # Vuelve a mezclar las preguntas para una nueva ronda.
-            else:
-                indice += 1 # Avanza a la siguiente pregunta.
-            opciones_visibles = [True, True, True, True] # Restablece la visibilidad de todas las opciones.
-            bandera_respuesta = False # Resetea la bandera para la siguiente interacción con la nueva pregunta.
-        # Si bandera_doble_chance_activa_pregunta es True, el juego no avanza de pregunta, esperando el segundo intento del jugador.
-
-    # Obtiene la pregunta actual basándose en el índice.
-    pregunta_actual = lista_preguntas[indice]
+    cargar_datos_en_estado(datos_juego) # Otras pantallas pueden haber cambiado los datos (ej. al empezar otra partida).
+
+    # Lógica para avanzar a la siguiente pregunta una vez respondida (o pasada) la actual.
+    # La respuesta elegida se muestra durante DURACION_REVELACION_MS sin detener el bucle: mientras tanto
+    # se siguen leyendo eventos, corriendo el tiempo y dibujando fotogramas.
+    avanzar = pasar_a_siguiente
+    if avanzar:
+        carta_resaltada = None # La carta elegida vuelve a su color normal.
+        tarea_revelacion = None
+        pasar_a_siguiente = False
+
+        # Avanza a la siguiente pregunta. Al terminar la vuelta, la permutación empieza otra mezclada.
+        indice = indice_siguiente
+        indice_siguiente = siguiente_de_permutacion(orden_preguntas)
+
+    # Obtiene la pregunta actual basándose en el índice. Se lee del banco una sola vez, al componer su cuadro.
+    se_compuso_cuadro = preparar_cuadro_pregunta(indice) # Normalmente ya estaba preparado por adelantado.
+    pregunta_actual = cuadros_preparados[indice]["pregunta"]
+
+    if avanzar: # Se acaba de avanzar: el motor pasa a la nueva pregunta.
+        estado_juego, _ = aplicar_accion(estado_juego, ("siguiente", int(pregunta_actual["RespuestaCorrecta"])), generador_comodines)
+
+    # Primero se aplican los segundos que pasaron desde el fotograma anterior (si un fotograma se demoró, pueden ser varios).
+    terminada = False
+    while acciones_programadas and not terminada:
+        terminada = aplicar_y_mostrar(acciones_programadas.pop(0), pregunta_actual)
     
     # --- Manejo de eventos ---
     for evento in cola_eventos:
+        if terminada:
+            break # El resto de los eventos ya no corresponden a esta partida.
         if evento.type == pygame.QUIT:
             retorno = "salir" # El usuario cerró la ventana.
-        
-        # Evento del temporizador (cada 1 segundo).
-        elif evento.type == evento_tiempo_1s:
-            if datos_juego["tiempo"] > 0:
-                datos_juego["tiempo"] -= 1 # Decrementa el tiempo restante.
-            else: # Si el tiempo llega a cero
-                datos_juego["tiempo"] = 60 # Reinicia el tiempo (para la próxima partida).
-                retorno = "terminado" # La partida termina por tiempo.
-        
-        # Evento de clic del mouse.
         elif evento.type == pygame.MOUSEBUTTONDOWN:
-            mouse_pos = evento.pos # Obtiene las coordenadas (x, y) del clic.
-
-            # Define los rectángulos para la detección de clics en los comodines.
-            # Las posiciones (topleft) deben coincidir con donde se dibujan los comodines.
-            rect_comodin_x2 = imagen_comodin_x2.get_rect(topleft=(10, 25))
-            rect_comodin_pasar = imagen_comodin_pasar.get_rect(topleft=(70, 25))
-            rect_comodin_doble_chance = imagen_comodin_doble_chance.get_rect(topleft=(130, 25))
-            rect_comodin_bomba = imagen_comodin_bomba.get_rect(topleft=(190, 25))
-
-            # --- Lógica para el uso de comodines ---
-
-            # Comodín X2: Duplica la puntuación del próximo acierto.
-            if not bandera_comodin_x2_usado and rect_comodin_x2.collidepoint(mouse_pos):
-                bandera_comodin_x2_usado = True # Marca el comodín como usado.
-                bandera_comodin_x2_visible = False # Oculta el icono del comodín.
-                CLICK_SONIDO.play() # Reproduce sonido de clic.
-
-            # Comodín PASAR: Avanza a la siguiente pregunta sin penalización.
-            elif not bandera_comodin_usado_pasar and rect_comodin_pasar.collidepoint(mouse_pos):
-                CLICK_SONIDO.play()
-                bandera_respuesta = True # Activa la bandera para avanzar de pregunta.
-                bandera_comodin_usado_pasar = True # Marca el comodín como usado.
-                bandera_comodin_visible_pasar = False # Oculta el icono del comodín.
-                opciones_visibles = [True, True, True, True] # Restablece la visibilidad de opciones.
-
-            # Comodín DOBLE CHANCE: Permite un error en la pregunta actual.
-            elif not bandera_comodin_doble_chance_usado and rect_comodin_doble_chance.collidepoint(mouse_pos):
-                CLICK_SONIDO.play()
-                bandera_comodin_doble_chance_usado = True # Marca el comodín como usado para la partida.
-                bandera_comodin_doble_chance_visible = False # Oculta el icono.
-                bandera_doble_chance_activa_pregunta = True # Activa la doble chance para la pregunta actual.
-                
-            # Comodín BOMBA: Elimina dos opciones incorrectas.
-            elif not bandera_comodin_bomba_usado and rect_comodin_bomba.collidepoint(mouse_pos):
-                CLICK_SONIDO.play()
-                bandera_comodin_bomba_usado = True # Marca el comodín como usado.
-                bandera_comodin_bomba_visible = False # Oculta el icono.
-                
-                respuesta_correcta_num = int(pregunta_actual["RespuestaCorrecta"]) - 1 # Obtiene el índice de la respuesta correcta (0-3).
-
-                # Crea una lista de índices de opciones incorrectas.
-                # Excluye el índice de la respuesta correcta.
-                indices_incorrectos = [i for i in range(4) if i != respuesta_correcta_num]
-                
-                # Si hay al menos dos opciones incorrectas para eliminar...
-                if len(indices_incorrectos) >= 2: 
-                    # Selecciona 2 índices únicos aleatorios de las opciones incorrectas.
-                    indices_a_eliminar = random.sample(indices_incorrectos, 2)
-                    for idx in indices_a_eliminar:
-                        opciones_visibles[idx] = False # Marca estas opciones como no visibles.
-                # Si no hay suficientes opciones incorrectas para eliminar (ej. 0 o 1), no hace nada.
-
-            # --- Lógica para seleccionar respuestas (solo si no se ha respondido ya a la pregunta) ---
-            if not bandera_respuesta: 
-                for i in range(len(cartas_respuestas)):
-                    # Solo procesa el clic si la opción es visible y el mouse colisiona con su rectángulo.
-                    if opciones_visibles[i] and cartas_respuestas[i]['rectangulo'].collidepoint(mouse_pos): 
-                        respuesta_usuario = (i + 1) # La respuesta del usuario es el índice + 1.
-
-                        # Verifica si la respuesta del usuario es correcta.
-                        if verificar_respuesta(datos_juego, pregunta_actual, respuesta_usuario):
-                            respuestas_correctas_consecutivas += 1 # Incrementa el contador de aciertos consecutivos.
-                            
-                            # Lógica para otorgar vida extra cada 5 aciertos consecutivos.
-                            if respuestas_correctas_consecutivas == 5:
-                                if datos_juego["vidas"] < 3: # Limita a un máximo de 3 vidas.
-                                    datos_juego["vidas"] += 1 # Otorga una vida extra.
-                                    # Activa y programa la visibilidad del mensaje de "Vida Extra".
-                                    global bandera_vida_extra_visible
-                                    global tiempo_fin_vida_extra_display
-                                    bandera_vida_extra_visible = True
-                                    tiempo_fin_vida_extra_display = pygame.time.get_ticks() + 2000 # Visible por 2 segundos.
-                                datos_juego["tiempo"] += 10 # Otorga 10 segundos extra de tiempo.
-                                respuestas_correctas_consecutivas = 0 # Reinicia el contador de aciertos consecutivos.
-                            
-                            # Aplica la puntuación, considerando el comodín X2.
-                            if bandera_comodin_x2_usado == True: 
-                                datos_juego["puntuacion"] += (datos_juego["acierto"] * 2) # Suma el doble de puntos.
-                                bandera_comodin_x2_usado = False # Desactiva el comodín X2 para la próxima pregunta.
-                            else:
-                                datos_juego["puntuacion"] += datos_juego["acierto"] # Suma puntos normales.
-                            
-                            ACIERTO_SONIDO.play() # Reproduce sonido de acierto.
-                            cartas_respuestas[i]['superficie'].fill(COLOR_VERDE) # Pinta la carta de verde.
-                            bandera_doble_chance_activa_pregunta = False # Desactiva doble chance si acertó (la consume).
-                            bandera_respuesta = True # Marca que se ha respondido, para avanzar de pregunta.
-
-                        else: # Respuesta Incorrecta
-                            # Si el comodín Doble Chance está activo para esta pregunta...
-                            if bandera_doble_chance_activa_pregunta: 
-                                # Este es el PRIMER intento INCORRECTO después de activar el comodín.
-                                bandera_doble_chance_activa_pregunta = False # Consume el comodín (ya no está activa la doble chance).
-                                ERROR_SONIDO.play() # Sonido de error, pero sin perder vida aún.
-                                
-                                # Oculta la opción incorrecta que acaba de seleccionar el jugador.
-                                opciones_visibles[i] = False 
-                                
-                                # Oculta OTRA opción incorrecta aleatoria (si hay suficientes).
-                                # Filtra las opciones que no son la correcta, no son la que acaba de seleccionar, y que todavía están visibles (no eliminadas por el comodín Bomba).
-                                opciones_restantes_incorrectas = [idx for idx in range(4) 
-                                                                  if idx != (int(pregunta_actual["RespuestaCorrecta"]) - 1) # No es la correcta
-                                                                  and idx != i # Ni la que acaba de seleccionar
-                                                                  and opciones_visibles[idx] # Y que esté visible
-                                                                 ]
-                                
-                                if len(opciones_restantes_incorrectas) >= 1:
-                                    idx_a_ocultar_extra = random.choice(opciones_restantes_incorrectas)
-                                    opciones_visibles[idx_a_ocultar_extra] = False
-                                
-                                # No se activa `bandera_respuesta` porque el juego espera un segundo intento.
-                                # La función debe continuar dibujando con las opciones ocultas.
-                                return retorno # Sale del bucle de eventos para esperar el siguiente clic.
-                            
-                            # Si no había doble chance activa, O si es el segundo intento y falló de nuevo...
-                            else: # No hay doble chance activa o ya se consumió el intento de doble chance.
-                                datos_juego["vidas"] -= 1 # Ahora sí pierde vida.
-                                if datos_juego["puntuacion"] > 0 : # Solo resta puntos si la puntuación es positiva.         
-                                    datos_juego["puntuacion"] -= datos_juego["fallo"] # Resta puntos por fallo.
-                                ERROR_SONIDO.play() # Reproduce sonido de error.
-                                cartas_respuestas[i]['superficie'].fill(COLOR_ROJO) # Pinta la carta de rojo.
-                                # `bandera_doble_chance_activa_pregunta` ya es False o se desactiva si lo hubiera hecho antes.
-                                bandera_respuesta = True # Marca que se ha respondido, para avanzar de pregunta.
-
-
-    # --- Lógica de fin de partida ---
-    if datos_juego["vidas"] == 0: # Si las vidas llegan a cero...
-        datos_juego["tiempo"] = 180 # Reinicia el tiempo (para la próxima partida, si aplica).
-        retorno = "terminado" # La partida termina por falta de vidas.
-    
-    # Si la partida ha terminado (ya sea por tiempo o vidas), reinicia todas las banderas de comodines y el estado de visibilidad de las opciones para la próxima partida.
-    if retorno == "terminado":
-        bandera_comodin_x2_usado = False 
-        bandera_comodin_x2_visible = True
-        bandera_comodin_usado_pasar = False
-        bandera_comodin_visible_pasar = True
-        bandera_comodin_doble_chance_usado = False
-        bandera_comodin_doble_chance_visible = True
-        bandera_comodin_bomba_usado = False
-        bandera_comodin_bomba_visible = True
-        bandera_doble_chance_activa_pregunta = False # Asegurarse de que no quede activa para la próxima partida.
-        opciones_visibles = [True, True, True, True] # Asegurarse de que las opciones estén visibles para la próxima partida.
+            accion = accion_de_clic(evento.pos) # Se usa un comodín o se elige una respuesta.
+            if accion is not None:
+                terminada = aplicar_y_mostrar(accion, pregunta_actual)
+
+    if terminada:
+        retorno = "terminado" # La partida termina por tiempo o por falta de vidas.
+        acciones_programadas.clear()
+
+    # Si la pregunta se acaba de responder (o pasar), empieza a mostrarse el resultado.
+    if estado_juego.respondida and tarea_revelacion is None and not pasar_a_siguiente:
+        tarea_revelacion = planificador.programar(DURACION_REVELACION_MS, terminar_revelacion, dueño="juego")
+
+    guardar_estado_en_datos(datos_juego)
 
     # --- Dibujado de elementos en pantalla ---
+    dibujar_pantalla_juego(pantalla, cuadros_preparados[indice], datos_juego)
 
-    # Dibuja la pregunta en el cuadro de pregunta.
-    mostrar_texto(cuadro_pregunta["superficie"], f'{pregunta_actual["Pregunta"]}', TAMAÑO_PREGUNTA, fuente_prgunta, COLOR_BLANCO)
-    
+    # Si en este fotograma no hubo que componer la pregunta actual, se aprovecha para preparar la siguiente.
+    if not se_compuso_cuadro:
+        preparar_cuadro_pregunta(indice_siguiente)
+
+    return retorno # Devuelve el estado actual del juego.
+
+
+def aplicar_y_mostrar(accion: tuple, pregunta_actual: dict) -> bool:
+    """
+    Aplica una acción al estado de la partida y traduce sus efectos en sonidos y en lo que se muestra.
+
+    Args:
+        accion (tuple): La acción del motor (ver motor_juego.py).
+        pregunta_actual (dict): La pregunta que se está mostrando.
+
+    Returns:
+        bool: True si la partida terminó (por tiempo o por falta de vidas).
+    """
+    global carta_resaltada
+    global bandera_vida_extra_visible
+    global tarea_vida_extra
+    global estado_juego
+
+    terminada = False
+    estado_juego, efectos = aplicar_accion(estado_juego, accion, generador_comodines)
+    for efecto in efectos:
+        if efecto == "comodin":
+            reproducir_efecto(CLICK_SONIDO) # Reproduce sonido de clic.
+        elif efecto == "acierto":
+            reproducir_efecto(ACIERTO_SONIDO) # Reproduce sonido de acierto.
+            carta_resaltada = (accion[1], componer_carta(pregunta_actual[opciones_nombres[accion[1]]], COLOR_VERDE)) # Pinta la carta de verde.
+        elif efecto == "error":
+            reproducir_efecto(ERROR_SONIDO) # Reproduce sonido de error.
+            carta_resaltada = (accion[1], componer_carta(pregunta_actual[opciones_nombres[accion[1]]], COLOR_ROJO)) # Pinta la carta de rojo.
+        elif efecto == "segunda_oportunidad":
+            reproducir_efecto(ERROR_SONIDO) # Sonido de error, pero sin perder vida: se espera el segundo intento.
+        elif efecto == "vida_extra":
+            # Muestra el mensaje de "Vida Extra" durante 2 segundos.
+            bandera_vida_extra_visible = True
+            planificador.cancelar(tarea_vida_extra)
+            tarea_vida_extra = planificador.programar(2000, ocultar_vida_extra, dueño="juego")
+        elif efecto == "fin_por_tiempo" or efecto == "fin_por_vidas":
+            terminada = True
+    return terminada
+
+
+def accion_de_clic(mouse_pos: tuple) -> tuple | None:
+    """
+    Traduce un clic a la acción del motor que le corresponde: usar un comodín o elegir una respuesta.
+    Los clics sobre comodines ya usados u opciones ocultas los descarta el motor.
+
+    Args:
+        mouse_pos (tuple): Coordenadas (x, y) del clic.
+
+    Returns:
+        tuple | None: La acción (ver motor_juego.py), o None si el clic no cayó sobre un comodín ni una carta
+                      o si se está mostrando el resultado de la pregunta anterior.
+    """
+    if estado_juego.respondida: # Mientras se muestra la respuesta elegida, los clics no tienen efecto.
+        return None
+
+    for nombre, _, rectangulo in comodines:
+        if rectangulo.collidepoint(mouse_pos) and getattr(estado_juego, nombre + "_disponible"):
+            return ("comodin", nombre)
+
+    for i in range(len(cartas_respuestas)):
+        if cartas_respuestas[i]['rectangulo'].collidepoint(mouse_pos):
+            return ("responder", i)
+    return None
+
+
+def cargar_datos_en_estado(datos_juego: dict) -> None:
+    """
+    Copia al estado del motor la puntuación, las vidas, el tiempo y los puntos por acierto y fallo de datos_juego.
+
+    Args:
+        datos_juego (dict): Diccionario compartido con el resto de las pantallas.
+    """
+    estado_juego.puntuacion = datos_juego["puntuacion"]
+    estado_juego.vidas = datos_juego["vidas"]
+    estado_juego.tiempo = datos_juego["tiempo"]
+    estado_juego.acierto = datos_juego["acierto"]
+    estado_juego.fallo = datos_juego["fallo"]
+
+
+def guardar_estado_en_datos(datos_juego: dict) -> None:
+    """
+    Copia a datos_juego la puntuación, las vidas y el tiempo del estado del motor, para las demás pantallas.
+
+    Args:
+        datos_juego (dict): Diccionario compartido con el resto de las pantallas.
+    """
+    datos_juego["puntuacion"] = estado_juego.puntuacion
+    datos_juego["vidas"] = estado_juego.vidas
+    datos_juego["tiempo"] = estado_juego.tiempo
+
+
+def obtener_textos_hud(datos_juego: dict) -> list:
+    """
+    Arma los textos de la información del juego (puntuación, vidas y tiempo) con su posición y color.
+
+    Args:
+        datos_juego (dict): Diccionario con el estado actual del juego.
+
+    Returns:
+        list: Lista de tuplas (texto, posición, color).
+    """
+    return [
+        (f"PUNTUACION: {datos_juego['puntuacion']}", (10, 10), COLOR_BLANCO),
+        (f"VIDAS: {datos_juego['vidas']}", (620, 45), COLOR_BLANCO),
+        (f"TIEMPO RESTANTE: {datos_juego['tiempo']}", (560, 20), COLOR_ROJO)
+    ]
+
+
+def componer_carta(texto: str, color_fondo: tuple) -> pygame.Surface:
+    """
+    Crea la superficie de una carta de respuesta con su texto ya dibujado.
+
+    Args:
+        texto (str): El texto de la opción de respuesta.
+        color_fondo (tuple): El color de fondo de la carta (azul normal, verde si acertó, rojo si falló).
+
+    Returns:
+        pygame.Surface: La carta compuesta.
+    """
+    carta = pygame.Surface(TAMAÑO_RESPUESTA)
+    carta.fill(color_fondo)
+    mostrar_texto(carta, f"{texto}", (20, 20), fuente_respuesta, COLOR_BLANCO)
+    return carta
+
+
+def componer_cuadro_pregunta(pregunta: dict) -> dict:
+    """
+    Compone una única vez el cuadro de pregunta y las cuatro cartas de respuesta de una pregunta,
+    para que en cada fotograma solo haya que dibujarlos en la pantalla.
+
+    Args:
+        pregunta (dict): La pregunta a componer.
+
+    Returns:
+        dict: Diccionario con la 'pregunta', la superficie del 'cuadro' y la lista de 'cartas'.
+    """
+    cuadro = cuadro_pregunta["superficie"].copy() # Copia del fondo, para no dibujar sobre la imagen original.
+    mostrar_texto(cuadro, f'{pregunta["Pregunta"]}', TAMAÑO_PREGUNTA, fuente_prgunta, COLOR_BLANCO)
+
+    cartas = []
+    for nombre_opcion in opciones_nombres:
+        cartas.append(componer_carta(pregunta[nombre_opcion], COLOR_AZUL))
+
+    return {"pregunta": pregunta, "cuadro": cuadro, "cartas": cartas}
+
+
+def preparar_cuadro_pregunta(indice_pregunta: int) -> bool:
+    """
+    Se asegura de que el cuadro de la pregunta indicada esté compuesto, descartando los que ya no se usan.
+
+    Args:
+        indice_pregunta (int): Número de la pregunta en el banco de preguntas.
+
+    Returns:
+        bool: True si hubo que componer el cuadro, False si ya estaba preparado.
+    """
+    if indice_pregunta in cuadros_preparados:
+        return False
+
+    # Solo se conservan el cuadro de la pregunta actual y el nuevo.
+    for indice_guardado in list(cuadros_preparados):
+        if indice_guardado != indice:
+            del cuadros_preparados[indice_guardado]
+
+    cuadros_preparados[indice_pregunta] = componer_cuadro_pregunta(lista_preguntas[indice_pregunta]) # Decodifica la pregunta desde el banco.
+    return True
+
+
+def dibujar_escena(pantalla: pygame.Surface, cuadro: dict, datos_juego: dict) -> None:
+    """
+    Dibuja todos los elementos de la pantalla de juego: fondo, pregunta, comodines, respuestas,
+    información del juego y, si corresponde, el mensaje de "¡VIDA EXTRA!".
+
+    Args:
+        pantalla (pygame.Surface): La superficie principal de la ventana del juego.
+        cuadro (dict): El cuadro ya compuesto de la pregunta que se está mostrando (ver componer_cuadro_pregunta).
+        datos_juego (dict): Diccionario con el estado actual del juego.
+    """
     # Dibuja el fondo y el cuadro de pregunta en la pantalla principal.
     pantalla.blit(fondo, (0, 0))
-    pantalla.blit(cuadro_pregunta["superficie"], (58, 74)) # Posición del cuadro de pregunta.
-    
-    # Dibuja los iconos de los comodines si están visibles.
-    if bandera_comodin_x2_visible == True:
-        pantalla.blit(imagen_comodin_x2, (10, 25)) # Posición del comodín X2.
+    pantalla.blit(cuadro["cuadro"], (58, 74)) # Posición del cuadro de pregunta.
     
-    if bandera_comodin_visible_pasar == True:
-        pantalla.blit(imagen_comodin_pasar, (70,25)) # Posición del comodín Pasar.
-
-    if bandera_comodin_doble_chance_visible:
-        pantalla.blit(imagen_comodin_doble_chance, (130, 25)) # Posición del comodín Doble Chance.
-    if bandera_comodin_bomba_visible:
-        pantalla.blit(imagen_comodin_bomba, (190, 25)) # Posición del comodín Bomba.
+    # Dibuja los iconos de los comodines que todavía no se usaron.
+    for nombre, imagen, rectangulo in comodines:
+        if getattr(estado_juego, nombre + "_disponible"):
+            pantalla.blit(imagen, rectangulo)
 
     # Dibuja las cartas de respuesta, solo si están marcadas como visibles.
-    opciones_coords = [(170, 325), (170, 450), (465, 325), (465, 450)] # Coordenadas para cada carta.
-    opciones_nombres = ['OpcionA', 'OpcionB', 'OpcionC', 'OpcionD'] # Nombres de las claves en el diccionario de pregunta.
-
     for i in range(4):
-        if opciones_visibles[i]: # Solo dibujar si la opción está marcada como visible.
-            # Dibuja el texto de la respuesta en la superficie de la carta.
-            mostrar_texto(cartas_respuestas[i]["superficie"], f"{pregunta_actual[opciones_nombres[i]]}", (20, 20), fuente_respuesta, COLOR_BLANCO)
-            # Dibuja la superficie de la carta en la pantalla y actualiza su rectángulo.
-            cartas_respuestas[i]['rectangulo'] = pantalla.blit(cartas_respuestas[i]['superficie'], opciones_coords[i])
+        if not estado_juego.opciones_visibles[i]:
+            # Si la opción no es visible (ej. eliminada por Bomba o Doble Chance), dibuja una carta vacía para "ocultarla".
+            pantalla.blit(carta_oculta, opciones_coords[i])
+        elif carta_resaltada is not None and carta_resaltada[0] == i:
+            pantalla.blit(carta_resaltada[1], opciones_coords[i]) # La respuesta elegida, en verde o rojo.
         else:
-            # Si la opción no es visible (ej. eliminada por Bomba o Doble Chance), dibuja una superficie del mismo color de fondo para "ocultarla" o dejar un espacio vacío.
-            temp_surface = pygame.Surface(TAMAÑO_RESPUESTA)
-            temp_surface.fill(COLOR_AZUL) # Rellena con el mismo color de las cartas.
-            pantalla.blit(temp_surface, opciones_coords[i])
-            # No se dibuja el texto de la opción si no es visible.
+            pantalla.blit(cuadro["cartas"][i], opciones_coords[i])
 
     # Dibuja la información del juego (puntuación, vidas, tiempo).
-    mostrar_texto(pantalla, f"PUNTUACION: {datos_juego["puntuacion"]}", (10, 10), fuente_texto, COLOR_BLANCO)
-    mostrar_texto(pantalla, f"VIDAS: {datos_juego['vidas']}", (620, 45), fuente_texto, COLOR_BLANCO) 
-    mostrar_texto(pantalla, f"TIEMPO RESTANTE: {datos_juego['tiempo']}", (560, 20), fuente_texto, COLOR_ROJO)
+    for texto, posicion, color in obtener_textos_hud(datos_juego):
+        mostrar_texto(pantalla, texto, posicion, fuente_texto, color)
     
-    # Lógica para mostrar el mensaje de "¡VIDA EXTRA!"
+    # Muestra el mensaje de "¡VIDA EXTRA!" mientras esté activo.
     if bandera_vida_extra_visible:
-        fuente_vida_extra = pygame.font.SysFont("Arial Narrow", 45, bold=True) # Fuente para el mensaje.
-        if pygame.time.get_ticks() < tiempo_fin_vida_extra_display: # Si el tiempo de display no ha terminado.
-            mensaje = "¡VIDA EXTRA!"
-            texto_ancho, texto_alto = fuente_vida_extra.size(mensaje)
-            pos_x = (VENTANA[0] - texto_ancho) // 2 # Centra el texto horizontalmente.
-            pos_y = (VENTANA[1] - texto_alto) // 2 # Centra el texto verticalmente.
-            mostrar_texto(pantalla, mensaje, (pos_x, pos_y), fuente_vida_extra, COLOR_VERDE)
-        else:
-            bandera_vida_extra_visible = False # Desactiva la bandera si el tiempo de display terminó.
-    
-    return retorno # Devuelve el estado actual del juego.
\ No newline at end of file
+        mensaje = "¡VIDA EXTRA!"
+        texto_ancho, texto_alto = fuente_vida_extra.size(mensaje)
+        pos_x = (VENTANA[0] - texto_ancho) // 2 # Centra el texto horizontalmente.
+        pos_y = (VENTANA[1] - texto_alto) // 2 # Centra el texto verticalmente.
+        mostrar_texto(pantalla, mensaje, (pos_x, pos_y), fuente_vida_extra, COLOR_VERDE)
+
+
+def dibujar_pantalla_juego(pantalla: pygame.Surface, cuadro: dict, datos_juego: dict) -> None:
+    """
+    Dibuja la pantalla de juego e informa las regiones modificadas.
+
+    Si cambió algo más que la información del juego (otra pregunta, una respuesta elegida, un comodín usado,
+    el mensaje de vida extra), se redibuja la escena completa. Si solo cambiaron la puntuación, las vidas o
+    el tiempo, se redibuja la escena recortada al área de esos textos.
+
+    Args:
+        pantalla (pygame.Surface): La superficie principal de la ventana del juego.
+        cuadro (dict): El cuadro ya compuesto de la pregunta que se está mostrando.
+        datos_juego (dict): Diccionario con el estado actual del juego.
+    """
+    global firma_escena_anterior
+    global textos_hud_anteriores
+
+    # Resumen de todo lo visible que no es la información del juego.
+    firma_escena = (indice, estado_juego.respondida, carta_resaltada, tuple(estado_juego.opciones_visibles),
+                    estado_juego.x2_disponible, estado_juego.pasar_disponible,
+                    estado_juego.doble_chance_disponible, estado_juego.bomba_disponible,
+                    bandera_vida_extra_visible)
+    textos_hud = obtener_textos_hud(datos_juego)
+
+    if redibujado_completo() or firma_escena != firma_escena_anterior:
+        dibujar_escena(pantalla, cuadro, datos_juego)
+        marcar_region(pantalla.get_rect())
+    else:
+        for i in range(len(textos_hud)):
+            texto, posicion, _ = textos_hud[i]
+            texto_anterior = textos_hud_anteriores[i][0]
+            if texto != texto_anterior:
+                # La región cubre el texto anterior (que hay que borrar) y el nuevo.
+                region = pygame.Rect(posicion, fuente_texto.size(texto_anterior))
+                region.union_ip(pygame.Rect(posicion, fuente_texto.size(texto)))
+                pantalla.set_clip(region) # Solo se modifican los píxeles dentro de la región.
+                dibujar_escena(pantalla, cuadro, datos_juego)
+                pantalla.set_clip(None)
+                marcar_region(region)
+
+    firma_escena_anterior = firma_escena
+    textos_hud_anteriores = textos_hud
\ No newline at end of file
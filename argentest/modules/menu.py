@@ -1,27 +1,29 @@
 import pygame
 from .constantes import * 
+from .sonidos import * # Efectos de sonido (click, error y acierto).
 from .funciones import mostrar_texto
+from .regiones import redibujado_completo
+from .recursos import cargar_imagen
+
+# Los cuatro botones comparten la misma imagen; el texto de cada uno se dibuja encima, en la pantalla.
+imagen_boton = cargar_imagen("assets/images/boton_menu.png", TAMAÑO_BOTON)
 
 lista_botones = []
 for i in range(4):
     boton = {}
-    boton["superficie"] = pygame.image.load("assets/images/boton_menu.png")
-    boton["superficie"] = pygame.transform.scale(boton["superficie"], TAMAÑO_BOTON)
+    boton["superficie"] = imagen_boton
     boton["rectangulo"] = boton["superficie"].get_rect()
     lista_botones.append(boton)
 
 boton_vidas = {}
 
-boton_vidas["superficie"] = pygame.image.load("assets/images/icono.png") 
-boton_vidas["superficie"] = pygame.transform.scale(boton_vidas["superficie"], TAMAÑO_BOTON_VOLUMEN)
+boton_vidas["superficie"] = cargar_imagen("assets/images/icono.png", TAMAÑO_BOTON_VOLUMEN)
 boton_vidas["rectangulo"] = boton_vidas["superficie"].get_rect()
 lista_botones.append(boton_vidas)
 
-fondo_menu = pygame.image.load("assets/images/fondo_menu.png")
-fondo_menu = pygame.transform.scale(fondo_menu,VENTANA)
+fondo_menu = cargar_imagen("assets/images/fondo_menu.png",VENTANA)
 
-imagen_titulo = pygame.image.load("assets/images/menu.png")
-imagen_titulo = pygame.transform.scale(imagen_titulo, (270, 270))
+imagen_titulo = cargar_imagen("assets/images/menu.png", (270, 270), alpha=True)
 
 fuente_menu = pygame.font.SysFont("Small Fonts", 32)
 texto_menu = fuente_menu.render("MENU", True, COLOR_BLANCO)
@@ -43,7 +45,7 @@ def mostrar_menu(pantalla:pygame.Surface,cola_eventos:list[pygame.event.Event])-
         if evento.type == pygame.MOUSEBUTTONDOWN:
             for i in range(len(lista_botones)):
                 if lista_botones[i]["rectangulo"].collidepoint(evento.pos):
-                    CLICK_SONIDO.play()
+                    reproducir_efecto(CLICK_SONIDO)
                     if i == BOTON_SALIR:
                         retorno = "salir"
                     elif i == BOTON_JUGAR:
@@ -57,20 +59,22 @@ def mostrar_menu(pantalla:pygame.Surface,cola_eventos:list[pygame.event.Event])-
         elif evento.type == pygame.QUIT:
             retorno = "salir"
 
-    pantalla.blit(fondo_menu,(0,0))
-    pantalla.blit(imagen_titulo,(260,-48))
-
-
-    lista_botones[0]["rectangulo"] = pantalla.blit(lista_botones[0]["superficie"],(225,135))
-    lista_botones[1]["rectangulo"] = pantalla.blit(lista_botones[1]["superficie"],(225,230))
-    lista_botones[2]["rectangulo"] = pantalla.blit(lista_botones[2]["superficie"],(225,325))
-    lista_botones[3]["rectangulo"] = pantalla.blit(lista_botones[3]["superficie"],(225,420))
-    lista_botones[4]["rectangulo"] = pantalla.blit(lista_botones[4]["superficie"],(10,20))
-
-    mostrar_texto(lista_botones[0]["superficie"],"JUGAR",(140,40),fuente_menu,COLOR_BLANCO)
-    mostrar_texto(lista_botones[1]["superficie"],"CONFIGURACION",(85,40),fuente_menu,COLOR_BLANCO)
-    mostrar_texto(lista_botones[2]["superficie"],"PUNTUACIONES",(91,40),fuente_menu,COLOR_BLANCO)
-    mostrar_texto(lista_botones[3]["superficie"],"SALIR",(145,40),fuente_menu,COLOR_BLANCO)
+    # El menú no cambia entre fotogramas: solo se dibuja al entrar a la pantalla.
+    if redibujado_completo():
+        pantalla.blit(fondo_menu,(0,0))
+        pantalla.blit(imagen_titulo,(260,-48))
+
+        lista_botones[0]["rectangulo"] = pantalla.blit(lista_botones[0]["superficie"],(225,135))
+        lista_botones[1]["rectangulo"] = pantalla.blit(lista_botones[1]["superficie"],(225,230))
+        lista_botones[2]["rectangulo"] = pantalla.blit(lista_botones[2]["superficie"],(225,325))
+        lista_botones[3]["rectangulo"] = pantalla.blit(lista_botones[3]["superficie"],(225,420))
+        lista_botones[4]["rectangulo"] = pantalla.blit(lista_botones[4]["superficie"],(10,20))
+
+        # El texto de cada botón se dibuja en la pantalla, relativo a la posición del botón.
+        mostrar_texto(pantalla,"JUGAR",(225 + 140,135 + 40),fuente_menu,COLOR_BLANCO)
+        mostrar_texto(pantalla,"CONFIGURACION",(225 + 85,230 + 40),fuente_menu,COLOR_BLANCO)
+        mostrar_texto(pantalla,"PUNTUACIONES",(225 + 91,325 + 40),fuente_menu,COLOR_BLANCO)
+        mostrar_texto(pantalla,"SALIR",(225 + 145,420 + 40),fuente_menu,COLOR_BLANCO)
 
 
     return retorno
\ No newline at end of file
@@ -0,0 +1,301 @@
+"""
+Módulo del motor de reglas del juego.
+
+Contiene el estado de una partida (EstadoJuego) y la función aplicar_accion, que aplica una acción
+(responder, usar un comodín, pasar a la siguiente pregunta o descontar un segundo) y devuelve el
+estado nuevo y los efectos que produjo. No modifica el estado recibido, y todo el azar (comodines Bomba
+y Doble Chance) sale del generador que se le pasa: el mismo estado, la misma acción y un generador en el
+mismo punto dan siempre el mismo resultado. No usa Pygame ni dibuja nada: la pantalla de juego (juego.py)
+traduce los clics en acciones, reproduce los sonidos según los efectos y dibuja el estado. Así las mismas
+reglas pueden ejecutarse millones de veces en simulaciones o bots.
+
+Acciones (tuplas):
+    ("segundo",)                      Pasa un segundo del temporizador.
+    ("comodin", nombre)               Usa un comodín: "x2", "pasar", "doble_chance" o "bomba".
+    ("responder", opcion)             Elige una opción de respuesta (0 a 3).
+    ("siguiente", respuesta_correcta) Pasa a la siguiente pregunta, cuya respuesta correcta es 1 a 4.
+
+Efectos (strings): "comodin", "acierto", "error", "segunda_oportunidad", "vida_extra",
+"bonus_tiempo", "fin_por_tiempo" y "fin_por_vidas".
+
+Las reglas se verifican, sin Pygame, con:
+    python -m modules.motor_juego
+"""
+
+import random # Solo para verificar_reglas: el juego y las simulaciones pasan su propio generador.
+from .constantes import * # Reglas del juego: vidas, puntos, duración de la partida y rachas.
+
+
+class EstadoJuego:
+    """
+    Estado completo de una partida. Usa __slots__: no tiene diccionario propio, así que crear y
+    copiar estados es barato.
+    """
+
+    __slots__ = ("puntuacion", "vidas", "tiempo", "acierto", "fallo",
+                 "respuesta_correcta", "respondida", "opciones_visibles", "racha",
+                 "x2_disponible", "x2_activo", "pasar_disponible",
+                 "doble_chance_disponible", "doble_chance_activa", "bomba_disponible")
+
+    def __init__(self, respuesta_correcta: int = 1, puntuacion: int = 0, vidas: int = CANTIDAD_VIDAS,
+                 tiempo: int = TIEMPO_PARTIDA, acierto: int = PUNTUACION_ACIERTO, fallo: int = PUNTUACION_ERROR):
+        """
+        Args:
+            respuesta_correcta (int): Respuesta correcta (1 a 4) de la primera pregunta.
+            puntuacion (int): Puntuación inicial.
+            vidas (int): Vidas iniciales.
+            tiempo (int): Segundos de partida.
+            acierto (int): Puntos por respuesta correcta.
+            fallo (int): Puntos que se restan por respuesta incorrecta.
+        """
+        self.puntuacion = puntuacion
+        self.vidas = vidas
+        self.tiempo = tiempo
+        self.acierto = acierto
+        self.fallo = fallo
+        self.respuesta_correcta = respuesta_correcta
+        self.respondida = False # True cuando la pregunta actual ya se respondió (o se pasó).
+        self.opciones_visibles = [True, True, True, True] # Opciones no eliminadas por Bomba o Doble Chance.
+        self.racha = 0 # Aciertos acumulados para la vida extra. Como en las reglas originales, los errores no la reinician.
+        reiniciar_comodines(self)
+
+    def copiar(self) -> "EstadoJuego":
+        """
+        Devuelve una copia independiente del estado (incluida la lista de opciones visibles).
+
+        Returns:
+            EstadoJuego: La copia.
+        """
+        copia = EstadoJuego.__new__(EstadoJuego) # Sin pasar por __init__: todos los campos se copian abajo.
+        for campo in EstadoJuego.__slots__:
+            setattr(copia, campo, getattr(self, campo))
+        copia.opciones_visibles = list(self.opciones_visibles)
+        return copia
+
+
+def reiniciar_comodines(estado: EstadoJuego) -> None:
+    """
+    Deja los cuatro comodines disponibles y sin efecto activo, y todas las opciones visibles (al terminar una partida).
+    Modifica el estado recibido: aplicar_accion solo la usa sobre su copia.
+
+    Args:
+        estado (EstadoJuego): El estado a modificar.
+    """
+    estado.x2_disponible = True
+    estado.x2_activo = False # True desde que se usa X2 hasta el siguiente acierto.
+    estado.pasar_disponible = True
+    estado.doble_chance_disponible = True
+    estado.doble_chance_activa = False # True si el próximo error en la pregunta actual no resta vida.
+    estado.bomba_disponible = True
+    estado.opciones_visibles = [True, True, True, True]
+
+
+def _usar_comodin(estado: EstadoJuego, nombre: str, rng, efectos: list) -> None:
+    """
+    Aplica el uso de un comodín, si todavía está disponible.
+    """
+    if nombre == "x2" and estado.x2_disponible:
+        # Duplica la puntuación del próximo acierto. Se puede usar una sola vez por partida.
+        estado.x2_disponible = False
+        estado.x2_activo = True
+    elif nombre == "pasar" and estado.pasar_disponible:
+        # Da la pregunta por respondida sin penalización, para avanzar a la siguiente.
+        estado.pasar_disponible = False
+        estado.respondida = True
+        estado.opciones_visibles = [True, True, True, True]
+        estado.doble_chance_activa = False # Si no, la pregunta no avanzaría nunca.
+    elif nombre == "doble_chance" and estado.doble_chance_disponible:
+        # Permite un error en la pregunta actual.
+        estado.doble_chance_disponible = False
+        estado.doble_chance_activa = True
+    elif nombre == "bomba" and estado.bomba_disponible:
+        # Elimina dos opciones incorrectas al azar.
+        estado.bomba_disponible = False
+        respuesta_correcta_num = estado.respuesta_correcta - 1
+        indices_incorrectos = [i for i in range(4) if i != respuesta_correcta_num]
+        for idx in rng.sample(indices_incorrectos, 2):
+            estado.opciones_visibles[idx] = False
+    else:
+        return # Comodín ya usado: el clic no tiene efecto.
+    efectos.append("comodin")
+
+
+def _responder(estado: EstadoJuego, opcion: int, rng, efectos: list) -> None:
+    """
+    Aplica la elección de una opción de respuesta, si la pregunta no se respondió y la opción está visible.
+    """
+    if estado.respondida or not estado.opciones_visibles[opcion]:
+        return
+
+    respuesta_correcta_num = estado.respuesta_correcta - 1
+    if opcion == respuesta_correcta_num:
+        estado.racha += 1
+        # Cada RACHA_VIDA_EXTRA aciertos: una vida extra (sin superar MAX_VIDAS) y segundos extra.
+        if estado.racha == RACHA_VIDA_EXTRA:
+            if estado.vidas < MAX_VIDAS:
+                estado.vidas += 1
+                efectos.append("vida_extra")
+            estado.tiempo += BONUS_TIEMPO_RACHA
+            efectos.append("bonus_tiempo")
+            estado.racha = 0
+
+        # Aplica la puntuación, considerando el comodín X2.
+        if estado.x2_activo:
+            estado.puntuacion += estado.acierto * 2
+            estado.x2_activo = False
+        else:
+            estado.puntuacion += estado.acierto
+
+        estado.doble_chance_activa = False # Un acierto consume la doble chance.
+        estado.respondida = True
+        efectos.append("acierto")
+
+    elif estado.doble_chance_activa:
+        # Primer error con la doble chance activa: no resta vida, pero oculta la opción elegida
+        # y otra opción incorrecta que siga visible, y espera un segundo intento.
+        estado.doble_chance_activa = False
+        estado.opciones_visibles[opcion] = False
+        opciones_restantes_incorrectas = [idx for idx in range(4)
+                                          if idx != respuesta_correcta_num and idx != opcion and estado.opciones_visibles[idx]]
+        if len(opciones_restantes_incorrectas) >= 1:
+            estado.opciones_visibles[rng.choice(opciones_restantes_incorrectas)] = False
+        efectos.append("segunda_oportunidad")
+
+    else:
+        estado.vidas -= 1
+        if estado.puntuacion > 0: # Solo resta puntos si la puntuación es positiva.
+            estado.puntuacion -= estado.fallo
+        estado.respondida = True
+        efectos.append("error")
+
+        if estado.vidas == 0:
+            estado.tiempo = TIEMPO_PARTIDA # Reinicia el tiempo para la próxima partida.
+            reiniciar_comodines(estado)
+            efectos.append("fin_por_vidas")
+
+
+def aplicar_accion(estado: EstadoJuego, accion: tuple, rng) -> tuple:
+    """
+    Aplica una acción al estado de la partida y devuelve el estado nuevo y los efectos que produjo.
+    El estado recibido no se modifica.
+
+    Args:
+        estado (EstadoJuego): El estado de la partida.
+        accion (tuple): La acción a aplicar (ver la documentación del módulo).
+        rng (random.Random): Generador de números aleatorios para Bomba y Doble Chance.
+
+    Returns:
+        tuple: (EstadoJuego nuevo, lista de efectos (strings), vacía si la acción no tuvo efecto).
+    """
+    estado = estado.copiar()
+    efectos = []
+    tipo = accion[0]
+
+    if tipo == "segundo":
+        if estado.tiempo > 0:
+            estado.tiempo -= 1
+        else:
+            # Se acabó el tiempo. Como en las reglas originales, la próxima partida empieza con 60 segundos.
+            estado.tiempo = 60
+            reiniciar_comodines(estado)
+            efectos.append("fin_por_tiempo")
+
+    elif tipo == "comodin":
+        _usar_comodin(estado, accion[1], rng, efectos)
+
+    elif tipo == "responder":
+        _responder(estado, accion[1], rng, efectos)
+
+    elif tipo == "siguiente":
+        estado.respuesta_correcta = accion[1]
+        estado.respondida = False
+        estado.opciones_visibles = [True, True, True, True]
+
+    else:
+        raise ValueError(f"Acción desconocida: {accion!r}")
+
+    return estado, efectos
+
+
+def _aplicar_varias(estado: EstadoJuego, acciones: list, rng) -> tuple:
+    """
+    Aplica varias acciones seguidas y devuelve el estado final y los efectos de la última.
+    """
+    efectos = []
+    for accion in acciones:
+        estado, efectos = aplicar_accion(estado, accion, rng)
+    return estado, efectos
+
+
+def verificar_reglas() -> None:
+    """
+    Verifica las reglas principales sin Pygame: que aplicar_accion no modifica el estado recibido y es
+    reproducible, la vida extra y el bonus de tiempo de la racha, X2, Doble Chance, Bomba, Pasar y los
+    finales por tiempo y por vidas. Lanza AssertionError si alguna regla no se cumple.
+    """
+    rng = random.Random(0)
+    inicial = EstadoJuego(respuesta_correcta=1, vidas=1)
+
+    # El estado recibido no cambia, y el mismo generador en el mismo punto da el mismo resultado.
+    nuevo, efectos = aplicar_accion(inicial, ("segundo",), rng)
+    assert inicial.tiempo == TIEMPO_PARTIDA and nuevo.tiempo == TIEMPO_PARTIDA - 1 and efectos == []
+    con_bomba_1, _ = aplicar_accion(inicial, ("comodin", "bomba"), random.Random(7))
+    con_bomba_2, _ = aplicar_accion(inicial, ("comodin", "bomba"), random.Random(7))
+    assert con_bomba_1.opciones_visibles == con_bomba_2.opciones_visibles
+    assert inicial.opciones_visibles == [True, True, True, True] and inicial.bomba_disponible
+
+    # Racha: al acierto número RACHA_VIDA_EXTRA, una vida extra y BONUS_TIEMPO_RACHA segundos.
+    acciones = [("responder", 0), ("siguiente", 1)] * (RACHA_VIDA_EXTRA - 1) + [("responder", 0)]
+    estado, efectos = _aplicar_varias(inicial, acciones, rng)
+    assert efectos == ["vida_extra", "bonus_tiempo", "acierto"], efectos
+    assert estado.vidas == 2 and estado.tiempo == TIEMPO_PARTIDA + BONUS_TIEMPO_RACHA and estado.racha == 0
+    assert estado.puntuacion == RACHA_VIDA_EXTRA * PUNTUACION_ACIERTO
+    # Con MAX_VIDAS vidas no hay vida extra, pero sí bonus de tiempo.
+    estado, efectos = _aplicar_varias(EstadoJuego(respuesta_correcta=1, vidas=MAX_VIDAS), acciones, rng)
+    assert efectos == ["bonus_tiempo", "acierto"] and estado.vidas == MAX_VIDAS
+
+    # X2: duplica solo el próximo acierto.
+    estado, efectos = _aplicar_varias(inicial, [("comodin", "x2"), ("responder", 0)], rng)
+    assert efectos == ["acierto"] and estado.puntuacion == 2 * PUNTUACION_ACIERTO and not estado.x2_activo
+    estado, _ = _aplicar_varias(estado, [("siguiente", 1), ("responder", 0)], rng)
+    assert estado.puntuacion == 3 * PUNTUACION_ACIERTO
+    estado, efectos = aplicar_accion(estado, ("comodin", "x2"), rng) # Ya usado: sin efecto.
+    assert efectos == [] and not estado.x2_activo
+
+    # Doble Chance: el primer error no resta vida y deja visibles la correcta y una incorrecta.
+    estado, efectos = _aplicar_varias(inicial, [("comodin", "doble_chance"), ("responder", 2)], rng)
+    assert efectos == ["segunda_oportunidad"] and estado.vidas == 1 and not estado.respondida
+    assert estado.opciones_visibles[0] and not estado.opciones_visibles[2] and sum(estado.opciones_visibles) == 2
+    opcion_incorrecta = [i for i in range(1, 4) if estado.opciones_visibles[i]][0]
+    estado, efectos = aplicar_accion(estado, ("responder", opcion_incorrecta), rng) # El segundo error sí resta vida.
+    assert "error" in efectos and estado.vidas == 0
+
+    # Bomba: oculta dos opciones incorrectas, nunca la correcta; una sola vez por partida.
+    estado, efectos = aplicar_accion(EstadoJuego(respuesta_correcta=3), ("comodin", "bomba"), rng)
+    assert efectos == ["comodin"] and estado.opciones_visibles[2] and sum(estado.opciones_visibles) == 2
+    estado, efectos = aplicar_accion(estado, ("comodin", "bomba"), rng)
+    assert efectos == []
+    opcion_oculta = estado.opciones_visibles.index(False)
+    estado, efectos = aplicar_accion(estado, ("responder", opcion_oculta), rng) # Las opciones ocultas no se pueden elegir.
+    assert efectos == []
+
+    # Pasar: da la pregunta por respondida sin restar vida ni puntos.
+    estado, efectos = aplicar_accion(inicial, ("comodin", "pasar"), rng)
+    assert efectos == ["comodin"] and estado.respondida and estado.vidas == 1 and estado.puntuacion == 0
+
+    # Fin por tiempo: con 0 segundos, el siguiente segundo termina la partida; la próxima empieza con 60
+    # segundos (como en las reglas originales) y con los comodines disponibles.
+    estado, _ = aplicar_accion(inicial, ("comodin", "x2"), rng)
+    estado.tiempo = 0
+    estado, efectos = aplicar_accion(estado, ("segundo",), rng)
+    assert efectos == ["fin_por_tiempo"] and estado.tiempo == 60 and estado.x2_disponible
+
+    # Fin por vidas: la puntuación no baja de cero por un error, y el tiempo vuelve a TIEMPO_PARTIDA.
+    estado, _ = aplicar_accion(inicial, ("segundo",), rng)
+    estado, efectos = aplicar_accion(estado, ("responder", 1), rng)
+    assert efectos == ["error", "fin_por_vidas"] and estado.puntuacion == 0 and estado.tiempo == TIEMPO_PARTIDA
+
+
+if __name__ == "__main__":
+    verificar_reglas()
+    print("Reglas verificadas.")
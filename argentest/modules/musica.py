@@ -0,0 +1,126 @@
+"""
+Módulo de la música de fondo.
+
+Las pistas de PISTAS_MUSICA se decodifican una sola vez, en un hilo aparte, a sonidos (pygame.mixer.Sound)
+que quedan en memoria, y cada pista suena en su propio canal reservado. Así, al pasar del menú al juego
+(o al revés) no hay que volver a abrir el MP3 con pygame.mixer.music.load, que frenaba el fotograma, y la
+pista anterior se desvanece mientras aparece la nueva (fundido cruzado de DURACION_FUNDIDO_MS) en lugar
+de cortarse de golpe.
+
+Si se pide una pista que todavía no terminó de decodificarse (por ejemplo, la del menú al arrancar el
+juego), se reproduce como antes con pygame.mixer.music, leyéndola del archivo.
+
+El volumen se aplica solo cuando cambia, no en cada fotograma.
+"""
+
+import threading # Para decodificar las pistas sin frenar el bucle principal.
+import warnings  # Para avisar, desde el hilo de decodificación, que una pista se leerá del archivo.
+import pygame
+from .constantes import * # Importa todas las constantes, incluyendo PISTAS_MUSICA y DURACION_FUNDIDO_MS.
+from . import sonidos # Reserva los canales de la música (los primeros) y los de los efectos.
+
+_sonidos = {} # Pistas ya decodificadas: {nombre: pygame.mixer.Sound}. Las agrega el hilo de decodificación.
+_canales = {} # Canal reservado de cada pista: {nombre: pygame.mixer.Channel}.
+_hilo_decodificacion = None
+
+_pista_actual = None # Nombre de la pista que está sonando (None si no suena ninguna).
+_pista_en_archivo = False # True si la pista actual se está leyendo del archivo con pygame.mixer.music.
+_volumen_aplicado = None # Último volumen aplicado (escala de Pygame, 0.0 a 1.0).
+
+
+def iniciar(decodificar: bool = True) -> None:
+    """
+    Toma el canal reservado de cada pista y comienza a decodificarlas en un hilo aparte.
+    Requiere que pygame.mixer ya esté inicializado.
+
+    Args:
+        decodificar (bool): Si es False, las pistas no se decodifican y siempre se leen del archivo
+                            (el modo sin ventana lo usa para no medir la decodificación).
+    """
+    global _hilo_decodificacion
+    for numero, nombre in enumerate(PISTAS_MUSICA):
+        _canales[nombre] = pygame.mixer.Channel(numero)
+
+    if decodificar:
+        _hilo_decodificacion = threading.Thread(target=_decodificar_pistas, name="decodificar_musica", daemon=True)
+        _hilo_decodificacion.start()
+
+
+def _decodificar_pistas() -> None:
+    """
+    Decodifica las pistas, en el orden de PISTAS_MUSICA (la del menú primero, que es la que suena al arrancar).
+    Se ejecuta en el hilo de decodificación; Pygame libera el GIL mientras decodifica.
+    """
+    for nombre, ruta in PISTAS_MUSICA.items():
+        try:
+            _sonidos[nombre] = pygame.mixer.Sound(ruta)
+        except pygame.error as e:
+            warnings.warn(f"No se pudo decodificar la música '{ruta}', se leerá del archivo: {e}", RuntimeWarning)
+
+
+def reproducir(nombre: str | None) -> None:
+    """
+    Hace sonar una pista, con fundido cruzado desde la que estaba sonando. Si ya está sonando, no hace nada.
+
+    Args:
+        nombre (str | None): Nombre de la pista (una clave de PISTAS_MUSICA), o None para que no suene ninguna.
+    """
+    global _pista_actual, _pista_en_archivo
+    if nombre == _pista_actual:
+        return
+
+    # La pista anterior se desvanece en su canal (o en pygame.mixer.music) mientras aparece la nueva.
+    if _pista_en_archivo:
+        pygame.mixer.music.fadeout(DURACION_FUNDIDO_MS)
+    elif _pista_actual is not None:
+        canal = _canales[_pista_actual]
+        if canal.get_volume() > 0:
+            canal.fadeout(DURACION_FUNDIDO_MS)
+        else:
+            # Recién empezaba a aparecer y todavía no se oye: SDL_mixer ignora el fadeout de un canal con volumen 0.
+            canal.stop()
+
+    _pista_actual = nombre
+    _pista_en_archivo = False
+    if nombre is None:
+        return
+
+    volumen = _volumen_aplicado if _volumen_aplicado is not None else 1.0
+    sonido = _sonidos.get(nombre)
+    if sonido is not None:
+        canal = _canales[nombre]
+        canal.set_volume(volumen)
+        canal.play(sonido, loops=-1, fade_ms=DURACION_FUNDIDO_MS) # Reproducir en bucle infinito.
+    else:
+        # Todavía no se decodificó: se lee del archivo, como antes. Si la pista anterior también venía del archivo,
+        # se corta: pygame.mixer.music no puede empezar otra pista sin esperar a que termine de desvanecerse.
+        pygame.mixer.music.stop()
+        pygame.mixer.music.load(PISTAS_MUSICA[nombre])
+        pygame.mixer.music.set_volume(volumen)
+        pygame.mixer.music.play(-1, fade_ms=DURACION_FUNDIDO_MS) # Reproducir en bucle infinito.
+        _pista_en_archivo = True
+
+
+def ajustar_volumen(volumen: float) -> None:
+    """
+    Aplica el volumen de la música, solo si cambió desde la última vez.
+
+    Args:
+        volumen (float): Volumen en la escala de Pygame (0.0 a 1.0).
+    """
+    global _volumen_aplicado
+    if volumen == _volumen_aplicado:
+        return
+    _volumen_aplicado = volumen
+    for canal in _canales.values():
+        canal.set_volume(volumen)
+    pygame.mixer.music.set_volume(volumen)
+
+
+def detener() -> None:
+    """
+    Espera a que termine la decodificación, si todavía está en curso. Se llama antes de pygame.quit(),
+    para no cerrar el mezclador mientras el hilo lo usa.
+    """
+    if _hilo_decodificacion is not None:
+        _hilo_decodificacion.join()
@@ -0,0 +1,102 @@
+"""
+Módulo de registro de pantallas.
+
+Cada pantalla del juego se registra por el nombre de ventana que usa el bucle principal.
+El módulo de una pantalla (con sus imágenes, fuentes y datos) recién se importa la primera vez
+que se la necesita, para que el juego muestre el menú lo antes posible al arrancar.
+
+Al cambiar de pantalla se cancelan las tareas programadas por la pantalla anterior (ver planificador.py)
+y, si el módulo de la pantalla nueva define una función al_entrar(), se la llama.
+"""
+
+import importlib # Necesario para importar los módulos de las pantallas por nombre.
+from . import planificador # Para cancelar las tareas de la pantalla que se deja.
+
+# Registro de pantallas: nombre de ventana -> (módulo, función que la muestra, si la función recibe datos_juego).
+REGISTRO_PANTALLAS = {
+    "menu": (".menu", "mostrar_menu", False),
+    "juego": (".juego", "mostrar_juego", True),
+    "configuraciones": (".configuracion", "mostrar_configuracion", True),
+    "rankings": (".rankings", "mostrar_rankings", False),
+    "terminado": (".terminado", "mostrar_fin_juego", True),
+}
+
+# Funciones de las pantallas ya importadas, por nombre de ventana.
+_pantallas_cargadas = {}
+
+# Módulos de las pantallas ya importadas, por nombre de ventana.
+_modulos_pantallas = {}
+
+
+def cargar_pantalla(nombre: str):
+    """
+    Importa (solo la primera vez) el módulo de una pantalla y devuelve la función que la muestra.
+
+    Args:
+        nombre (str): Nombre de la ventana (ej. "menu", "juego").
+
+    Returns:
+        function | None: La función de la pantalla, o None si no hay ninguna registrada con ese nombre.
+    """
+    funcion = _pantallas_cargadas.get(nombre)
+    if funcion is None and nombre in REGISTRO_PANTALLAS:
+        nombre_modulo, nombre_funcion, _ = REGISTRO_PANTALLAS[nombre]
+        modulo = importlib.import_module(nombre_modulo, __package__)
+        funcion = getattr(modulo, nombre_funcion)
+        _pantallas_cargadas[nombre] = funcion
+        _modulos_pantallas[nombre] = modulo
+    return funcion
+
+
+def pantalla_cargada(nombre: str) -> bool:
+    """
+    Indica si el módulo de una pantalla ya fue importado.
+
+    Args:
+        nombre (str): Nombre de la ventana.
+
+    Returns:
+        bool: True si la pantalla ya está lista para mostrarse.
+    """
+    return nombre in _pantallas_cargadas
+
+
+def mostrar_pantalla(nombre: str, pantalla, cola_eventos: list, datos_juego: dict) -> str:
+    """
+    Muestra un fotograma de la pantalla indicada, cargándola si todavía no se había usado.
+
+    Args:
+        nombre (str): Nombre de la ventana actual.
+        pantalla (pygame.Surface): La superficie principal de la ventana del juego.
+        cola_eventos (list): Lista de eventos de Pygame ocurridos en el fotograma actual.
+        datos_juego (dict): Diccionario con los datos y el estado actual del juego.
+
+    Returns:
+        str: El nombre de la ventana a mostrar en el siguiente fotograma. Si no hay ninguna pantalla
+             registrada con ese nombre, se devuelve el mismo nombre.
+    """
+    funcion = cargar_pantalla(nombre)
+    if funcion is None:
+        return nombre
+
+    if REGISTRO_PANTALLAS[nombre][2]: # La pantalla necesita los datos del juego.
+        return funcion(pantalla, cola_eventos, datos_juego)
+    return funcion(pantalla, cola_eventos)
+
+
+def cambiar_pantalla(anterior: str | None, nueva: str) -> None:
+    """
+    Avisa que se pasó de una pantalla a otra: cancela las tareas programadas por la anterior
+    y llama a la función al_entrar() de la nueva, si la tiene.
+
+    Args:
+        anterior (str | None): Nombre de la ventana que se deja (None al arrancar).
+        nueva (str): Nombre de la ventana a la que se entra.
+    """
+    if anterior is not None:
+        planificador.cancelar_de(anterior)
+
+    if cargar_pantalla(nueva) is not None:
+        al_entrar = getattr(_modulos_pantallas[nueva], "al_entrar", None)
+        if al_entrar is not None:
+            al_entrar()
@@ -0,0 +1,195 @@
+"""
+Módulo del perfilador de fotogramas.
+
+El bucle principal marca el final de cada sección del fotograma (lectura de eventos, música, dibujado
+de la pantalla, presentación en la ventana) y este módulo guarda cuánto tardó cada una, por pantalla:
+    - Los últimos MUESTRAS_PERFILADOR tiempos, para calcular los percentiles 50, 95 y 99.
+    - Un histograma de todos los tiempos desde que empezó el juego.
+
+Con F3 se muestra u oculta una superposición con los percentiles de la pantalla actual. Al salir del
+juego, todo se exporta a RUTA_PERFIL_CSV.
+"""
+
+import os     # Para crear el directorio del CSV.
+import csv    # Formato de la exportación.
+import time   # Reloj de alta resolución para medir las secciones.
+import bisect # Para ubicar cada tiempo en su intervalo del histograma.
+from collections import deque # Ventana de los tiempos más recientes.
+import pygame
+from .constantes import * # Importa todas las constantes, incluyendo MUESTRAS_PERFILADOR y RUTA_PERFIL_CSV.
+from .regiones import solicitar_redibujado_completo, marcar_region # Para dibujar y borrar la superposición.
+from .sin_ventana import percentil # Percentil de una lista ordenada.
+
+# Secciones del fotograma, en el orden en que ocurren, más el fotograma completo.
+SECCIONES = ("eventos", "musica", "pantalla", "superposicion", "presentacion", "total")
+
+# Límites superiores (en milisegundos) de los intervalos del histograma; el último intervalo no tiene límite.
+LIMITES_HISTOGRAMA_MS = (1, 2, 4, 8, 16, 33, 50, 100)
+
+# Mediciones: {(pantalla, sección): {"recientes", "histograma", "cantidad", "suma", "maximo"}}.
+mediciones = {}
+
+_pantalla_medida = None # Pantalla que se estaba mostrando al comenzar el fotograma.
+_inicio_fotograma = 0.0
+_ultima_marca = 0.0
+
+# Superposición (F3).
+_superposicion_visible = False
+_superficie_superposicion = None # Texto ya dibujado; se actualiza cada INTERVALO_SUPERPOSICION_MS.
+_proxima_actualizacion = 0
+_fuente = None # Se crea al mostrar la superposición por primera vez.
+INTERVALO_SUPERPOSICION_MS = 500
+
+
+def iniciar_fotograma(pantalla: str) -> None:
+    """
+    Comienza a medir un fotograma. Se llama después de esperar al reloj, para no medir la espera.
+
+    Args:
+        pantalla (str): La pantalla que se va a mostrar ("menu", "juego", etc.).
+    """
+    global _pantalla_medida, _inicio_fotograma, _ultima_marca
+    _pantalla_medida = pantalla
+    _inicio_fotograma = _ultima_marca = time.perf_counter()
+
+
+def marcar(seccion: str) -> None:
+    """
+    Registra el tiempo transcurrido desde la marca anterior como la duración de una sección.
+
+    Args:
+        seccion (str): La sección que acaba de terminar (una de SECCIONES).
+    """
+    global _ultima_marca
+    ahora = time.perf_counter()
+    _registrar(seccion, ahora - _ultima_marca)
+    _ultima_marca = ahora
+
+
+def terminar_fotograma() -> None:
+    """
+    Registra la duración del fotograma completo.
+    """
+    _registrar("total", time.perf_counter() - _inicio_fotograma)
+
+
+def _registrar(seccion: str, duracion: float) -> None:
+    """
+    Agrega una duración (en segundos) a las mediciones de la pantalla actual.
+    """
+    clave = (_pantalla_medida, seccion)
+    medicion = mediciones.get(clave)
+    if medicion is None:
+        medicion = {"recientes": deque(maxlen=MUESTRAS_PERFILADOR),
+                    "histograma": [0] * (len(LIMITES_HISTOGRAMA_MS) + 1),
+                    "cantidad": 0, "suma": 0.0, "maximo": 0.0}
+        mediciones[clave] = medicion
+
+    milisegundos = duracion * 1000
+    medicion["recientes"].append(milisegundos)
+    medicion["histograma"][bisect.bisect_left(LIMITES_HISTOGRAMA_MS, milisegundos)] += 1
+    medicion["cantidad"] += 1
+    medicion["suma"] += milisegundos
+    if milisegundos > medicion["maximo"]:
+        medicion["maximo"] = milisegundos
+
+
+def percentiles_recientes(pantalla: str, seccion: str) -> tuple | None:
+    """
+    Calcula los percentiles 50, 95 y 99 (en milisegundos) de los tiempos recientes de una sección.
+
+    Args:
+        pantalla (str): La pantalla.
+        seccion (str): La sección.
+
+    Returns:
+        tuple | None: (p50, p95, p99), o None si todavía no hay mediciones.
+    """
+    medicion = mediciones.get((pantalla, seccion))
+    if medicion is None or len(medicion["recientes"]) == 0:
+        return None
+    ordenados = sorted(medicion["recientes"])
+    return (percentil(ordenados, 50), percentil(ordenados, 95), percentil(ordenados, 99))
+
+
+def superposicion_visible() -> bool:
+    """
+    Indica si la superposición con los tiempos está visible. Mientras lo está, las pantallas se redibujan completas.
+    """
+    return _superposicion_visible
+
+
+def alternar_superposicion() -> None:
+    """
+    Muestra u oculta la superposición (tecla F3).
+    """
+    global _superposicion_visible, _proxima_actualizacion
+    _superposicion_visible = not _superposicion_visible
+    _proxima_actualizacion = 0 # Al mostrarla, se actualiza enseguida.
+    solicitar_redibujado_completo() # Al ocultarla, la pantalla se redibuja entera para borrarla.
+
+
+def _componer_superposicion() -> pygame.Surface:
+    """
+    Dibuja el texto de la superposición: los percentiles de cada sección de la pantalla actual.
+    """
+    global _fuente
+    if _fuente is None:
+        _fuente = pygame.font.SysFont("Courier New", 15)
+
+    lineas = [f"{_pantalla_medida} (F3)", f"{'':<14}{'p50':>7}{'p95':>7}{'p99':>7} ms"]
+    for seccion in SECCIONES:
+        valores = percentiles_recientes(_pantalla_medida, seccion)
+        if valores is not None:
+            lineas.append(f"{seccion:<14}{valores[0]:>7.2f}{valores[1]:>7.2f}{valores[2]:>7.2f}")
+
+    alto_linea = _fuente.get_linesize()
+    ancho = max(_fuente.size(linea)[0] for linea in lineas) + 10
+    superficie = pygame.Surface((ancho, alto_linea * len(lineas) + 10))
+    superficie.fill(COLOR_NEGRO)
+    superficie.set_alpha(200) # Semitransparente, para que se vea la pantalla de fondo.
+    for i in range(len(lineas)):
+        superficie.blit(_fuente.render(lineas[i], True, COLOR_VERDE), (5, 5 + i * alto_linea))
+    return superficie
+
+
+def dibujar_superposicion(pantalla: pygame.Surface) -> None:
+    """
+    Dibuja la superposición en la esquina inferior derecha e informa su región. El texto se vuelve a
+    calcular cada INTERVALO_SUPERPOSICION_MS, no en cada fotograma.
+
+    Args:
+        pantalla (pygame.Surface): La superficie principal de la ventana del juego.
+    """
+    global _superficie_superposicion, _proxima_actualizacion
+    ahora = pygame.time.get_ticks()
+    if _superficie_superposicion is None or ahora >= _proxima_actualizacion:
+        _superficie_superposicion = _componer_superposicion()
+        _proxima_actualizacion = ahora + INTERVALO_SUPERPOSICION_MS
+
+    rect = _superficie_superposicion.get_rect(bottomright=pantalla.get_rect().bottomright)
+    marcar_region(pantalla.blit(_superficie_superposicion, rect))
+
+
+def exportar_csv(ruta: str = RUTA_PERFIL_CSV) -> None:
+    """
+    Exporta las mediciones a un archivo CSV: una fila por pantalla y sección, con la cantidad de fotogramas,
+    la media y el máximo de todos ellos, los percentiles de los últimos MUESTRAS_PERFILADOR y el histograma.
+
+    Args:
+        ruta (str): Ruta del archivo CSV.
+    """
+    if len(mediciones) == 0:
+        return
+    directorio = os.path.dirname(ruta)
+    if directorio != "":
+        os.makedirs(directorio, exist_ok=True)
+
+    intervalos = [f"hasta_{limite}ms" for limite in LIMITES_HISTOGRAMA_MS] + [f"mas_de_{LIMITES_HISTOGRAMA_MS[-1]}ms"]
+    with open(ruta, "w", newline="", encoding="utf-8") as archivo:
+        escritor = csv.writer(archivo)
+        escritor.writerow(["pantalla", "seccion", "fotogramas", "media_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"] + intervalos)
+        for (pantalla, seccion), medicion in mediciones.items():
+            p50, p95, p99 = percentiles_recientes(pantalla, seccion)
+            escritor.writerow([pantalla, seccion, medicion["cantidad"], f"{medicion['suma'] / medicion['cantidad']:.3f}",
+                               f"{p50:.3f}", f"{p95:.3f}", f"{p99:.3f}", f"{medicion['maximo']:.3f}"] + medicion["histograma"])
@@ -0,0 +1,123 @@
+"""
+Módulo del planificador de tareas.
+
+Reemplaza a los temporizadores de Pygame (pygame.time.set_timer) y a las comparaciones sueltas con
+pygame.time.get_ticks(): las pantallas programan funciones para que se ejecuten una vez, dentro de
+cierta cantidad de milisegundos, o periódicamente. El bucle principal llama a ejecutar_vencidas()
+en cada fotograma, y puede consultar cuánto falta para la próxima tarea (tiempo_hasta_proxima) para
+esperar exactamente hasta entonces.
+
+Las tareas se guardan en un montículo (heap) ordenado por vencimiento. Las tareas periódicas se
+reprograman a partir de su vencimiento anterior, no del momento en que se ejecutaron, así que no
+acumulan atraso: si un fotograma se demora, en el siguiente se ejecutan las repeticiones pendientes.
+
+Cada tarea puede tener un dueño (el nombre de una pantalla): al salir de esa pantalla, el bucle
+principal cancela sus tareas (ver pantallas.cambiar_pantalla).
+
+El tiempo se lee de pygame.time.get_ticks(), salvo que se indique otro reloj con usar_reloj (el modo sin
+ventana usa un reloj virtual que avanza lo mismo en cada fotograma, ver sin_ventana.RelojVirtual).
+"""
+
+import heapq # Montículo binario para tener siempre a mano la tarea que vence primero.
+import pygame
+
+# Montículo de tareas programadas: tuplas (vencimiento en ms, número de tarea).
+_monticulo = []
+
+# Tareas vigentes, por número: {"funcion", "intervalo" (ms o None), "dueño", "vencimiento"}.
+# Las tareas canceladas se quitan de aquí y su entrada del montículo se descarta al llegar a la raíz.
+_tareas = {}
+
+_siguiente_numero = 0
+
+_reloj = pygame.time.get_ticks # Función sin argumentos que devuelve el tiempo actual, en milisegundos.
+
+
+def usar_reloj(reloj) -> None:
+    """
+    Cambia el reloj con que se programan y vencen las tareas. Debe llamarse antes de programar la primera.
+
+    Args:
+        reloj (function): Función sin argumentos que devuelve el tiempo actual, en milisegundos.
+    """
+    global _reloj
+    _reloj = reloj
+
+
+def programar(demora_ms: int, funcion, repetir_cada_ms: int | None = None, dueño: str | None = None) -> int:
+    """
+    Programa una función para que se ejecute dentro de demora_ms milisegundos.
+
+    Args:
+        demora_ms (int): Milisegundos hasta la (primera) ejecución.
+        funcion (function): La función a ejecutar, sin argumentos.
+        repetir_cada_ms (int | None): Si se indica, la función se vuelve a ejecutar cada esa cantidad de milisegundos.
+        dueño (str | None): Nombre de la pantalla dueña de la tarea; al salir de ella la tarea se cancela.
+
+    Returns:
+        int: El número de la tarea, para cancelarla.
+    """
+    global _siguiente_numero
+    numero = _siguiente_numero
+    _siguiente_numero += 1
+
+    vencimiento = _reloj() + demora_ms
+    _tareas[numero] = {"funcion": funcion, "intervalo": repetir_cada_ms, "dueño": dueño, "vencimiento": vencimiento}
+    heapq.heappush(_monticulo, (vencimiento, numero))
+    return numero
+
+
+def cancelar(numero: int | None) -> None:
+    """
+    Cancela una tarea programada (si ya se ejecutó o ya se canceló, no hace nada).
+
+    Args:
+        numero (int | None): El número devuelto por programar.
+    """
+    _tareas.pop(numero, None)
+
+
+def cancelar_de(dueño: str) -> None:
+    """
+    Cancela todas las tareas de un dueño.
+
+    Args:
+        dueño (str): El nombre de la pantalla.
+    """
+    for numero in [numero for numero, tarea in _tareas.items() if tarea["dueño"] == dueño]:
+        del _tareas[numero]
+
+
+def ejecutar_vencidas() -> None:
+    """
+    Ejecuta las tareas cuyo vencimiento ya pasó, en orden de vencimiento, y reprograma las periódicas.
+    """
+    ahora = _reloj()
+    while _monticulo and _monticulo[0][0] <= ahora:
+        vencimiento, numero = heapq.heappop(_monticulo)
+        tarea = _tareas.get(numero)
+        if tarea is None or tarea["vencimiento"] != vencimiento: # Cancelada.
+            continue
+
+        if tarea["intervalo"] is None:
+            del _tareas[numero]
+        else:
+            tarea["vencimiento"] = vencimiento + tarea["intervalo"] # Desde el vencimiento: sin atraso acumulado.
+            heapq.heappush(_monticulo, (tarea["vencimiento"], numero))
+        tarea["funcion"]()
+
+
+def tiempo_hasta_proxima() -> int | None:
+    """
+    Indica cuánto falta para que venza la próxima tarea.
+
+    Returns:
+        int | None: Milisegundos hasta la próxima tarea (0 si ya venció), o None si no hay tareas programadas.
+    """
+    while _monticulo:
+        vencimiento, numero = _monticulo[0]
+        tarea = _tareas.get(numero)
+        if tarea is not None and tarea["vencimiento"] == vencimiento:
+            return max(0, vencimiento - _reloj())
+        heapq.heappop(_monticulo) # Tarea cancelada: se descarta.
+    return None
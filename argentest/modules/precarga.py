@@ -0,0 +1,89 @@
+"""
+Módulo de precarga de imágenes.
+
+La primera vez que se entra a una pantalla se cargan todas sus imágenes en un mismo fotograma
+(decodificar el PNG o leerlo de la caché en disco, escalarlo y convertirlo). Para que ese fotograma
+no se demore, mientras el menú está en reposo (ver MODO_REPOSO) un hilo aparte prepara por adelantado
+las imágenes de las pantallas a las que es más probable pasar: primero el juego, después los rankings.
+
+El hilo solo usa recursos.preparar_imagen, que no toca el estado compartido del módulo de recursos.
+Las imágenes listas pasan al hilo principal por una cola, y el bucle principal las registra en cada
+fotograma (entregar_precargadas); cuando la pantalla se carga, cargar_imagen ya las encuentra.
+"""
+
+import queue     # Para pasar las imágenes preparadas del hilo de precarga al hilo principal.
+import threading # Para preparar las imágenes sin frenar el bucle principal.
+import pygame
+from .constantes import * # Importa todas las constantes, incluyendo los tamaños de los elementos gráficos.
+from .recursos import preparar_imagen, imagen_cargada, agregar_imagen_precargada
+
+# Imágenes de cada pantalla, en el orden en que se precargan: (pantalla, [(ruta, tamaño, alpha), ...]).
+# Deben coincidir con las que la pantalla pide a cargar_imagen; si alguna no coincide, simplemente
+# se carga al entrar a la pantalla, como antes.
+IMAGENES_A_PRECARGAR = [
+    ("juego", [
+        ("assets/images/fondo_juego.png", VENTANA, False),
+        ("assets/images/fondo_pregunta.png", TAMAÑO_IMAGEN_PREG, True),
+        ("assets/images/x2.png", TAMAÑO_IMAGEN_COMODIN, True),
+        ("assets/images/pasar.png", TAMAÑO_IMAGEN_COMODIN, True),
+        ("assets/images/doble_chance.png", TAMAÑO_IMAGEN_COMODIN, True),
+        ("assets/images/bomba.png", TAMAÑO_IMAGEN_COMODIN, True),
+    ]),
+    ("rankings", [
+        ("assets/images/fondo_rankings.png", VENTANA, False),
+        ("assets/images/boton_volver.png", TAMAÑO_BOTON_VOLUMEN, True),
+    ]),
+]
+
+_cola_precargadas = queue.Queue() # Imágenes listas: tuplas (ruta, tamaño, alpha, superficie, leida_de_cache).
+_detener = threading.Event() # Le pide al hilo de precarga que termine antes de la próxima imagen.
+_hilo_precarga = None
+
+
+def iniciar_precarga() -> None:
+    """
+    Comienza a precargar las imágenes en un hilo aparte. Solo tiene efecto la primera vez que se llama.
+    """
+    global _hilo_precarga
+    if _hilo_precarga is None:
+        _hilo_precarga = threading.Thread(target=_precargar, name="precarga_imagenes", daemon=True)
+        _hilo_precarga.start()
+
+
+def _precargar() -> None:
+    """
+    Prepara las imágenes de IMAGENES_A_PRECARGAR que todavía no estén cargadas. Se ejecuta en el hilo de precarga.
+    """
+    for _, imagenes in IMAGENES_A_PRECARGAR:
+        for ruta, tamaño, alpha in imagenes:
+            if _detener.is_set():
+                return
+            if imagen_cargada(ruta, tamaño, alpha): # Ya la cargó otra pantalla (ej. boton_volver, desde configuración).
+                continue
+            try:
+                superficie, leida_de_cache = preparar_imagen(ruta, tamaño, alpha)
+            except (OSError, pygame.error): # La pantalla volverá a intentarlo (y mostrará el error) al cargarse.
+                continue
+            _cola_precargadas.put((ruta, tamaño, alpha, superficie, leida_de_cache))
+
+
+def entregar_precargadas() -> None:
+    """
+    Registra en el módulo de recursos las imágenes que el hilo de precarga ya preparó. Se llama desde el
+    hilo principal en cada fotograma; si no hay ninguna lista, no hace nada.
+    """
+    while True:
+        try:
+            imagen = _cola_precargadas.get_nowait()
+        except queue.Empty:
+            return
+        agregar_imagen_precargada(*imagen)
+
+
+def detener_precarga() -> None:
+    """
+    Detiene el hilo de precarga y espera a que termine la imagen en curso. Se llama antes de pygame.quit().
+    """
+    _detener.set()
+    if _hilo_precarga is not None:
+        _hilo_precarga.join()
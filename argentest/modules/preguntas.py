@@ -1,4 +1,6 @@
 from .funciones import * 
+from .banco_preguntas import cargar_banco_preguntas
 
-lista_preguntas = []
-parse_csv(lista_preguntas, "data/preguntas.csv")
\ No newline at end of file
+# Banco de preguntas compilado: se genera a partir del CSV (si falta o quedó desactualizado)
+# y cada pregunta se lee del archivo recién cuando se la pide por índice.
+lista_preguntas = cargar_banco_preguntas("data/preguntas.csv", RUTA_BANCO_PREGUNTAS)
\ No newline at end of file
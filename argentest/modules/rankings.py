@@ -1,16 +1,23 @@
 """
 Módulo para la gestión y visualización de los rankings del juego.
 
-Este módulo se encarga de leer, guardar y ordenar las puntuaciones de los jugadores
-en un archivo JSON, así como de mostrarlas en la pantalla de rankings del juego.
+Este módulo se encarga de leer, guardar y ordenar las puntuaciones de los jugadores,
+así como de mostrarlas en la pantalla de rankings del juego.
+Los rankings se guardan en el backend elegido con BACKEND_RANKINGS: "archivo" (se leen del disco una
+única vez y se consultan en memoria, ver almacen_rankings.py y registro_rankings.py) o "sqlite"
+(ver almacen_rankings_sqlite.py). Los dos ofrecen las mismas consultas.
 """
 
 import pygame
-import json # Necesario para trabajar con archivos JSON (guardar/cargar rankings).
 from datetime import datetime # Necesario para obtener la fecha y hora al guardar un ranking.
-import os # Necesario para verificar la existencia del archivo de rankings.
+from collections import OrderedDict # Caché LRU de las filas ya renderizadas.
 from .constantes import * # Importa todas las constantes, incluyendo colores, tamaños, etc.
+from .sonidos import CLICK_SONIDO, reproducir_efecto # Sonido de click del botón "Volver".
 from .funciones import mostrar_texto # Importa la función utilitaria para dibujar texto.
+from .regiones import redibujado_completo, marcar_region # Dibujado por regiones: pantalla completa o solo lo que cambió.
+from .recursos import cargar_imagen # Carga de imágenes compartidas y ya convertidas.
+from .almacen_rankings import AlmacenRankingsArchivo # Rankings en memoria, ordenados por puntaje.
+from .registro_rankings import RegistroRankings # Rankings en disco: instantánea y registro de cambios.
 
 
 # --- Definición de Fuentes Globales ---
@@ -19,45 +26,98 @@ fuente = pygame.font.SysFont("Arial Narrow", 38)   # Fuente para los nombres y p
 fuente_boton = pygame.font.SysFont("Arial Narrow", 23) # Fuente para el botón "Volver".
 
 # --- Carga de Imágenes Globales ---
-# Las imágenes se cargan una única vez al importar el módulo.
-boton_volver = pygame.image.load("assets/images/boton_volver.png") # Imagen del botón para volver al menú.
-boton_volver = pygame.transform.scale(boton_volver, TAMAÑO_BOTON_VOLUMEN) # Escala el botón.
+# Las imágenes se piden al módulo de recursos (el botón "Volver" es el mismo que usa la pantalla de configuración).
+boton_volver = cargar_imagen("assets/images/boton_volver.png", TAMAÑO_BOTON_VOLUMEN, alpha=True) # Imagen del botón para volver al menú.
 
-fondo_rankings = pygame.image.load("assets/images/fondo_rankings.png") # Imagen de fondo para la pantalla de rankings.
-fondo_rankings = pygame.transform.scale(fondo_rankings, VENTANA) # Escala el fondo al tamaño de la ventana.
+fondo_rankings = cargar_imagen("assets/images/fondo_rankings.png", VENTANA) # Imagen de fondo para la pantalla de rankings.
 
+# Rectángulo del botón "Volver" para la detección de clics (su posición es fija).
+boton_volver_rect = boton_volver.get_rect(topleft=(10, 10))
 
-def abrir_json(ruta: str) -> list:
+# --- Lista de Rankings con Desplazamiento ---
+# Solo se piden al almacén y se dibujan las filas visibles, así que recorrer un ranking con miles
+# de registros cuesta lo mismo por fotograma que uno con 10.
+FILAS_VISIBLES = 10 # Cantidad de rankings que entran en la pantalla.
+ALTO_FILA = 40 # Separación vertical entre filas, en píxeles.
+MAX_FILAS_RENDERIZADAS = 64 # Cantidad máxima de filas renderizadas que se guardan (LRU).
+area_lista = pygame.Rect(145, 80, ANCHO - 145, FILAS_VISIBLES * ALTO_FILA) # Zona de la pantalla que ocupa la lista.
+
+primera_fila = 0 # Posición (desde 0) del ranking que se muestra en la primera fila.
+pagina_actual = [] # Rankings visibles: lista de tuplas (id, ranking) devuelta por el método pagina del almacén.
+pagina_pedida = None # (primera fila, cantidad de rankings) con que se pidió 'pagina_actual'.
+
+# Superficies de las filas ya renderizadas, por (id del ranking, posición). La posición es parte
+# de la clave porque el número de puesto forma parte del texto de la fila.
+filas_renderizadas = OrderedDict()
+
+# Teclas de desplazamiento y cuántas filas mueve cada una (Inicio y Fin van a los extremos).
+desplazamiento_por_tecla = {
+    pygame.K_UP: -1,
+    pygame.K_DOWN: 1,
+    pygame.K_PAGEUP: -FILAS_VISIBLES,
+    pygame.K_PAGEDOWN: FILAS_VISIBLES,
+    pygame.K_HOME: float("-inf"),
+    pygame.K_END: float("inf")
+}
+
+
+def crear_almacen_rankings(backend: str, ruta_rankings: str = RUTA_RANKINGS, ruta_sqlite: str = RUTA_RANKINGS_SQLITE):
+    """
+    Crea el almacén de rankings del backend indicado.
+
+    Args:
+        backend (str): "archivo" o "sqlite".
+        ruta_rankings (str): Ruta de la instantánea de rankings del backend "archivo".
+        ruta_sqlite (str): Ruta de la base del backend "sqlite".
+
+    Returns:
+        AlmacenRankingsArchivo | AlmacenRankingsSQLite: El almacén, ya cargado.
     """
-    Abre un archivo JSON y devuelve su contenido como una lista de diccionarios.
+    if backend == "sqlite":
+        from .almacen_rankings_sqlite import AlmacenRankingsSQLite # Solo se importa si se usa.
+        almacen = AlmacenRankingsSQLite(ruta_sqlite)
+        if len(almacen) == 0: # Base nueva: importa los rankings guardados con el backend "archivo".
+            almacen.importar(RegistroRankings(ruta_rankings).cargar())
+        return almacen
+    return AlmacenRankingsArchivo(RegistroRankings(ruta_rankings, COMPACTAR_RANKINGS_CADA))
+
+
+# --- Almacén de Rankings ---
+# Se abre una única vez, en el primer uso (ver obtener_almacen_rankings), con las rutas de constantes.py.
+# El modo sin ventana lo abre antes, con las rutas de su copia temporal (ver abrir_almacen_rankings).
+almacen_rankings = None
 
-    Gestiona el caso en que el archivo no exista o esté vacío, devolviendo una lista vacía.
+
+def abrir_almacen_rankings(ruta_rankings: str = RUTA_RANKINGS, ruta_sqlite: str = RUTA_RANKINGS_SQLITE) -> None:
+    """
+    Abre el almacén de rankings (del backend BACKEND_RANKINGS) que usan el resto de las funciones del módulo.
 
     Args:
-        ruta (str): La ruta completa al archivo JSON (ej. "data/rankings.json").
+        ruta_rankings (str): Ruta de la instantánea de rankings del backend "archivo".
+        ruta_sqlite (str): Ruta de la base del backend "sqlite".
+    """
+    global almacen_rankings
+    almacen_rankings = crear_almacen_rankings(BACKEND_RANKINGS, ruta_rankings, ruta_sqlite)
+
+
+def obtener_almacen_rankings():
+    """
+    Devuelve el almacén de rankings, abriéndolo con las rutas de constantes.py si todavía no se abrió.
 
     Returns:
-        list: Una lista de diccionarios con los rankings o una lista vacía si no hay datos.
-    """
-    if os.path.exists(ruta): # Verifica si el archivo existe en la ruta especificada.
-        try: # Intenta abrir y cargar el contenido del archivo.
-            with open(ruta, "r", encoding='utf-8') as archivo: # Abre el archivo en modo lectura con codificación UTF-8.
-                contenido = json.load(archivo) # Carga el contenido JSON del archivo.
-                # Si el contenido cargado no es una lista o está vacío, asegura que sea una lista vacía.
-                if not isinstance(contenido, list) or len(contenido) == 0:
-                    contenido = []
-        except json.JSONDecodeError: # Captura errores si el archivo JSON está mal formado.
-            contenido = [] # En caso de error de formato, devuelve una lista vacía.
-    else:
-        contenido = [] # Si el archivo no existe, devuelve una lista vacía.
-    return contenido
+        AlmacenRankingsArchivo | AlmacenRankingsSQLite: El almacén.
+    """
+    if almacen_rankings is None:
+        abrir_almacen_rankings()
+    return almacen_rankings
 
 
 def guardar_ranking(nombre:str, puntaje:int) -> None:
     """
-    Guarda un nuevo registro de ranking en el archivo JSON.
+    Guarda un nuevo registro de ranking en el almacén de rankings.
 
-    Añade el nombre del jugador, su puntaje y la fecha/hora actual.
+    Añade el nombre del jugador, su puntaje y la fecha/hora actual. Con el backend "archivo", en el disco
+    solo se agrega una línea al registro de cambios, sin volver a escribir los rankings anteriores.
 
     Args:
         nombre (str): El nombre del jugador a guardar.
@@ -66,49 +126,87 @@ def guardar_ranking(nombre:str, puntaje:int) -> None:
     nuevo_ranking = {
         "nombre": nombre,
         "puntaje": puntaje,
-        "fecha": datetime.now().strftime("%d-%m-%Y %H:%M:%S") # Formatea la fecha y hora actual.
+        "fecha": datetime.now().strftime(FORMATO_FECHA_RANKING) # Formatea la fecha y hora actual.
     }
     
-    # Carga los rankings existentes desde el archivo.
-    rankings = abrir_json("data/rankings.json")
-    rankings.append(nuevo_ranking) # Añade el nuevo ranking a la lista.
-    
-    # Guarda la lista actualizada de rankings en el archivo JSON.
-    # indent=4 asegura que el archivo JSON sea legible con indentación.
-    with open("data/rankings.json", "w", encoding='utf-8') as archivo: # Abre el archivo en modo escritura.
-        json.dump(rankings, archivo, indent=4)
+    obtener_almacen_rankings().agregar(nuevo_ranking) # Lo agrega al almacén (y lo guarda en el disco).
 
 
 def ordenar_rankings() -> list:
     """
-    Ordena la lista de rankings cargada desde el archivo JSON de manera descendente
-    basándose en la puntuación de los jugadores.
+    Devuelve todos los rankings ordenados de manera descendente según la puntuación de los jugadores.
 
-    Utiliza el algoritmo de ordenamiento de burbuja (Bubble Sort).
+    Para mostrar solo los mejores puntajes conviene usar el método top(k) del almacén, que no recorre todos los registros.
 
     Returns:
         list: La lista de diccionarios de rankings, ordenada de mayor a menor puntaje.
     """
-    rankings = abrir_json("data/rankings.json") # Carga los rankings para ordenarlos.
-    
-    n = len(rankings)
-    # Implementación del algoritmo Bubble Sort.
-    for i in range(n - 1):
-        for j in range(i + 1, n):
-            # Compara puntajes y, si el actual es menor que el siguiente, los intercambia.
-            if rankings[i]["puntaje"] < rankings[j]["puntaje"]:
-                aux = rankings[i]
-                rankings[i] = rankings[j]
-                rankings[j] = aux
-    
-    return rankings
+    almacen = obtener_almacen_rankings()
+    return almacen.top(len(almacen))
+
+
+def obtener_fila_renderizada(id_ranking: int, posicion: int, ranking: dict) -> pygame.Surface:
+    """
+    Devuelve la superficie con el texto de una fila del ranking, renderizándola solo la primera vez.
+
+    Args:
+        id_ranking (int): Identificador del ranking dentro del almacén.
+        posicion (int): Posición del ranking en la lista completa (desde 0).
+        ranking (dict): El ranking con 'nombre', 'puntaje' y 'fecha'.
+
+    Returns:
+        pygame.Surface: La fila, con fondo transparente.
+    """
+    clave = (id_ranking, posicion)
+    fila = filas_renderizadas.get(clave)
+    if fila is not None:
+        filas_renderizadas.move_to_end(clave) # Marca la fila como usada recientemente.
+        return fila
+
+    # Formatea la cadena de texto para la entrada del ranking.
+    ranking_text = f"{posicion + 1}. {ranking['nombre']} - {ranking['puntaje']} puntos - {ranking['fecha']}"
+    fila = pygame.Surface((area_lista.width, ALTO_FILA), pygame.SRCALPHA)
+    mostrar_texto(fila, ranking_text, (0, 0), fuente, COLOR_BLANCO)
+    if pygame.display.get_surface() is not None:
+        fila = fila.convert_alpha()
+
+    filas_renderizadas[clave] = fila
+    if len(filas_renderizadas) > MAX_FILAS_RENDERIZADAS:
+        filas_renderizadas.popitem(last=False) # Descarta la fila usada hace más tiempo.
+    return fila
+
+
+def dibujar_lista_rankings(pantalla: pygame.Surface) -> None:
+    """
+    Dibuja las filas visibles del ranking sobre el fondo de la zona de la lista.
+
+    Args:
+        pantalla (pygame.Surface): Superficie principal de Pygame.
+    """
+    global pagina_actual
+    global pagina_pedida
+
+    # Solo se consulta al almacén cuando cambia la página visible (o la cantidad de rankings).
+    almacen = obtener_almacen_rankings()
+    if pagina_pedida != (primera_fila, len(almacen)):
+        pagina_actual = almacen.pagina(primera_fila, FILAS_VISIBLES)
+        pagina_pedida = (primera_fila, len(almacen))
+
+    pantalla.blit(fondo_rankings, area_lista, area_lista) # Borra las filas anteriores con el fondo.
+
+    posicion_y = area_lista.y # Posición vertical de la primera fila.
+    for i in range(len(pagina_actual)):
+        id_ranking, ranking = pagina_actual[i]
+        pantalla.blit(obtener_fila_renderizada(id_ranking, primera_fila + i, ranking), (area_lista.x, posicion_y))
+        posicion_y += ALTO_FILA # Avanza hacia abajo para la siguiente entrada.
 
 
 def mostrar_rankings(pantalla: pygame.Surface, cola_eventos: list[pygame.event.Event]) -> str:
     """
     Muestra la pantalla de rankings del juego.
 
-    Dibuja el fondo, el botón de volver y lista los 10 mejores puntajes.
+    Dibuja el fondo, el botón de volver y la lista de puntajes, de mayor a menor. La lista se recorre
+    con la rueda del mouse y con las flechas, Re Pág/Av Pág, Inicio y Fin.
 
     Args:
         pantalla (pygame.Surface): Superficie principal de Pygame donde se dibujan los elementos.
@@ -117,13 +215,10 @@ def mostrar_rankings(pantalla: pygame.Surface, cola_eventos: list[pygame.event.E
     Returns:
         str: El estado del juego al que se debe transicionar ("menu" o "salir").
     """
+    global primera_fila
+
     retorno = "rankings" # Estado por defecto: permanecer en la pantalla de rankings.
-    rankings = ordenar_rankings() # Obtiene los rankings ya ordenados.
-    
-    pantalla.blit(fondo_rankings, (0, 0)) # Dibuja el fondo de la pantalla de rankings.
-    
-    # Dibuja el botón "Volver" y obtiene su rectángulo para la detección de clics.
-    boton_volver_rect = pantalla.blit(boton_volver, (10, 10))
+    desplazamiento = 0 # Filas a desplazar la lista en este fotograma (negativo: hacia arriba).
     
     # --- Procesamiento de Eventos ---
     for evento in cola_eventos:
@@ -134,18 +229,31 @@ def mostrar_rankings(pantalla: pygame.Surface, cola_eventos: list[pygame.event.E
         elif evento.type == pygame.MOUSEBUTTONDOWN:
             # Si el clic fue sobre el botón "Volver".
             if boton_volver_rect.collidepoint(evento.pos):
-                CLICK_SONIDO.play() # Reproduce el sonido de clic.
+                reproducir_efecto(CLICK_SONIDO) # Reproduce el sonido de clic.
                 retorno = "menu" # Cambia el estado a 'menu' para regresar al menú principal.
+
+        # Rueda del mouse: hacia arriba (y > 0) sube la lista.
+        elif evento.type == pygame.MOUSEWHEEL:
+            desplazamiento -= evento.y
+
+        # Teclas de desplazamiento.
+        elif evento.type == pygame.KEYDOWN and evento.key in desplazamiento_por_tecla:
+            desplazamiento += desplazamiento_por_tecla[evento.key]
+
+    # Nueva primera fila, sin pasar del principio ni del final de la lista.
+    ultima_primera_fila = max(0, len(obtener_almacen_rankings()) - FILAS_VISIBLES)
+    nueva_primera_fila = int(max(0, min(primera_fila + desplazamiento, ultima_primera_fila)))
     
     # --- Dibujado de Rankings ---
-    posicion_y = 80 # Posición vertical inicial para el primer ranking.
-    
-    # Itera para mostrar los top 10 rankings (o menos si no hay 10).
-    for i in range(min(10, len(rankings))): 
-        # Formatea la cadena de texto para cada entrada del ranking.
-        ranking_text = f"{i + 1}. {rankings[i]['nombre']} - {rankings[i]['puntaje']} puntos - {rankings[i]['fecha']}"
-        # Dibuja el texto del ranking en la pantalla.
-        mostrar_texto(pantalla, ranking_text, (145, posicion_y), fuente, COLOR_BLANCO)
-        posicion_y += 40 # Avanza 40 píxeles hacia abajo para la siguiente entrada.
+    # Al entrar se dibuja toda la pantalla; después, solo la lista y solo si se desplazó.
+    if redibujado_completo():
+        primera_fila = nueva_primera_fila
+        pantalla.blit(fondo_rankings, (0, 0)) # Dibuja el fondo de la pantalla de rankings.
+        pantalla.blit(boton_volver, boton_volver_rect) # Dibuja el botón "Volver".
+        dibujar_lista_rankings(pantalla)
+    elif nueva_primera_fila != primera_fila:
+        primera_fila = nueva_primera_fila
+        dibujar_lista_rankings(pantalla)
+        marcar_region(area_lista)
     
     return retorno # Devuelve el estado actual de la ventana.
\ No newline at end of file
@@ -0,0 +1,280 @@
+"""
+Módulo de gestión de recursos gráficos.
+
+Todas las pantallas cargan sus imágenes a través de este módulo. Cada imagen se identifica
+por (ruta, tamaño, alpha): la primera vez que se pide se decodifica, se escala y se convierte
+al formato de píxeles de la ventana (convert() o convert_alpha()); las siguientes veces se
+devuelve la misma superficie ya preparada. Por eso las superficies devueltas son compartidas
+y no deben modificarse (para dibujar sobre ellas, usar una copia).
+
+Además, cada imagen escalada se guarda en disco (DIRECTORIO_CACHE_SUPERFICIES) como píxeles sin
+comprimir. En los arranques siguientes se lee de ahí, sin decodificar el PNG ni volver a escalarlo.
+Cada archivo de la caché guarda la fecha de modificación, el tamaño y el hash SHA-1 del archivo
+original, y se descarta si la imagen original cambió.
+
+Las imágenes también pueden prepararse por adelantado en otro hilo (preparar_imagen, ver precarga.py)
+y registrarse después desde el hilo principal (agregar_imagen_precargada).
+"""
+
+import pygame
+import os       # Para consultar los archivos originales y crear el directorio de la caché.
+import hashlib  # Para el nombre de los archivos de la caché y el hash de las imágenes originales.
+import struct   # Para leer y escribir el encabezado binario de los archivos de la caché.
+import threading # Para el nombre del archivo temporal de cada hilo que escribe en la caché.
+from .constantes import * # Importa todas las constantes, incluyendo los tamaños de los elementos gráficos.
+
+# Encabezado de cada archivo de la caché en disco:
+# marca, versión, ancho, alto, alpha, fecha de modificación (ns) y tamaño del original, SHA-1 del original.
+_ENCABEZADO_CACHE = struct.Struct("<4sHIIBqQ20s")
+_MARCA_CACHE = b"ARGS"
+
+# Superficies ya preparadas, por clave (ruta, tamaño, alpha).
+_superficies = {}
+
+# Contadores por clave: cuántas veces se pidió cada recurso, cuántas se decodificó desde el archivo
+# de imagen original y cuántas se leyó ya escalado desde la caché en disco.
+estadisticas_recursos = {}
+
+
+def _ruta_cache(ruta: str, tamaño: tuple | None, alpha: bool) -> str:
+    """
+    Calcula la ruta del archivo de la caché en disco para una clave (ruta, tamaño, alpha).
+    """
+    nombre = hashlib.sha1(f"{ruta}|{tamaño}|{alpha}".encode("utf-8")).hexdigest()
+    return os.path.join(DIRECTORIO_CACHE_SUPERFICIES, nombre + ".sup")
+
+
+def _hash_archivo(ruta: str) -> bytes:
+    """
+    Calcula el hash SHA-1 del contenido de un archivo.
+    """
+    with open(ruta, "rb") as archivo:
+        return hashlib.sha1(archivo.read()).digest()
+
+
+def _leer_cache_disco(ruta: str, tamaño: tuple | None, alpha: bool) -> pygame.Surface | None:
+    """
+    Lee una imagen ya escalada desde la caché en disco, si existe y sigue correspondiendo al archivo original.
+
+    Si la fecha de modificación del original cambió pero su contenido es el mismo (mismo hash),
+    la entrada se sigue usando y se actualiza su encabezado.
+
+    Returns:
+        pygame.Surface | None: La superficie sin convertir, o None si no hay una entrada válida.
+    """
+    ruta_cache = _ruta_cache(ruta, tamaño, alpha)
+    try:
+        estado_original = os.stat(ruta)
+        with open(ruta_cache, "rb") as archivo:
+            datos = archivo.read()
+    except OSError: # No existe la entrada (o el original).
+        return None
+
+    if len(datos) < _ENCABEZADO_CACHE.size:
+        return None
+    marca, version, ancho, alto, con_alpha, fecha, tamaño_original, hash_original = _ENCABEZADO_CACHE.unpack_from(datos)
+    formato = "RGBA" if con_alpha else "RGB"
+    if marca != _MARCA_CACHE or version != VERSION_CACHE_SUPERFICIES or bool(con_alpha) != alpha:
+        return None
+    if len(datos) != _ENCABEZADO_CACHE.size + ancho * alto * len(formato): # Archivo incompleto.
+        return None
+
+    if fecha != estado_original.st_mtime_ns or tamaño_original != estado_original.st_size:
+        # El original fue modificado (o copiado): solo se descarta la entrada si cambió su contenido.
+        if _hash_archivo(ruta) != hash_original:
+            return None
+        encabezado = _ENCABEZADO_CACHE.pack(_MARCA_CACHE, VERSION_CACHE_SUPERFICIES, ancho, alto, con_alpha,
+                                            estado_original.st_mtime_ns, estado_original.st_size, hash_original)
+        try:
+            with open(ruta_cache, "r+b") as archivo:
+                archivo.write(encabezado)
+        except OSError:
+            pass
+
+    pixeles = memoryview(datos)[_ENCABEZADO_CACHE.size:]
+    return pygame.image.frombytes(bytes(pixeles), (ancho, alto), formato)
+
+
+def _escribir_cache_disco(ruta: str, tamaño: tuple | None, alpha: bool, superficie: pygame.Surface) -> None:
+    """
+    Guarda una imagen ya escalada en la caché en disco. Los errores de escritura se ignoran:
+    la caché es solo una optimización.
+
+    El archivo temporal lleva el proceso y el hilo en el nombre: la precarga en segundo plano y el hilo principal
+    (o dos instancias del juego) pueden escribir la misma imagen a la vez sin pisarse el archivo a medio escribir.
+    """
+    formato = "RGBA" if alpha else "RGB"
+    ruta_temporal = None
+    try:
+        estado_original = os.stat(ruta)
+        encabezado = _ENCABEZADO_CACHE.pack(_MARCA_CACHE, VERSION_CACHE_SUPERFICIES,
+                                            superficie.get_width(), superficie.get_height(), alpha,
+                                            estado_original.st_mtime_ns, estado_original.st_size, _hash_archivo(ruta))
+        os.makedirs(DIRECTORIO_CACHE_SUPERFICIES, exist_ok=True)
+        ruta_cache = _ruta_cache(ruta, tamaño, alpha)
+        ruta_temporal = f"{ruta_cache}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(ruta_temporal, "wb") as archivo:
+            archivo.write(encabezado)
+            archivo.write(pygame.image.tobytes(superficie, formato))
+        os.replace(ruta_temporal, ruta_cache) # El archivo aparece completo o no aparece.
+    except OSError:
+        # Con un nombre por hilo, un temporal que quedó a medio escribir ya no lo pisa la próxima escritura.
+        if ruta_temporal is not None:
+            try:
+                os.remove(ruta_temporal)
+            except OSError:
+                pass
+
+
+def _decodificar_imagen(ruta: str, tamaño: tuple | None, alpha: bool) -> pygame.Surface:
+    """
+    Decodifica una imagen desde su archivo original y la escala al tamaño pedido.
+
+    Args:
+        ruta (str): Ruta del archivo de imagen.
+        tamaño (tuple | None): Tamaño final (ancho, alto), o None para conservar el original.
+        alpha (bool): True si la imagen conserva la transparencia por píxel.
+
+    Returns:
+        pygame.Surface: La superficie escalada, todavía sin convertir.
+    """
+    superficie = pygame.image.load(ruta)
+    if tamaño is not None:
+        superficie = pygame.transform.scale(superficie, tamaño) # Se escala antes de convertir: hay menos píxeles que procesar.
+    if alpha and not superficie.get_flags() & pygame.SRCALPHA:
+        # Agrega un canal alfa (opaco) sin necesitar la ventana, para poder guardarla como RGBA en la caché.
+        superficie_alpha = pygame.Surface(superficie.get_size(), pygame.SRCALPHA)
+        superficie_alpha.blit(superficie, (0, 0))
+        superficie = superficie_alpha
+    return superficie
+
+
+def _convertir_superficie(superficie: pygame.Surface, alpha: bool) -> pygame.Surface:
+    """
+    Convierte una superficie al formato de píxeles de la ventana.
+
+    Args:
+        superficie (pygame.Surface): La superficie ya escalada.
+        alpha (bool): True para conservar la transparencia por píxel (convert_alpha), False para convert().
+
+    Returns:
+        pygame.Surface: La superficie lista para dibujar.
+    """
+    # La conversión requiere que la ventana ya exista; si no, la superficie se usa tal cual.
+    if pygame.display.get_surface() is not None:
+        if alpha:
+            superficie = superficie.convert_alpha()
+        else:
+            superficie = superficie.convert()
+    return superficie
+
+
+def preparar_imagen(ruta: str, tamaño: tuple | None = None, alpha: bool = False) -> tuple:
+    """
+    Lee una imagen ya escalada de la caché en disco (o la decodifica y la escala) y la convierte al formato
+    de la ventana, sin registrarla. No usa las superficies ni los contadores del módulo, así que puede
+    ejecutarse en otro hilo.
+
+    Args:
+        ruta (str): Ruta del archivo de imagen.
+        tamaño (tuple | None): Tamaño (ancho, alto) al que se escala la imagen, o None para el tamaño original.
+        alpha (bool): True si la imagen tiene partes transparentes que deben conservarse.
+
+    Returns:
+        tuple: (superficie lista para dibujar, True si se leyó de la caché en disco).
+    """
+    superficie = None
+    if CACHE_SUPERFICIES_EN_DISCO:
+        superficie = _leer_cache_disco(ruta, tamaño, alpha)
+
+    leida_de_cache = superficie is not None
+    if not leida_de_cache:
+        superficie = _decodificar_imagen(ruta, tamaño, alpha)
+        if CACHE_SUPERFICIES_EN_DISCO:
+            _escribir_cache_disco(ruta, tamaño, alpha, superficie)
+
+    return _convertir_superficie(superficie, alpha), leida_de_cache
+
+
+def _clave_recurso(ruta: str, tamaño, alpha: bool) -> tuple:
+    """
+    Arma la clave (ruta, tamaño, alpha) de un recurso; el tamaño se guarda como tupla aunque se pida como lista.
+    """
+    if tamaño is not None:
+        tamaño = tuple(tamaño)
+    return (ruta, tamaño, alpha)
+
+
+def _estadisticas_de(clave: tuple) -> dict:
+    """
+    Devuelve los contadores de un recurso, creándolos si es la primera vez.
+    """
+    return estadisticas_recursos.setdefault(clave, {"solicitudes": 0, "decodificaciones": 0, "lecturas_cache_disco": 0})
+
+
+def _registrar_superficie(clave: tuple, superficie: pygame.Surface, leida_de_cache: bool) -> None:
+    """
+    Guarda una superficie ya preparada y cuenta de dónde salió.
+    """
+    if leida_de_cache:
+        _estadisticas_de(clave)["lecturas_cache_disco"] += 1
+    else:
+        _estadisticas_de(clave)["decodificaciones"] += 1
+    _superficies[clave] = superficie
+
+
+def cargar_imagen(ruta: str, tamaño: tuple | None = None, alpha: bool = False) -> pygame.Surface:
+    """
+    Devuelve una imagen escalada y convertida al formato de la ventana, decodificándola solo la primera vez.
+
+    Args:
+        ruta (str): Ruta del archivo de imagen (ej. "assets/images/fondo.png").
+        tamaño (tuple | None): Tamaño (ancho, alto) al que se escala la imagen, o None para el tamaño original.
+        alpha (bool): True si la imagen tiene partes transparentes que deben conservarse.
+
+    Returns:
+        pygame.Surface: La superficie compartida del recurso. No debe modificarse.
+    """
+    clave = _clave_recurso(ruta, tamaño, alpha)
+    _estadisticas_de(clave)["solicitudes"] += 1
+
+    superficie = _superficies.get(clave)
+    if superficie is None:
+        superficie, leida_de_cache = preparar_imagen(*clave)
+        _registrar_superficie(clave, superficie, leida_de_cache)
+    return superficie
+
+
+def imagen_cargada(ruta: str, tamaño: tuple | None = None, alpha: bool = False) -> bool:
+    """
+    Indica si una imagen ya está preparada (cargar_imagen la devolvería sin leerla ni decodificarla).
+    """
+    return _clave_recurso(ruta, tamaño, alpha) in _superficies
+
+
+def agregar_imagen_precargada(ruta: str, tamaño: tuple | None, alpha: bool, superficie: pygame.Surface,
+                              leida_de_cache: bool) -> None:
+    """
+    Registra una imagen preparada por adelantado con preparar_imagen. Se llama desde el hilo principal.
+    Si mientras tanto la imagen ya se cargó, se conserva la que ya se estaba usando.
+
+    Args:
+        ruta (str): Ruta del archivo de imagen.
+        tamaño (tuple | None): Tamaño con que se preparó.
+        alpha (bool): Si se preparó con transparencia.
+        superficie (pygame.Surface): La superficie devuelta por preparar_imagen.
+        leida_de_cache (bool): Si se leyó de la caché en disco (para los contadores).
+    """
+    clave = _clave_recurso(ruta, tamaño, alpha)
+    if clave not in _superficies:
+        _registrar_superficie(clave, superficie, leida_de_cache)
+
+
+def obtener_estadisticas_recursos() -> dict:
+    """
+    Devuelve, para cada recurso pedido, cuántas veces se solicitó, cuántas se decodificó y cuántas se leyó de la caché en disco.
+
+    Returns:
+        dict: Diccionario {(ruta, tamaño, alpha): {"solicitudes": int, "decodificaciones": int, "lecturas_cache_disco": int}}.
+    """
+    return {clave: dict(valores) for clave, valores in estadisticas_recursos.items()}
@@ -0,0 +1,67 @@
+"""
+Módulo de regiones modificadas ("dirty rectangles").
+
+Las funciones de pantalla informan aquí qué partes de la ventana cambiaron en el fotograma actual,
+y el bucle principal actualiza solo esas regiones con pygame.display.update() en lugar de
+volver a presentar la ventana completa con pygame.display.flip().
+"""
+
+import pygame
+from .constantes import * # Importa todas las constantes, incluyendo MODO_REGIONES_SUCIAS.
+
+# Regiones de la ventana modificadas durante el fotograma actual.
+regiones_sucias = []
+
+# True cuando la pantalla debe dibujarse entera (primer fotograma de una pantalla o modo de regiones desactivado).
+_redibujado_completo = True
+
+
+def solicitar_redibujado_completo() -> None:
+    """
+    Indica que en el fotograma actual la pantalla activa debe dibujarse y presentarse completa.
+
+    El bucle principal lo solicita al cambiar de pantalla, o en todos los fotogramas si MODO_REGIONES_SUCIAS es False.
+    """
+    global _redibujado_completo
+    _redibujado_completo = True
+
+
+def redibujado_completo() -> bool:
+    """
+    Indica si la pantalla activa debe dibujarse entera en el fotograma actual.
+
+    Returns:
+        bool: True si hay que redibujar todo, False si alcanza con dibujar lo que cambió.
+    """
+    return _redibujado_completo
+
+
+def marcar_region(rect: pygame.Rect) -> None:
+    """
+    Registra una región de la ventana que fue modificada en el fotograma actual.
+
+    Args:
+        rect (pygame.Rect): El área modificada (por ejemplo, el valor devuelto por blit o mostrar_texto).
+    """
+    if rect.width > 0 and rect.height > 0: # Las regiones vacías no necesitan actualizarse.
+        regiones_sucias.append(pygame.Rect(rect))
+
+
+def tomar_regiones() -> list | None:
+    """
+    Devuelve las regiones modificadas en el fotograma actual y reinicia el registro para el siguiente.
+
+    Returns:
+        list | None: None si se debe presentar la ventana completa (flip), o la lista de rectángulos
+                     a actualizar (vacía si no cambió nada).
+    """
+    global _redibujado_completo
+
+    if _redibujado_completo:
+        regiones = None
+    else:
+        regiones = list(regiones_sucias)
+
+    regiones_sucias.clear()
+    _redibujado_completo = False
+    return regiones
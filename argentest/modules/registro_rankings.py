@@ -0,0 +1,230 @@
+"""
+Módulo del registro persistente de rankings.
+
+Los rankings se guardan en dos tipos de archivo, en el mismo directorio:
+    - Una instantánea ("data/rankings.json") con todos los registros hasta cierta generación:
+      {"generacion": G, "rankings": [...]}. También se acepta el formato anterior (una lista).
+    - Registros de cambios en formato JSON Lines ("data/rankings.<g>.jsonl"), un ranking por línea.
+      Guardar un ranking solo agrega una línea al registro de la generación activa y hace fsync,
+      sin volver a escribir todo el historial.
+
+La compactación junta la instantánea y los registros de las generaciones anteriores en una
+instantánea nueva, en un hilo en segundo plano. La instantánea se escribe en un archivo temporal
+y se reemplaza con os.replace, así que un corte a mitad de escritura nunca pierde puntajes:
+queda la instantánea anterior junto con sus registros de cambios.
+"""
+
+import os        # Para listar, reemplazar y borrar los archivos del registro.
+import re        # Para reconocer los nombres de los registros de cambios.
+import json      # Formato de la instantánea y de cada línea de los registros.
+import threading # Para compactar en segundo plano sin bloquear el fotograma.
+
+
+class RegistroRankings:
+    """
+    Registro de rankings en disco: instantánea + registros de cambios de solo agregado.
+    """
+
+    def __init__(self, ruta_instantanea: str, compactar_cada: int = 100):
+        """
+        Args:
+            ruta_instantanea (str): Ruta del archivo de la instantánea (ej. "data/rankings.json").
+            compactar_cada (int): Cantidad de rankings agregados tras la cual se compacta en segundo plano.
+        """
+        self.ruta_instantanea = ruta_instantanea
+        self.compactar_cada = compactar_cada
+        self._directorio = os.path.dirname(ruta_instantanea) or "."
+        self._base = os.path.splitext(os.path.basename(ruta_instantanea))[0] # "rankings" para "data/rankings.json".
+        self._patron = re.compile(re.escape(self._base) + r"\.(\d+)\.jsonl$")
+
+        self._candado = threading.Lock() # Protege la generación activa y el estado de la compactación.
+        self._generacion_activa = 0 # Generación del registro de cambios donde se agregan los rankings nuevos.
+        self._agregados_sin_compactar = 0
+        self._hilo_compactacion = None
+
+    def _ruta_registro(self, generacion: int) -> str:
+        """
+        Devuelve la ruta del registro de cambios de una generación.
+        """
+        return os.path.join(self._directorio, f"{self._base}.{generacion}.jsonl")
+
+    def _generaciones_en_disco(self) -> list:
+        """
+        Devuelve, ordenadas, las generaciones que tienen un registro de cambios en el directorio.
+        """
+        generaciones = []
+        try:
+            nombres = os.listdir(self._directorio)
+        except OSError:
+            return generaciones
+        for nombre in nombres:
+            coincidencia = self._patron.match(nombre)
+            if coincidencia:
+                generaciones.append(int(coincidencia.group(1)))
+        generaciones.sort()
+        return generaciones
+
+    def _leer_instantanea(self) -> tuple:
+        """
+        Lee la instantánea.
+
+        Returns:
+            tuple: (generación, lista de rankings). Si no existe o está dañada, (0, []).
+        """
+        try:
+            with open(self.ruta_instantanea, "r", encoding="utf-8") as archivo:
+                contenido = json.load(archivo)
+        except (OSError, json.JSONDecodeError):
+            return 0, []
+
+        if isinstance(contenido, list): # Formato anterior: solo la lista de rankings.
+            return 0, contenido
+        if isinstance(contenido, dict) and isinstance(contenido.get("rankings"), list):
+            return int(contenido.get("generacion", 0)), contenido["rankings"]
+        return 0, []
+
+    def _leer_registro(self, generacion: int) -> list:
+        """
+        Lee los rankings de un registro de cambios. Las líneas incompletas o dañadas
+        (por ejemplo, la última si el juego se cortó mientras se escribía) se ignoran.
+        """
+        rankings = []
+        try:
+            with open(self._ruta_registro(generacion), "r", encoding="utf-8") as archivo:
+                for linea in archivo:
+                    if not linea.endswith("\n"): # Línea cortada a mitad de escritura.
+                        continue
+                    try:
+                        ranking = json.loads(linea)
+                    except json.JSONDecodeError:
+                        continue
+                    if isinstance(ranking, dict):
+                        rankings.append(ranking)
+        except OSError:
+            pass
+        return rankings
+
+    def cargar(self) -> list:
+        """
+        Lee todos los rankings guardados: la instantánea más los registros de cambios posteriores.
+
+        Los rankings nuevos se agregan a una generación nueva, para no escribir nunca a continuación
+        de una línea que pudo quedar cortada. Si había registros de cambios pendientes, se compactan en segundo plano.
+
+        Returns:
+            list: Lista de diccionarios con los rankings, en el orden en que se guardaron.
+        """
+        generacion_instantanea, rankings = self._leer_instantanea()
+        generaciones = self._generaciones_en_disco()
+
+        pendientes = False
+        for generacion in generaciones:
+            if generacion >= generacion_instantanea:
+                rankings.extend(self._leer_registro(generacion))
+                pendientes = True
+            else: # Ya incluida en la instantánea (la compactación anterior no llegó a borrarla).
+                self._borrar_registro(generacion)
+
+        with self._candado:
+            self._generacion_activa = max([generacion_instantanea] + generaciones) + 1
+
+        if pendientes:
+            self.compactar()
+        return rankings
+
+    def agregar(self, ranking: dict) -> None:
+        """
+        Agrega un ranking al final del registro de cambios activo y espera a que llegue al disco (fsync).
+
+        Args:
+            ranking (dict): El ranking con 'nombre', 'puntaje' y 'fecha'.
+        """
+        linea = json.dumps(ranking, ensure_ascii=False) + "\n"
+        with self._candado:
+            ruta = self._ruta_registro(self._generacion_activa)
+            with open(ruta, "a", encoding="utf-8") as archivo:
+                archivo.write(linea)
+                archivo.flush()
+                os.fsync(archivo.fileno())
+            self._agregados_sin_compactar += 1
+            compactar = self._agregados_sin_compactar >= self.compactar_cada
+
+        if compactar:
+            self.compactar()
+
+    def compactar(self) -> bool:
+        """
+        Inicia la compactación en segundo plano: los rankings nuevos pasan a una generación nueva
+        y un hilo junta la instantánea con los registros de cambios anteriores.
+
+        Returns:
+            bool: True si se inició la compactación, False si ya había una en curso.
+        """
+        with self._candado:
+            if self._hilo_compactacion is not None and self._hilo_compactacion.is_alive():
+                return False
+            hasta_generacion = self._generacion_activa
+            self._generacion_activa += 1
+            self._agregados_sin_compactar = 0
+            self._hilo_compactacion = threading.Thread(target=self._compactar_hasta, args=(hasta_generacion,),
+                                                       name="compactacion-rankings")
+            self._hilo_compactacion.start()
+        return True
+
+    def esperar_compactacion(self) -> None:
+        """
+        Espera a que termine la compactación en curso, si la hay.
+        """
+        hilo = self._hilo_compactacion
+        if hilo is not None:
+            hilo.join()
+
+    def _compactar_hasta(self, hasta_generacion: int) -> None:
+        """
+        Escribe una instantánea nueva con todos los rankings hasta la generación indicada (inclusive)
+        y borra los registros de cambios que quedaron incluidos. Se ejecuta en el hilo de compactación.
+        """
+        generacion_instantanea, rankings = self._leer_instantanea()
+        generaciones = [generacion for generacion in self._generaciones_en_disco()
+                        if generacion_instantanea <= generacion <= hasta_generacion]
+        for generacion in generaciones:
+            rankings.extend(self._leer_registro(generacion))
+
+        contenido = {"generacion": hasta_generacion + 1, "rankings": rankings}
+        ruta_temporal = self.ruta_instantanea + ".tmp"
+        try:
+            with open(ruta_temporal, "w", encoding="utf-8") as archivo:
+                json.dump(contenido, archivo, ensure_ascii=False)
+                archivo.flush()
+                os.fsync(archivo.fileno())
+            os.replace(ruta_temporal, self.ruta_instantanea) # La instantánea nueva aparece completa o no aparece.
+            # El reemplazo debe llegar al disco antes de borrar los registros: si no, un corte podría dejar
+            # los registros borrados y, en el directorio, todavía la instantánea anterior.
+            self._sincronizar_directorio()
+        except OSError:
+            return # Se conservan la instantánea anterior y los registros de cambios.
+
+        for generacion in generaciones:
+            self._borrar_registro(generacion)
+
+    def _sincronizar_directorio(self) -> None:
+        """
+        Espera a que los cambios de nombres del directorio (os.replace) lleguen al disco (fsync del directorio).
+        En Windows los directorios no se pueden abrir ni sincronizar así, y no hace falta.
+        """
+        if os.name == "nt":
+            return
+        descriptor = os.open(self._directorio, os.O_RDONLY)
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
+
+    def _borrar_registro(self, generacion: int) -> None:
+        """
+        Borra el registro de cambios de una generación ya incluida en la instantánea.
+        """
+        try:
+            os.remove(self._ruta_registro(generacion))
+        except OSError:
+            pass
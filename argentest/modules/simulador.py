@@ -0,0 +1,205 @@
+"""
+Módulo del simulador de partidas (Monte Carlo).
+
+Simula muchas partidas a la vez para ver cómo se distribuyen los puntajes con ciertas reglas
+(PUNTUACION_ACIERTO, PUNTUACION_ERROR, CANTIDAD_VIDAS, la racha para la vida extra, etc.),
+sin abrir el juego. Cada variable de la partida (vidas, puntuación, tiempo, racha, comodines) es un
+arreglo de NumPy con un elemento por partida, y cada pregunta se resuelve para todas las partidas
+con operaciones sobre arreglos: el único bucle de Python es el de las preguntas.
+
+Las reglas son las de motor_juego.py. El jugador se modela así:
+    - Con probabilidad 'precision' sabe la respuesta, y entonces acierta.
+    - Si no la sabe, adivina entre las opciones visibles. Antes de adivinar usa, si le quedan y en este orden,
+      Bomba (quedan 2 opciones), Doble Chance (dos intentos) o Pasar (salta la pregunta).
+    - Usa X2 en la primera pregunta que sabe.
+    - Cada pregunta le lleva entre segundos_por_pregunta[0] y segundos_por_pregunta[1] segundos.
+
+Si la racha devuelve tanto tiempo como el que lleva completarla, una partida puede no terminar nunca
+(por ejemplo, con precisión 1.0 y racha_vida_extra=1). Por eso cada partida responde como máximo
+max_preguntas preguntas; las que llegan a ese límite se cortan y se cuentan como truncadas.
+
+Requiere NumPy (pip install numpy), que el juego no necesita.
+"""
+
+import warnings # Para avisar de reglas con las que una partida puede no terminar.
+
+try:
+    import numpy as np # Arreglos para simular todas las partidas a la vez.
+except ImportError: # El juego funciona sin NumPy; solo el simulador lo necesita.
+    np = None
+
+from .constantes import * # Reglas del juego: vidas, puntos, duración de la partida y rachas.
+
+# Probabilidad de acertar una pregunta que el jugador no sabe, según el comodín que usó.
+PROBABILIDAD_ADIVINAR = 1 / 4 # Adivina entre las 4 opciones.
+PROBABILIDAD_ADIVINAR_BOMBA = 1 / 2 # Bomba deja 2 opciones.
+# Con Doble Chance: primer intento entre 4 opciones; si falla, se ocultan la elegida y otra incorrecta y quedan 2.
+PROBABILIDAD_ADIVINAR_DOBLE_CHANCE = 1 / 4 + 3 / 4 * 1 / 2
+
+# Preguntas que responde, como máximo, cada partida simulada. Con las reglas de constantes.py una partida
+# termina en unas 60 preguntas; el límite solo corta las partidas que, por las reglas, no terminarían nunca.
+MAX_PREGUNTAS = 1000
+
+
+def _verificar_numpy() -> None:
+    """
+    Lanza ImportError con un mensaje claro si NumPy no está instalado.
+    """
+    if np is None:
+        raise ImportError("El simulador de partidas necesita NumPy. Instalarlo con: pip install numpy")
+
+
+def simular_partidas(cantidad: int, precision, semilla: int | None = None, tiempo: int = TIEMPO_PARTIDA,
+                     acierto: int = PUNTUACION_ACIERTO, fallo: int = PUNTUACION_ERROR, vidas: int = CANTIDAD_VIDAS,
+                     max_vidas: int = MAX_VIDAS, racha_vida_extra: int = RACHA_VIDA_EXTRA,
+                     bonus_tiempo: int = BONUS_TIEMPO_RACHA, segundos_por_pregunta: tuple = (3, 8),
+                     usar_comodines: bool = True, max_preguntas: int = MAX_PREGUNTAS,
+                     devolver_truncadas: bool = False) -> "np.ndarray | tuple":
+    """
+    Simula partidas completas y devuelve el puntaje final de cada una.
+
+    Si racha_vida_extra por la media de segundos_por_pregunta no supera bonus_tiempo, la racha devuelve
+    al menos el tiempo que lleva completarla y un jugador que acierta mucho no se queda nunca sin tiempo:
+    se avisa con un RuntimeWarning, y esas partidas terminan al llegar a max_preguntas.
+
+    Args:
+        cantidad (int): Cantidad de partidas a simular.
+        precision (float | np.ndarray): Probabilidad de que el jugador sepa cada respuesta (entre 0 y 1).
+                                        Puede ser un arreglo con una precisión por partida.
+        semilla (int | None): Semilla del generador aleatorio, para repetir una simulación.
+        tiempo (int): Segundos de partida (datos_juego["tiempo"]).
+        acierto (int): Puntos por respuesta correcta.
+        fallo (int): Puntos que se restan por respuesta incorrecta (si la puntuación es positiva).
+        vidas (int): Vidas iniciales.
+        max_vidas (int): Máximo de vidas que se puede alcanzar con vidas extra.
+        racha_vida_extra (int): Cada cuántos aciertos se gana una vida extra y el bonus de tiempo.
+        bonus_tiempo (int): Segundos que se suman al completar una racha.
+        segundos_por_pregunta (tuple): Mínimo y máximo (inclusive) de segundos que lleva responder una pregunta.
+        usar_comodines (bool): Si es False, el jugador no usa comodines.
+        max_preguntas (int): Preguntas que responde, como máximo, cada partida. Las que llegan al límite
+                             se cortan con el puntaje que tenían.
+        devolver_truncadas (bool): Si es True, devuelve también qué partidas se cortaron por max_preguntas.
+
+    Returns:
+        np.ndarray | tuple: Arreglo de enteros con el puntaje final de cada partida. Con devolver_truncadas,
+                            una tupla (puntajes, truncadas), donde truncadas es un arreglo de booleanos.
+    """
+    _verificar_numpy()
+    minimo, maximo = segundos_por_pregunta
+    if racha_vida_extra > 0 and racha_vida_extra * (minimo + maximo) / 2 <= bonus_tiempo:
+        warnings.warn(f"Con racha_vida_extra={racha_vida_extra}, bonus_tiempo={bonus_tiempo} y "
+                      f"segundos_por_pregunta={segundos_por_pregunta}, la racha devuelve al menos el tiempo que lleva "
+                      f"completarla: las partidas pueden no terminar y se cortan a las {max_preguntas} preguntas.",
+                      RuntimeWarning, stacklevel=2)
+    generador = np.random.default_rng(semilla)
+    precision = np.broadcast_to(np.asarray(precision, dtype=np.float64), (cantidad,))
+
+    # Estado de todas las partidas: un elemento por partida.
+    vidas_restantes = np.full(cantidad, vidas, dtype=np.int64)
+    puntuacion = np.zeros(cantidad, dtype=np.int64)
+    tiempo_restante = np.full(cantidad, tiempo, dtype=np.int64)
+    racha = np.zeros(cantidad, dtype=np.int64)
+    x2_disponible = np.full(cantidad, usar_comodines)
+    x2_activo = np.zeros(cantidad, dtype=bool)
+    pasar_disponible = np.full(cantidad, usar_comodines)
+    doble_chance_disponible = np.full(cantidad, usar_comodines)
+    bomba_disponible = np.full(cantidad, usar_comodines)
+    en_juego = np.ones(cantidad, dtype=bool)
+
+    for _ in range(max_preguntas):
+        if not en_juego.any():
+            break
+        # El tiempo de responder: si no alcanza, la partida termina sin responder la pregunta.
+        tiempo_restante -= np.where(en_juego, generador.integers(minimo, maximo + 1, cantidad), 0)
+        en_juego &= tiempo_restante >= 0
+
+        sabe = en_juego & (generador.random(cantidad) < precision)
+        no_sabe = en_juego & ~sabe
+
+        # Comodines, uno por pregunta como máximo.
+        usa_x2 = sabe & x2_disponible
+        x2_disponible &= ~usa_x2
+        x2_activo |= usa_x2
+        usa_bomba = no_sabe & bomba_disponible
+        bomba_disponible &= ~usa_bomba
+        usa_doble_chance = no_sabe & ~usa_bomba & doble_chance_disponible
+        doble_chance_disponible &= ~usa_doble_chance
+        usa_pasar = no_sabe & ~usa_bomba & ~usa_doble_chance & pasar_disponible
+        pasar_disponible &= ~usa_pasar
+
+        probabilidad = np.where(sabe, 1.0,
+                                np.where(usa_bomba, PROBABILIDAD_ADIVINAR_BOMBA,
+                                         np.where(usa_doble_chance, PROBABILIDAD_ADIVINAR_DOBLE_CHANCE,
+                                                  PROBABILIDAD_ADIVINAR)))
+        responde = en_juego & ~usa_pasar
+        acerto = responde & (generador.random(cantidad) < probabilidad)
+        erro = responde & ~acerto
+
+        # Aciertos: racha, vida extra y bonus de tiempo, y puntos (dobles con X2).
+        racha += acerto
+        completa_racha = acerto & (racha == racha_vida_extra)
+        vidas_restantes += completa_racha & (vidas_restantes < max_vidas)
+        tiempo_restante += np.where(completa_racha, bonus_tiempo, 0)
+        racha[completa_racha] = 0
+        puntuacion += np.where(acerto, np.where(x2_activo, 2 * acierto, acierto), 0)
+        x2_activo &= ~acerto
+
+        # Errores: se pierde una vida y se restan puntos si la puntuación es positiva.
+        # Como en el juego, un error no reinicia la racha.
+        vidas_restantes -= erro
+        puntuacion -= np.where(erro & (puntuacion > 0), fallo, 0)
+        en_juego &= vidas_restantes > 0
+
+    # Las que siguen en juego después del bucle llegaron a max_preguntas.
+    if devolver_truncadas:
+        return puntuacion, en_juego
+    return puntuacion
+
+
+def resumir_puntajes(puntajes: "np.ndarray", truncadas: "np.ndarray | None" = None) -> dict:
+    """
+    Resume una distribución de puntajes.
+
+    Args:
+        puntajes (np.ndarray): Puntajes finales (ver simular_partidas).
+        truncadas (np.ndarray | None): Qué partidas se cortaron por max_preguntas (ver simular_partidas).
+
+    Returns:
+        dict: Media, desvío, mínimo, máximo y percentiles 10, 25, 50, 75, 90 y 99. Si se pasa truncadas,
+              también 'truncadas', la cantidad de partidas cortadas.
+    """
+    _verificar_numpy()
+    percentiles = np.percentile(puntajes, [10, 25, 50, 75, 90, 99])
+    resumen = {
+        "partidas": int(puntajes.size),
+        "media": float(puntajes.mean()),
+        "desvio": float(puntajes.std()),
+        "minimo": int(puntajes.min()),
+        "maximo": int(puntajes.max()),
+        "p10": float(percentiles[0]),
+        "p25": float(percentiles[1]),
+        "p50": float(percentiles[2]),
+        "p75": float(percentiles[3]),
+        "p90": float(percentiles[4]),
+        "p99": float(percentiles[5])
+    }
+    if truncadas is not None:
+        resumen["truncadas"] = int(np.count_nonzero(truncadas))
+    return resumen
+
+
+def histograma_puntajes(puntajes: "np.ndarray", ancho_intervalo: int = PUNTUACION_ACIERTO) -> list:
+    """
+    Cuenta cuántas partidas terminaron en cada intervalo de puntaje.
+
+    Args:
+        puntajes (np.ndarray): Puntajes finales (ver simular_partidas).
+        ancho_intervalo (int): Ancho de cada intervalo, en puntos.
+
+    Returns:
+        list: Lista de tuplas (inicio del intervalo, cantidad de partidas), sin los intervalos vacíos.
+    """
+    _verificar_numpy()
+    intervalos = np.floor_divide(puntajes, ancho_intervalo)
+    valores, cantidades = np.unique(intervalos, return_counts=True)
+    return [(int(valor) * ancho_intervalo, int(cantidad)) for valor, cantidad in zip(valores, cantidades)]
@@ -0,0 +1,239 @@
+"""
+Módulo del modo sin ventana (--headless).
+
+Permite ejecutar las pantallas reales del juego en máquinas sin pantalla ni placa de sonido, usando los
+controladores "dummy" de SDL, sin límite de fotogramas por segundo y con eventos simulados (aleatorios
+o leídos de un guion), para medir cuántos fotogramas por segundo se pueden dibujar.
+
+Como los fotogramas no se limitan, el tiempo del juego (los segundos de la partida, la pausa que muestra
+la respuesta elegida, el parpadeo del cursor) no puede seguir al reloj real: sigue a un reloj virtual que
+avanza 1000/FPS ms por fotograma (ver RelojVirtual), así que una partida simulada dura los mismos
+fotogramas que una partida real, sin importar lo rápido que se dibujen.
+
+Este módulo se importa antes de inicializar Pygame, así que no importa ningún otro módulo del juego.
+"""
+
+import os       # Para elegir los controladores de SDL mediante variables de entorno.
+import json     # Formato del guion de eventos.
+import random   # Para generar eventos aleatorios reproducibles.
+import shutil   # Para copiar los rankings a un directorio temporal.
+import tempfile # Directorio temporal donde se guardan los rankings de las partidas simuladas.
+import pygame
+
+# Teclas que se pueden simular, por nombre (el nombre que se usa en el guion).
+TECLAS_SIMULADAS = {
+    "RETURN": pygame.K_RETURN,
+    "BACKSPACE": pygame.K_BACKSPACE,
+    "UP": pygame.K_UP,
+    "DOWN": pygame.K_DOWN,
+    "PAGEUP": pygame.K_PAGEUP,
+    "PAGEDOWN": pygame.K_PAGEDOWN,
+    "HOME": pygame.K_HOME,
+    "END": pygame.K_END
+}
+
+# Centro de los botones y cartas de cada pantalla (ver menu.py, juego.py, configuracion.py y rankings.py), para
+# que los clics aleatorios lleguen a todas las pantallas.
+OBJETIVOS_CLIC = {
+    "menu": [(400, 190), (400, 285), (400, 380), (400, 475)], # Jugar, Configuración, Puntuaciones y Salir.
+    "juego": [(32, 47), (92, 47), (152, 47), (212, 47),       # Comodines X2, Pasar, Doble Chance y Bomba.
+              (270, 355), (270, 480), (565, 355), (565, 480)], # Cartas de las respuestas.
+    "configuraciones": [(750, 230), (50, 230), (750, 50), (40, 40)], # Subir, bajar, silenciar y volver.
+    "rankings": [(40, 40)] # Volver.
+}
+# En "terminado" no hay botones: se avanza escribiendo el nombre y con Enter (ver terminado.py).
+OBJETIVOS_TECLA = {
+    "terminado": list("abcdefghij") + ["BACKSPACE", "RETURN"]
+}
+PROBABILIDAD_EN_OBJETIVO = 0.75 # El resto de los clics caen en cualquier parte de la ventana.
+
+
+def preparar_entorno_sin_ventana() -> None:
+    """
+    Elige los controladores "dummy" de video y audio de SDL. Debe llamarse antes de pygame.init().
+    """
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+
+def redirigir_rankings(ruta_rankings: str, ruta_sqlite: str) -> tuple:
+    """
+    Copia los rankings reales a un directorio temporal, para que las partidas simuladas guarden ahí los suyos.
+    Las rutas devueltas se pasan al abrir el almacén de rankings (ver rankings.abrir_almacen_rankings).
+
+    Args:
+        ruta_rankings (str): Ruta de la instantánea de rankings (RUTA_RANKINGS).
+        ruta_sqlite (str): Ruta de la base de rankings (RUTA_RANKINGS_SQLITE).
+
+    Returns:
+        tuple: (directorio temporal, que se puede borrar al terminar; ruta de la copia de la instantánea;
+               ruta de la copia de la base).
+    """
+    directorio = tempfile.mkdtemp(prefix="argentest-rankings-")
+    # Además de la instantánea y de la base, se copian los registros de cambios todavía sin compactar
+    # ("rankings.<g>.jsonl", ver registro_rankings.py) y el registro WAL de la base ("rankings.db-wal" y "-shm"):
+    # los rankings que solo están ahí también forman parte de los rankings reales.
+    prefijo_instantanea = os.path.splitext(os.path.basename(ruta_rankings))[0] + "."
+    prefijo_base = os.path.basename(ruta_sqlite)
+    for ruta, prefijo in ((ruta_rankings, prefijo_instantanea), (ruta_sqlite, prefijo_base)):
+        directorio_original = os.path.dirname(ruta) or "."
+        try:
+            nombres = os.listdir(directorio_original)
+        except OSError: # Todavía no hay rankings guardados.
+            continue
+        for nombre in nombres:
+            if nombre.startswith(prefijo) and not nombre.endswith(".tmp"): # Los .tmp son escrituras a medio hacer.
+                shutil.copy(os.path.join(directorio_original, nombre), directorio)
+    return (directorio, os.path.join(directorio, os.path.basename(ruta_rankings)),
+            os.path.join(directorio, os.path.basename(ruta_sqlite)))
+
+
+class RelojVirtual:
+    """
+    Reloj del modo sin ventana: avanza un paso fijo de 1000/fps milisegundos por fotograma, sin importar
+    cuánto se tarde en dibujarlo. Reemplaza a pygame.time.get_ticks en el planificador (ver planificador.usar_reloj).
+    """
+
+    def __init__(self, fps: int):
+        """
+        Args:
+            fps (int): Fotogramas por segundo del juego con ventana (FPS).
+        """
+        self._paso_ms = 1000 / fps
+        self._ms = 0.0
+
+    def avanzar(self) -> None:
+        """
+        Avanza el reloj un fotograma. Se llama al empezar cada fotograma.
+        """
+        self._ms += self._paso_ms
+
+    def ticks(self) -> int:
+        """
+        Devuelve los milisegundos transcurridos, como pygame.time.get_ticks.
+        """
+        return int(self._ms)
+
+
+def _crear_evento(accion: dict) -> pygame.event.Event:
+    """
+    Crea un evento de Pygame a partir de una acción del guion o del generador aleatorio.
+
+    Args:
+        accion (dict): {"tipo": "click", "pos": [x, y]}, {"tipo": "tecla", "tecla": "RETURN" o una letra}
+                       o {"tipo": "rueda", "y": desplazamiento}.
+
+    Returns:
+        pygame.event.Event: El evento equivalente.
+    """
+    if accion["tipo"] == "click":
+        return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=tuple(accion["pos"]), button=1)
+    if accion["tipo"] == "rueda":
+        return pygame.event.Event(pygame.MOUSEWHEEL, x=0, y=accion["y"], flipped=False)
+    tecla = accion["tecla"]
+    if tecla in TECLAS_SIMULADAS:
+        return pygame.event.Event(pygame.KEYDOWN, key=TECLAS_SIMULADAS[tecla], mod=0, unicode="")
+    return pygame.event.Event(pygame.KEYDOWN, key=ord(tecla.lower()), mod=0, unicode=tecla)
+
+
+class EventosSimulados:
+    """
+    Fuente de eventos para el modo sin ventana: reproduce un guion o, si no hay guion, genera eventos aleatorios.
+
+    El guion es un archivo JSON Lines con una acción por línea y el fotograma en que ocurre, por ejemplo:
+        {"fotograma": 10, "tipo": "click", "pos": [400, 150]}
+        {"fotograma": 50, "tipo": "tecla", "tecla": "RETURN"}
+    """
+
+    def __init__(self, semilla: int | None = None, ruta_guion: str | None = None):
+        """
+        Args:
+            semilla (int | None): Semilla de los eventos aleatorios (y de random), para repetir una ejecución.
+            ruta_guion (str | None): Archivo con el guion de eventos, o None para eventos aleatorios.
+        """
+        self._aleatorio = random.Random(semilla)
+        if semilla is not None:
+            random.seed(semilla) # El juego también usa random (orden de preguntas, comodín Bomba).
+
+        self._guion = None
+        if ruta_guion is not None:
+            self._guion = {}
+            with open(ruta_guion, "r", encoding="utf-8") as archivo:
+                for linea in archivo:
+                    if linea.strip() != "":
+                        accion = json.loads(linea)
+                        self._guion.setdefault(accion["fotograma"], []).append(accion)
+
+    def eventos(self, fotograma: int, pantalla: str | None = None) -> list:
+        """
+        Devuelve los eventos simulados de un fotograma.
+
+        Args:
+            fotograma (int): Número de fotograma (desde 0).
+            pantalla (str | None): Pantalla que se está mostrando. Los clics aleatorios apuntan, la mayoría
+                                   de las veces, a sus botones (ver OBJETIVOS_CLIC y OBJETIVOS_TECLA).
+
+        Returns:
+            list: Lista de eventos de Pygame.
+        """
+        if self._guion is not None:
+            return [_crear_evento(accion) for accion in self._guion.get(fotograma, [])]
+
+        aleatorio = self._aleatorio
+        sorteo = aleatorio.random()
+        if sorteo < 0.08: # Un clic (o una tecla) sobre un objetivo de la pantalla, o un clic en cualquier parte.
+            en_objetivo = aleatorio.random() < PROBABILIDAD_EN_OBJETIVO
+            if en_objetivo and pantalla in OBJETIVOS_CLIC:
+                accion = {"tipo": "click", "pos": aleatorio.choice(OBJETIVOS_CLIC[pantalla])}
+            elif en_objetivo and pantalla in OBJETIVOS_TECLA:
+                accion = {"tipo": "tecla", "tecla": aleatorio.choice(OBJETIVOS_TECLA[pantalla])}
+            else:
+                ancho, alto = pygame.display.get_surface().get_size()
+                accion = {"tipo": "click", "pos": (aleatorio.randrange(ancho), aleatorio.randrange(alto))}
+        elif sorteo < 0.12: # Una tecla: letras para el nombre, Enter, Borrar o desplazamiento.
+            accion = {"tipo": "tecla", "tecla": aleatorio.choice(list(TECLAS_SIMULADAS) + list("abcdefghij"))}
+        elif sorteo < 0.14: # Un movimiento de la rueda del mouse.
+            accion = {"tipo": "rueda", "y": aleatorio.choice((-3, -1, 1, 3))}
+        else:
+            return []
+        return [_crear_evento(accion)]
+
+
+def percentil(valores_ordenados: list, porcentaje: float) -> float:
+    """
+    Calcula un percentil (método del rango más cercano) de una lista ya ordenada.
+
+    Args:
+        valores_ordenados (list): Valores ordenados de menor a mayor (no vacía).
+        porcentaje (float): Percentil a calcular, entre 0 y 100.
+
+    Returns:
+        float: El valor del percentil.
+    """
+    posicion = max(0, min(len(valores_ordenados) - 1, round(porcentaje / 100 * len(valores_ordenados)) - 1))
+    return valores_ordenados[posicion]
+
+
+def informe_fotogramas(tiempos_por_pantalla: dict, duracion_total: float, redibujado_completo: bool) -> str:
+    """
+    Arma el informe de rendimiento del modo sin ventana.
+
+    Args:
+        tiempos_por_pantalla (dict): {pantalla: lista de duraciones de cada fotograma, en segundos}.
+        duracion_total (float): Duración total de la ejecución, en segundos.
+        redibujado_completo (bool): True si cada fotograma se dibujó completo; False si solo se dibujaron
+                                    las regiones que cambiaron (los fotogramas sin cambios no dibujan nada).
+
+    Returns:
+        str: Texto con los fotogramas por segundo y los percentiles de duración de fotograma por pantalla.
+    """
+    cantidad = sum(len(tiempos) for tiempos in tiempos_por_pantalla.values())
+    fps = cantidad / duracion_total if duracion_total > 0 else 0.0
+    dibujado = "pantalla completa en cada fotograma" if redibujado_completo else "solo las regiones que cambian"
+    lineas = [f"Fotogramas: {cantidad} en {duracion_total:.2f} s ({fps:.1f} FPS), dibujando {dibujado}",
+              f"{'pantalla':<16}{'fotogramas':>11}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}{'max ms':>9}"]
+    for pantalla, tiempos in tiempos_por_pantalla.items():
+        ordenados = sorted(tiempo * 1000 for tiempo in tiempos)
+        lineas.append(f"{pantalla:<16}{len(ordenados):>11}{percentil(ordenados, 50):>9.2f}{percentil(ordenados, 90):>9.2f}"
+                      f"{percentil(ordenados, 99):>9.2f}{ordenados[-1]:>9.2f}")
+    return "\n".join(lineas)
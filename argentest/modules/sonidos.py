@@ -0,0 +1,125 @@
+"""
+Módulo de sonidos del juego.
+
+Carga los efectos de sonido y los reproduce por un bus propio. Está separado de constantes.py para que
+las constantes puedan importarse sin Pygame (por ejemplo, desde el motor de reglas, ver motor_juego.py).
+Requiere que pygame.mixer ya esté inicializado, con un buffer chico (TAMAÑO_BUFFER_AUDIO o --buffer-audio, ver main.py).
+
+Los canales del mezclador se reparten así:
+    - Los primeros, uno por pista de PISTAS_MUSICA, son de la música (ver musica.py).
+    - Los siguientes CANALES_EFECTOS son de los efectos: reproducir_efecto los usa por turnos, así que un
+      efecto nunca tiene que buscar un canal libre ni compite con la música.
+Todos quedan reservados: Pygame no los usa para los sonidos que se reproducen con Sound.play().
+"""
+
+import time # Reloj de alta resolución para medir_latencia.
+import pygame
+from .constantes import * # Importa todas las constantes, incluyendo PISTAS_MUSICA y CANALES_EFECTOS.
+
+# --- SONIDO ---
+# Carga los archivos de sonido para efectos del juego.
+# Los volúmenes iniciales se establecen aquí para tener un punto de partida, aunque serán ajustados dinámicamente desde la pantalla de configuración.
+CLICK_SONIDO = pygame.mixer.Sound("assets/sounds/click.mp3")
+CLICK_SONIDO.set_volume(0.2) # Volumen inicial del sonido de click (20% de su propio volumen).
+ERROR_SONIDO = pygame.mixer.Sound("assets/sounds/error.mp3")
+ERROR_SONIDO.set_volume(0.02) # Volumen inicial del sonido de error (2% de su propio volumen).
+ACIERTO_SONIDO = pygame.mixer.Sound("assets/sounds/acierto.mp3")
+ACIERTO_SONIDO.set_volume(0.02) # Volumen inicial del sonido de acierto (2% de su propio volumen).
+
+# Grupo de los efectos, cuyo volumen se ajusta de una sola vez (ver ajustar_volumen_efectos).
+EFECTOS = (CLICK_SONIDO, ERROR_SONIDO, ACIERTO_SONIDO)
+
+# --- CANALES ---
+_primer_canal_efectos = len(PISTAS_MUSICA) # Los canales anteriores son de la música.
+pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), _primer_canal_efectos + CANALES_EFECTOS))
+pygame.mixer.set_reserved(_primer_canal_efectos + CANALES_EFECTOS)
+_canales_efectos = [pygame.mixer.Channel(_primer_canal_efectos + i) for i in range(CANALES_EFECTOS)]
+_proximo_canal = 0 # Turno del próximo canal de efectos.
+
+
+def reproducir_efecto(sonido: pygame.mixer.Sound) -> None:
+    """
+    Reproduce un efecto de sonido en el próximo canal de efectos libre. Si todos están ocupados,
+    se usa el que lleva más tiempo sonando (los canales se recorren por turnos).
+
+    Args:
+        sonido (pygame.mixer.Sound): El efecto (CLICK_SONIDO, ERROR_SONIDO o ACIERTO_SONIDO).
+    """
+    global _proximo_canal
+    for _ in range(CANALES_EFECTOS):
+        canal = _canales_efectos[_proximo_canal]
+        _proximo_canal = (_proximo_canal + 1) % CANALES_EFECTOS
+        if not canal.get_busy():
+            break
+    canal.play(sonido) # Si ninguno estaba libre, 'canal' es el del turno más antiguo y se interrumpe.
+
+
+def ajustar_volumen_efectos(volumen: float) -> None:
+    """
+    Aplica el mismo volumen a todos los efectos de sonido.
+
+    Args:
+        volumen (float): Volumen en la escala de Pygame (0.0 a 1.0).
+    """
+    for sonido in EFECTOS:
+        sonido.set_volume(volumen)
+
+
+def medir_latencia(tamaño_buffer: int, repeticiones: int = 50, espera_maxima_ms: float = 500) -> dict:
+    """
+    Mide la demora entre llamar a play() y que el sonido empiece a salir.
+
+    Se reproduce un sonido mudo muy corto en un canal de efectos y se espera el evento de fin del canal,
+    que el mezclador envía en el primer bloque de audio que lo incluye. La salida empieza cuando ese bloque
+    termina de enviarse al dispositivo, así que a la espera se le suma la duración de un bloque
+    (tamaño_buffer muestras). La demora propia del dispositivo o del sistema operativo no se mide.
+
+    Si el evento de fin no llega en espera_maxima_ms (sin dispositivo de audio, o con el mezclador trabado),
+    la medición se descarta y se cuenta como perdida, en lugar de esperar para siempre.
+
+    Args:
+        tamaño_buffer (int): Muestras por bloque con que se inicializó el mezclador (ver pygame.mixer.pre_init).
+        repeticiones (int): Cantidad de mediciones.
+        espera_maxima_ms (float): Cuánto se espera, como máximo, el evento de fin de cada medición.
+
+    Returns:
+        dict: Frecuencia y buffer del mezclador, la mediana y el máximo (en milisegundos) de la demora estimada
+              (None si se perdieron todas las mediciones), y cuántas mediciones se hicieron y cuántas se perdieron.
+    """
+    frecuencia, formato, canales = pygame.mixer.get_init()
+    bytes_por_muestra = abs(formato) // 8 * canales
+    mudo = pygame.mixer.Sound(buffer=bytes(bytes_por_muestra * 16)) # 16 muestras en silencio.
+    duracion_bloque_ms = tamaño_buffer / frecuencia * 1000
+
+    canal = _canales_efectos[0]
+    evento_fin = pygame.event.custom_type()
+    canal.set_endevent(evento_fin)
+    demoras = []
+    perdidas = 0
+    for _ in range(repeticiones):
+        pygame.event.get(evento_fin) # Descarta un evento de fin que haya quedado pendiente.
+        inicio = time.perf_counter()
+        limite = inicio + espera_maxima_ms / 1000
+        canal.play(mudo)
+        llego = False
+        while not llego and time.perf_counter() < limite:
+            llego = bool(pygame.event.get(evento_fin))
+            if not llego:
+                time.sleep(0.0002)
+        if not llego: # El evento no llegó a tiempo: la medición se pierde.
+            canal.stop()
+            perdidas += 1
+            continue
+        demoras.append((time.perf_counter() - inicio) * 1000 + duracion_bloque_ms)
+        time.sleep(0.003) # Para no medir siempre en el mismo punto del bloque.
+    canal.set_endevent()
+
+    demoras.sort()
+    return {
+        "frecuencia": frecuencia,
+        "buffer": tamaño_buffer,
+        "mediana_ms": demoras[len(demoras) // 2] if demoras else None,
+        "maximo_ms": demoras[-1] if demoras else None,
+        "repeticiones": repeticiones,
+        "perdidas": perdidas
+    }
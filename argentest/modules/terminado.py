@@ -10,6 +10,9 @@ import pygame
 from .constantes import * # Importa todas las constantes, como colores, tamaños, etc.
 from .funciones import mostrar_texto # Importa la función utilitaria para dibujar texto.
 from .rankings import guardar_ranking # Importa la función para guardar el puntaje en el ranking.
+from .regiones import redibujado_completo, marcar_region # Para actualizar solo las regiones que cambian.
+from .recursos import cargar_imagen # Carga de imágenes compartidas y ya convertidas.
+from . import planificador # Para el parpadeo del cursor.
 
 # --- FUENTES Y CUADRO DE TEXTO ---
 # Fuente para el texto general de la pantalla de terminado (ej. puntuación).
@@ -21,19 +24,37 @@ cuadro["superficie"] = pygame.Surface(CUADRO_TEXTO) # Crea una superficie con el
 cuadro["rectangulo"] = cuadro["superficie"].get_rect() # Obtiene el rectángulo para posicionamiento.
 # El color de relleno inicial de 'cuadro' será establecido en la función mostrar_fin_juego.
 
-# --- IMÁGENES GLOBALES (Cargadas SIN conversión inicial) ---
-# Las imágenes se cargan al inicio del módulo
-game_over_image_base = pygame.image.load("assets/images/game_over.png")
-
+# --- IMÁGENES GLOBALES ---
+# La imagen de Game Over se pide al módulo de recursos recién al entrar a esta pantalla.
 game_over_image_converted = None
 
-# Bandera de control para saber si las imágenes ya fueron convertidas y escaladas.
+# Bandera de control para saber si las imágenes ya fueron obtenidas.
 # Se usa para que este proceso solo ocurra una vez por cada vez que se entra a esta pantalla.
 _terminado_images_loaded = False 
 
 # Variables de estado para el campo de entrada de nombre.
 nombre = "" # Almacena el nombre que el jugador está escribiendo.
 bandera_mayuscula = False # Controla si el texto debe ser mayúscula (por Shift o Caps Lock).
+texto_mostrado_anterior = None # Texto (nombre y cursor) dibujado en el fotograma anterior dentro del cuadro.
+cursor_visible = True # El cursor del cuadro de texto parpadea: visible medio segundo, oculto medio segundo.
+
+
+def al_entrar() -> None:
+    """
+    Programa el parpadeo del cursor cada vez que se entra a la pantalla (ver pantallas.cambiar_pantalla).
+    Al ser una tarea del planificador, el bucle principal puede esperar en reposo hasta el próximo parpadeo.
+    """
+    global cursor_visible
+    cursor_visible = True
+    planificador.programar(500, alternar_cursor, repetir_cada_ms=500, dueño="terminado")
+
+
+def alternar_cursor() -> None:
+    """
+    Tarea del planificador: muestra u oculta el cursor.
+    """
+    global cursor_visible
+    cursor_visible = not cursor_visible
 
 
 def verificar_texto(caracter: str) -> bool:
@@ -68,19 +89,17 @@ def mostrar_fin_juego(pantalla: pygame.Surface, cola_eventos: list[pygame.event.
     global bandera_mayuscula
     global game_over_image_converted # Necesario para acceder a la imagen global optimizada
     global _terminado_images_loaded # Necesario para controlar la carga de imágenes
+    global texto_mostrado_anterior
 
     retorno = "terminado" # Estado por defecto: permanece en la pantalla de terminado.
 
-    # --- Cargar y convertir imágenes solo la primera vez que se entra a esta pantalla ---
-    # Esto optimiza el rendimiento al evitar recargar y re-escalar en cada fotograma.
+    # --- Obtener las imágenes solo la primera vez que se entra a esta pantalla ---
+    # El módulo de recursos decodifica, escala y convierte la imagen una sola vez en todo el juego.
     if not _terminado_images_loaded:
-        # Convierte la imagen base de Game Over a un formato optimizado para la pantalla, manteniendo la transparencia.
-        game_over_image_original_alpha = game_over_image_base.convert_alpha()
-
-        # Escala la imagen de Game Over a un tamaño fijo (500x200 píxeles).
-        game_over_image_converted = pygame.transform.scale(game_over_image_original_alpha, (500, 200)) 
+        # Imagen de Game Over escalada a un tamaño fijo (500x200 píxeles) y convertida al formato de la pantalla.
+        game_over_image_converted = cargar_imagen("assets/images/game_over.png", (500, 200))
         
-        _terminado_images_loaded = True # Marca que las imágenes ya se cargaron y convirtieron.
+        _terminado_images_loaded = True # Marca que las imágenes ya se obtuvieron.
 
     # --- FIN Cargar y convertir imágenes ---
 
@@ -131,29 +150,35 @@ def mostrar_fin_juego(pantalla: pygame.Surface, cola_eventos: list[pygame.event.
 
     # --- Dibujado de Elementos en Pantalla ---
 
-    # Rellena toda la pantalla de fondo con color negro.
-    pantalla.fill(COLOR_NEGRO) 
-
-    # Dibuja la imagen de "Game Over".
-    pantalla.blit(game_over_image_converted, ((VENTANA[0] - game_over_image_converted.get_width()) // 2, 50)) 
-
-    # Rellena la superficie del cuadro de texto con el color gris oscuro en cada fotograma.
-    cuadro["superficie"].fill(COLOR_GRIS_OSCURO) 
-
     # Lógica para el efecto de cursor parpadeante en el campo de nombre.
-    if pygame.time.get_ticks() % 1000 < 500:
+    if cursor_visible:
         texto_mostrado = nombre + "|" # Muestra el cursor | cada 0.5 segundos.
     else:
         texto_mostrado = nombre # Oculta el cursor cada 0.5 segundos.
 
-    # Dibuja el texto del nombre ingresado en el cuadro.
-    mostrar_texto(cuadro["superficie"], texto_mostrado, (10, 0), fuente, COLOR_BLANCO)
+    pantalla_completa = redibujado_completo()
+    if pantalla_completa:
+        # Rellena toda la pantalla de fondo con color negro.
+        pantalla.fill(COLOR_NEGRO) 
+
+        # Dibuja la imagen de "Game Over".
+        pantalla.blit(game_over_image_converted, ((VENTANA[0] - game_over_image_converted.get_width()) // 2, 50)) 
+
+        # Muestra la puntuación final obtenida por el jugador.
+        mostrar_texto(pantalla, f"Usted obtuvo: {datos_juego['puntuacion']} puntos", (250, 200), fuente, COLOR_BLANCO)
+
+    # El cuadro de texto solo se vuelve a dibujar cuando cambia el nombre o parpadea el cursor.
+    if pantalla_completa or texto_mostrado != texto_mostrado_anterior:
+        # Rellena la superficie del cuadro de texto con el color gris oscuro.
+        cuadro["superficie"].fill(COLOR_GRIS_OSCURO) 
+
+        # Dibuja el texto del nombre ingresado en el cuadro.
+        mostrar_texto(cuadro["superficie"], texto_mostrado, (10, 0), fuente, COLOR_BLANCO)
 
-    # Posiciona y dibuja el cuadro de entrada de texto en la pantalla.
-    pos_x = (VENTANA[0] - CUADRO_TEXTO[0]) // 2 # Centra el cuadro horizontalmente.
-    cuadro["rectangulo"] = pantalla.blit(cuadro["superficie"], (pos_x, 260)) # Posiciona el cuadro en Y=260.
-    
-    # Muestra la puntuación final obtenida por el jugador.
-    mostrar_texto(pantalla, f"Usted obtuvo: {datos_juego['puntuacion']} puntos", (250, 200), fuente, COLOR_BLANCO)
+        # Posiciona y dibuja el cuadro de entrada de texto en la pantalla.
+        pos_x = (VENTANA[0] - CUADRO_TEXTO[0]) // 2 # Centra el cuadro horizontalmente.
+        cuadro["rectangulo"] = pantalla.blit(cuadro["superficie"], (pos_x, 260)) # Posiciona el cuadro en Y=260.
+        marcar_region(cuadro["rectangulo"])
+        texto_mostrado_anterior = texto_mostrado
 
     return retorno # Devuelve el estado actual de la ventana.
\ No newline at end of file